@@ -2,9 +2,9 @@
 # ---------------------------------------------------------------------------
 # Calculate topographic properties
 # Author: Timm Nawrocki
-# Last Updated: 2022-03-22
+# Last Updated: 2026-10-17
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
-# Description: "Calculate topographic properties" calculates integer versions of ten topographic indices for each grid using elevation float rasters.
+# Description: "Calculate topographic properties" calculates integer versions of topographic indices and curvatures for each grid using elevation float rasters.
 # ---------------------------------------------------------------------------
 
 # Import packages
@@ -40,10 +40,15 @@ roughness_output = os.path.join(output_folder, 'Roughness.tif')
 surfacearea_output = os.path.join(output_folder, 'SurfaceArea.tif')
 surfacerelief_output = os.path.join(output_folder, 'SurfaceRelief.tif')
 wetness_output = os.path.join(output_folder, 'Wetness.tif')
+profile_output = os.path.join(output_folder, 'ProfileCurvature.tif')
+plan_output = os.path.join(output_folder, 'PlanCurvature.tif')
+mean_output = os.path.join(output_folder, 'MeanCurvature.tif')
 
 # Create key word arguments
 kwargs_topography = {'z_unit': 'METER',
                      'position_width': 5000,
+                     'engine': 'numpy',
+                     'flow_engine': 'arcpy',
                      'input_array': [alphabet_raster, elevation_float],
                      'output_array': [elevation_integer,
                                       slope_integer,
@@ -55,7 +60,10 @@ kwargs_topography = {'z_unit': 'METER',
                                       roughness_output,
                                       surfacearea_output,
                                       surfacerelief_output,
-                                      wetness_output]
+                                      wetness_output,
+                                      profile_output,
+                                      plan_output,
+                                      mean_output]
                      }
 
 # Process the topographic calculations
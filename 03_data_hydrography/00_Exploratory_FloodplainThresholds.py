@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Explore floodplain thresholds
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
+# Description: "Explore floodplain thresholds" creates preliminary floodplain masks and a table of floodplain area for every combination of river and stream thresholds so that the thresholds of the post-processing script can be selected.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import os
+from package_GeospatialProcessing import arcpy_geoprocessing
+from package_GeospatialProcessing import merge_floodplains
+
+# Set root directory
+drive = 'N:/'
+root_folder = 'ACCS_Work'
+
+# Define folder structure
+project_folder = os.path.join(drive, root_folder, 'Projects/WildlifeEcology/Moose_AlphabetHills/Data')
+hydrography_folder = os.path.join(project_folder, 'Data_Input/hydrography')
+
+# Define geodatabases
+work_geodatabase = os.path.join(project_folder, 'AlphabetHillsBrowseBiomass.gdb')
+
+# Define input datasets
+alphabet_raster = os.path.join(project_folder, 'Data_Input/Alphabet_StudyArea.tif')
+river_line = os.path.join(work_geodatabase, 'Alphabet_Rivers_DEM_Corrected')
+stream_line = os.path.join(work_geodatabase, 'Alphabet_Streams_DEM_Corrected')
+river_position = os.path.join(hydrography_folder, 'River_Position.tif')
+stream_position = os.path.join(hydrography_folder, 'Stream_Position.tif')
+
+# Define output datasets
+sweep_raster = os.path.join(hydrography_folder, 'Floodplain_Sweep.tif')
+sweep_table = os.path.join(hydrography_folder, 'Floodplain_Sweep.csv')
+
+#### SWEEP FLOODPLAIN THRESHOLDS
+
+# Create key word arguments
+kwargs_sweep = {'thresholds': [[100, 200, 400, 800], [4, 9, 16, 25]],
+                'input_array': [alphabet_raster, river_line, stream_line, river_position, stream_position],
+                'output_array': [sweep_raster, sweep_table],
+                'mode': 'sweep'
+                }
+
+# Create floodplain masks for threshold combinations
+if os.path.exists(sweep_table) == 0:
+    print('Calculate floodplain threshold sweep...')
+    arcpy_geoprocessing(merge_floodplains, check_output=False, **kwargs_sweep)
+    print('----------')
+else:
+    print('Floodplain threshold sweep already exists.')
+    print('----------')
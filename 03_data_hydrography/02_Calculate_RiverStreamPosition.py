@@ -2,7 +2,7 @@
 # ---------------------------------------------------------------------------
 # Calculate river and stream position
 # Author: Timm Nawrocki
-# Last Updated: 2022-03-22
+# Last Updated: 2026-10-17
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
 # Description: "Calculate river and stream position" calculates river and stream position from a river feature class, stream feature class, and float elevation raster.
 # ---------------------------------------------------------------------------
@@ -35,38 +35,21 @@ stream_feature = os.path.join(work_geodatabase, 'Alphabet_Streams_DEM_Corrected'
 river_raster = os.path.join(hydrography_folder, 'River_Position.tif')
 stream_raster = os.path.join(hydrography_folder, 'Stream_Position.tif')
 
-#### CALCULATE RIVER POSITION
+#### CALCULATE RIVER AND STREAM POSITION
 
 # Create key word arguments
-kwargs_river = {'distance': '2500 METERS',
-                'work_geodatabase': work_geodatabase,
-                'input_array': [alphabet_raster, elevation_raster, river_feature],
-                'output_array': [river_raster]
-                }
-
-# Process the river flowlines
-if arcpy.Exists(river_raster) == 0:
-    print(f'Processing river flowlines...')
-    arcpy_geoprocessing(generate_hydrographic_position, **kwargs_river)
-    print('----------')
-else:
-    print('River position already exists.')
-    print('----------')
-
-#### CALCULATE STREAM POSITION
-
-# Create key word arguments
-kwargs_stream = {'distance': '250 METERS',
-                 'work_geodatabase': work_geodatabase,
-                 'input_array': [alphabet_raster, elevation_raster, stream_feature],
-                 'output_array': [stream_raster]
-                 }
-
-# Process the river flowlines
-if arcpy.Exists(stream_raster) == 0:
-    print(f'Processing stream flowlines...')
-    arcpy_geoprocessing(generate_hydrographic_position, **kwargs_stream)
+kwargs_position = {'distance': ['2500 METERS', '250 METERS'],
+                   'engine': 'numpy',
+                   'work_geodatabase': work_geodatabase,
+                   'input_array': [alphabet_raster, elevation_raster, river_feature, stream_feature],
+                   'output_array': [river_raster, stream_raster]
+                   }
+
+# Process the river and stream flowlines
+if arcpy.Exists(river_raster) == 0 or arcpy.Exists(stream_raster) == 0:
+    print(f'Processing river and stream flowlines...')
+    arcpy_geoprocessing(generate_hydrographic_position, **kwargs_position)
     print('----------')
 else:
-    print('Stream position already exists.')
+    print('River and stream position already exist.')
     print('----------')
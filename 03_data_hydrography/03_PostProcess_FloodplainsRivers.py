@@ -2,7 +2,7 @@
 # ---------------------------------------------------------------------------
 # Post-process floodplains and rivers
 # Author: Timm Nawrocki
-# Last Updated: 2022-03-22
+# Last Updated: 2026-10-17
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
 # Description: "Post-process floodplains and rivers" creates a set of approximate floodplain and river boundaries from flowline position.
 # ---------------------------------------------------------------------------
@@ -39,7 +39,7 @@ river_polygon = os.path.join(work_geodatabase, 'Alphabet_River_Polygon')
 
 #### MERGE FLOODPLAINS FROM RIVERS AND STREAMS
 
-# Create key word arguments
+# Create key word arguments with thresholds selected from 00_Exploratory_FloodplainThresholds.py
 kwargs_floodplain = {'thresholds': [400, 9],
                      'area_limit': 2000000,
                      'work_geodatabase': work_geodatabase,
@@ -2,16 +2,17 @@
 # ---------------------------------------------------------------------------
 # Calculate zonal means
 # Author: Timm Nawrocki
-# Last Updated: 2022-03-29
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
-# Description: "Calculate zonal means" calculates zonal means of input datasets to segments defined in a raster.
+# Last Updated: 2026-10-17
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation with rasterio.
+# Description: "Calculate zonal means" calculates zonal means of input datasets to segments defined in a raster as zonal rasters or as a table of segments by inputs.
 # ---------------------------------------------------------------------------
 
 # Import packages
 import arcpy
+import csv
 import os
 from package_GeospatialProcessing import arcpy_geoprocessing
-from package_GeospatialProcessing import calculate_zonal_statistics
+from package_GeospatialProcessing import calculate_zonal_grids
 
 # Set root directory
 drive = 'N:/'
@@ -20,6 +21,7 @@ root_folder = 'ACCS_Work'
 # Define folder structure
 project_folder = os.path.join(drive, root_folder, 'Projects/WildlifeEcology/Moose_AlphabetHills/Data')
 grid_folder = os.path.join(project_folder, 'Data_Input/imagery/segments/gridded')
+index_folder = os.path.join(project_folder, 'Data_Input/imagery/segments/index')
 topography_folder = os.path.join(project_folder, 'Data_Input/topography/integer')
 hydrography_folder = os.path.join(project_folder, 'Data_Input/hydrography/processed')
 sent1_folder = os.path.join(project_folder, 'Data_Input/imagery/sentinel-1/processed')
@@ -28,9 +30,18 @@ burn_folder = os.path.join(project_folder, 'Data_Input/imagery/burn/postprocesse
 composite_folder = os.path.join(project_folder, 'Data_Input/imagery/composite/processed')
 vegetation_folder = os.path.join(project_folder, 'Data_Input/vegetation/foliar_cover')
 zonal_folder = os.path.join(project_folder, 'Data_Input/zonal')
+table_folder = os.path.join(zonal_folder, 'table')
 
-# Define work geodatabase
+# Define geodatabases
 work_geodatabase = os.path.join(project_folder, 'AlphabetHillsBrowseBiomass.gdb')
+segments_geodatabase = os.path.join(project_folder, 'AlphabetHills_Segments.gdb')
+
+# Define output format as either 'raster' for a zonal raster per grid and input or 'table' for a table of segments by inputs per grid
+output_format = 'raster'
+
+# Define number of worker processes and memory budget in gigabytes per worker
+worker_count = 32
+memory_budget = 4
 
 # Define grids
 grid_list = ['A2', 'A3', 'A4', 'A5', 'A6',
@@ -39,105 +50,110 @@ grid_list = ['A2', 'A3', 'A4', 'A5', 'A6',
              'D1', 'D2', 'D3', 'D4', 'D5', 'D6', 'D7',
              'E1', 'E2', 'E3', 'E4', 'E5', 'E6']
 
-# Create empty raster list
-input_rasters = []
-
-# Create list of topography rasters
-arcpy.env.workspace = topography_folder
-topography_rasters = arcpy.ListRasters('*', 'TIF')
-for raster in topography_rasters:
-    raster_path = os.path.join(topography_folder, raster)
-    input_rasters.append(raster_path)
-
-# Create list of hydrography rasters
-arcpy.env.workspace = hydrography_folder
-hydrography_rasters = arcpy.ListRasters('*', 'TIF')
-for raster in hydrography_rasters:
-    raster_path = os.path.join(hydrography_folder, raster)
-    input_rasters.append(raster_path)
-
-# Create list of Sentinel-1 rasters
-arcpy.env.workspace = sent1_folder
-sent1_rasters = arcpy.ListRasters('*', 'TIF')
-for raster in sent1_rasters:
-    raster_path = os.path.join(sent1_folder, raster)
-    input_rasters.append(raster_path)
-
-# Create list of Sentinel-2 rasters
-arcpy.env.workspace = sent2_folder
-sent2_rasters = arcpy.ListRasters('*', 'TIF')
-for raster in sent2_rasters:
-    raster_path = os.path.join(sent2_folder, raster)
-    input_rasters.append(raster_path)
-
-# Create list of burn rasters
-arcpy.env.workspace = burn_folder
-burn_rasters = arcpy.ListRasters('*', 'TIF')
-for raster in burn_rasters:
-    raster_path = os.path.join(burn_folder, raster)
-    input_rasters.append(raster_path)
-
-# Create list of composite rasters
-arcpy.env.workspace = composite_folder
-composite_rasters = arcpy.ListRasters('*', 'TIF')
-for raster in composite_rasters:
-    raster_path = os.path.join(composite_folder, raster)
-    input_rasters.append(raster_path)
-
-# Create list of vegetation rasters
-arcpy.env.workspace = vegetation_folder
-vegetation_rasters = arcpy.ListRasters('*', 'TIF')
-for raster in vegetation_rasters:
-    raster_path = os.path.join(vegetation_folder, raster)
-    input_rasters.append(raster_path)
-
-# Set workspace to default
-arcpy.env.workspace = work_geodatabase
-
-# Loop through each grid in grid list and produce zonal summaries
-for grid in grid_list:
-    print(f'Creating zonal summaries for grid {grid}...')
-
-    # Define input datasets
-    grid_raster = os.path.join(grid_folder, grid + '.tif')
-
-    # Create zonal summary for each raster in input list
-    count = 1
-    raster_length = len(input_rasters)
-    for input_raster in input_rasters:
-        # Create output folder
-        output_folder = os.path.join(zonal_folder, grid)
-
-        # Make grid folder if it does not already exist
-        if os.path.exists(output_folder) == 0:
-            os.mkdir(output_folder)
-
-        # Define output raster
-        raster_name = os.path.split(input_raster)[1]
-        output_raster = os.path.join(output_folder, raster_name)
-
-        # Create zonal summary if output raster does not already exist
-        if arcpy.Exists(output_raster) == 0:
-            # Create key word arguments
-            kwargs_zonal = {'statistic': 'MEAN',
-                            'zone_field': 'VALUE',
-                            'work_geodatabase': work_geodatabase,
-                            'input_array': [grid_raster, input_raster],
-                            'output_array': [output_raster]
-                            }
-
-            # Process the zonal summaries
-            print(f'\tProcessing zonal summary {count} of {raster_length}...')
-            arcpy_geoprocessing(calculate_zonal_statistics, **kwargs_zonal)
-            print('\t----------')
-
-        # If raster already exists, print message
-        else:
-            print(f'\tZonal summary {count} of {raster_length} already exists.')
-            print('\t----------')
-
-        # Increase counter
-        count += 1
-
-    # Report success at end of loop
-    print(f'Finished zonal summaries for {grid}.')
+# Process grids only in the main process so that worker processes can import this script without starting processing
+if __name__ == '__main__':
+    # Create empty raster list
+    input_rasters = []
+
+    # Create list of topography rasters
+    arcpy.env.workspace = topography_folder
+    topography_rasters = arcpy.ListRasters('*', 'TIF')
+    for raster in topography_rasters:
+        raster_path = os.path.join(topography_folder, raster)
+        input_rasters.append(raster_path)
+
+    # Create list of hydrography rasters
+    arcpy.env.workspace = hydrography_folder
+    hydrography_rasters = arcpy.ListRasters('*', 'TIF')
+    for raster in hydrography_rasters:
+        raster_path = os.path.join(hydrography_folder, raster)
+        input_rasters.append(raster_path)
+
+    # Create list of Sentinel-1 rasters
+    arcpy.env.workspace = sent1_folder
+    sent1_rasters = arcpy.ListRasters('*', 'TIF')
+    for raster in sent1_rasters:
+        raster_path = os.path.join(sent1_folder, raster)
+        input_rasters.append(raster_path)
+
+    # Create list of Sentinel-2 rasters
+    arcpy.env.workspace = sent2_folder
+    sent2_rasters = arcpy.ListRasters('*', 'TIF')
+    for raster in sent2_rasters:
+        raster_path = os.path.join(sent2_folder, raster)
+        input_rasters.append(raster_path)
+
+    # Create list of burn rasters
+    arcpy.env.workspace = burn_folder
+    burn_rasters = arcpy.ListRasters('*', 'TIF')
+    for raster in burn_rasters:
+        raster_path = os.path.join(burn_folder, raster)
+        input_rasters.append(raster_path)
+
+    # Create list of composite rasters
+    arcpy.env.workspace = composite_folder
+    composite_rasters = arcpy.ListRasters('*', 'TIF')
+    for raster in composite_rasters:
+        raster_path = os.path.join(composite_folder, raster)
+        input_rasters.append(raster_path)
+
+    # Create list of vegetation rasters
+    arcpy.env.workspace = vegetation_folder
+    vegetation_rasters = arcpy.ListRasters('*', 'TIF')
+    for raster in vegetation_rasters:
+        raster_path = os.path.join(vegetation_folder, raster)
+        input_rasters.append(raster_path)
+
+    # Set workspace to default
+    arcpy.env.workspace = work_geodatabase
+
+    # Define zone rasters and outputs for each grid
+    zone_rasters = []
+    output_list = []
+    point_tables = []
+    for grid in grid_list:
+        zone_rasters.append(os.path.join(grid_folder, grid + '.tif'))
+
+        # Define an output folder for each grid
+        if output_format == 'raster':
+            output_list.append(os.path.join(zonal_folder, grid))
+            continue
+
+        # Make table folder if it does not already exist
+        if os.path.exists(table_folder) == 0:
+            os.mkdir(table_folder)
+
+        # Define an output table and a point table for each grid
+        grid_points = os.path.join(segments_geodatabase, 'points_' + grid)
+        point_table = os.path.join(table_folder, grid + '_Points.csv')
+        output_list.append(os.path.join(table_folder, grid + '.csv'))
+        point_tables.append(point_table)
+
+        # Export segment points if they do not already exist
+        if os.path.exists(point_table) == 0:
+            with open(point_table, 'w', newline='') as point_stream:
+                point_writer = csv.writer(point_stream)
+                point_writer.writerow(['segment_id', 'POINT_X', 'POINT_Y'])
+                with arcpy.da.SearchCursor(grid_points, ['segment_id', 'POINT_X', 'POINT_Y']) as cursor:
+                    for row in cursor:
+                        point_writer.writerow(row)
+
+    # Create key word arguments
+    kwargs_zonal = {'statistic': 'MEAN',
+                    'zone_field': 'VALUE',
+                    'work_geodatabase': work_geodatabase,
+                    'index_folder': index_folder,
+                    'output_format': output_format,
+                    'worker_count': worker_count,
+                    'memory_budget': memory_budget,
+                    'zone_array': zone_rasters,
+                    'input_array': input_rasters,
+                    'output_array': output_list
+                    }
+    if output_format == 'table':
+        kwargs_zonal['point_array'] = point_tables
+
+    # Process the zonal summaries of all grids, resuming from the checkpoint of finished tasks
+    print(f'Creating zonal summaries of {len(input_rasters)} rasters for {len(grid_list)} grids...')
+    arcpy_geoprocessing(calculate_zonal_grids, check_output=False, **kwargs_zonal)
+    print('----------')
@@ -2,21 +2,48 @@
 # ---------------------------------------------------------------------------
 # Initialization for Geomorphometry Module
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
+# Last Updated: 2026-10-17
 # Usage: Individual functions have varying requirements. All functions that use arcpy must be executed in an ArcGIS Pro Python 3.6 distribution.
 # Description: This initialization file imports modules in the package so that the contents are accessible. The functions in this package are adapted from Geomorphometry and Gradient Metrics Toolbox 2.0 by Jeff Evans and Jim Oakleaf (2014) available at https://github.com/jeffreyevans/GradientMetrics
 # ---------------------------------------------------------------------------
 
 # Import functions from modules
+from package_Geomorphometry.accumulateFlow import accumulate_flow
+from package_Geomorphometry.breachDepressions import breach_depressions
 from package_Geomorphometry.calculateAspect import calculate_aspect
+from package_Geomorphometry.calculateCurvature import calculate_curvature
 from package_Geomorphometry.calculateExposure import calculate_exposure
+from package_Geomorphometry.calculateFloodplainSweep import calculate_floodplain_sweep
 from package_Geomorphometry.calculateFlow import calculate_flow
+from package_Geomorphometry.calculateFocalTiled import calculate_focal_tiled
+from package_Geomorphometry.calculateGridConvergence import calculate_grid_convergence
+from package_Geomorphometry.calculateGridOffset import calculate_grid_offset
+from package_Geomorphometry.calculateHandRasters import calculate_hand_rasters
 from package_Geomorphometry.calculateHeatLoad import calculate_heat_load
+from package_Geomorphometry.calculateHydrographicRasters import calculate_hydrographic_rasters
 from package_Geomorphometry.calculateIntegerElevation import calculate_integer_elevation
+from package_Geomorphometry.calculateNearestSource import calculate_nearest_source
 from package_Geomorphometry.calculatePosition import calculate_position
+from package_Geomorphometry.calculateQuadraticCoefficients import calculate_quadratic_coefficients
 from package_Geomorphometry.calculateRadiation import calculate_radiation
 from package_Geomorphometry.calculateRoughness import calculate_roughness
 from package_Geomorphometry.calculateSlope import calculate_slope
+from package_Geomorphometry.calculateStrahlerOrder import calculate_strahler_order
+from package_Geomorphometry.calculateStreamRasters import calculate_stream_rasters
 from package_Geomorphometry.calculateSurfaceArea import calculate_surface_area
 from package_Geomorphometry.calculateSurfaceRelief import calculate_surface_relief
+from package_Geomorphometry.calculateTerrainBlock import calculate_terrain_block
+from package_Geomorphometry.calculateTerrainRasters import calculate_terrain_rasters
 from package_Geomorphometry.calculateWetness import calculate_wetness
+from package_Geomorphometry.convertD8Receivers import convert_d8_receivers
+from package_Geomorphometry.fillDepressions import fill_depressions
+from package_Geomorphometry.focalRelief import focal_relief
+from package_Geomorphometry.focalStatistics import focal_statistics
+from package_Geomorphometry.generateBlockWindows import generate_block_windows
+from package_Geomorphometry.readHaloBlock import read_halo_block
+from package_Geomorphometry.routeD8 import route_d8
+from package_Geomorphometry.routeDinfinity import route_dinfinity
+from package_Geomorphometry.sortFlowTopology import sort_flow_topology
+from package_Geomorphometry.summedAreaStatistics import summed_area_statistics
+from package_Geomorphometry.traceStreamLines import trace_stream_lines
+from package_Geomorphometry.writeLineFeatures import write_line_features
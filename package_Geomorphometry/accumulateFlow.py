@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Accumulate flow
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy.
+# Description: "Accumulate flow" is a function that accumulates the number of upstream cells over a flow routing grid in topological order, equivalent to FlowAccumulation with no weight raster.
+# ---------------------------------------------------------------------------
+
+# Define function to accumulate flow in topological order
+def accumulate_flow(receiver_array, proportion_array=None, flow_topology=None):
+    """
+    Description: accumulates the weighted number of upstream cells draining into each cell from receivers and flow proportions
+    Inputs: 'receiver_array' -- an int32 array of shape (receivers, rows, columns) with the flat index of each downstream receiver of a cell, or -1 where a cell has no receiver in that slot
+            'proportion_array' -- a float array of the same shape as the receiver array with the proportion of flow passed to each receiver, or None if every cell passes all flow to a single receiver
+            'flow_topology' -- an optional tuple of cell order and level offsets from sort_flow_topology to reuse an existing sort of the receivers
+    Returned Value: Returns a float64 array of shape (rows, columns) with the accumulated flow into each cell, not including the cell itself
+    Preconditions: requires receivers from a routing function in this package on a depression-filled surface
+    """
+
+    # Import packages
+    import numpy as np
+    from package_Geomorphometry.sortFlowTopology import sort_flow_topology
+
+    # Sort cells from upstream to downstream
+    receiver_count, rows, columns = receiver_array.shape
+    if flow_topology is None:
+        flow_topology = sort_flow_topology(receiver_array)
+    cell_order, level_offsets = flow_topology
+    receiver_flat = receiver_array.reshape(receiver_count, -1)
+    if proportion_array is not None:
+        proportion_flat = proportion_array.reshape(receiver_count, -1)
+
+    # Pass the flow of each level of cells to its receivers
+    accumulation = np.zeros(rows * columns, dtype=np.float64)
+    for level_start, level_end in zip(level_offsets[:-1], level_offsets[1:]):
+        level_cells = cell_order[level_start:level_end]
+        level_flow = accumulation[level_cells] + 1
+        for receiver_slot in range(receiver_count):
+            level_receivers = receiver_flat[receiver_slot, level_cells]
+            has_receiver = level_receivers >= 0
+            if proportion_array is None:
+                slot_flow = level_flow[has_receiver]
+            else:
+                slot_flow = level_flow[has_receiver] * proportion_flat[receiver_slot, level_cells[has_receiver]]
+            np.add.at(accumulation, level_receivers[has_receiver], slot_flow)
+
+    return accumulation.reshape(rows, columns)
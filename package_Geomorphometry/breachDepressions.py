@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Breach depressions
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy.
+# Description: "Breach depressions" is a function that carves a least-cost channel from each pit in a float elevation array to the nearest lower cell or outlet following Lindsay (2016), so that depressions drain without raising large flat areas. Pits that cannot be breached within the depth and length limits are left for a subsequent fill.
+# ---------------------------------------------------------------------------
+
+# Define function to breach depressions with least-cost paths
+def breach_depressions(elevation_array, maximum_depth=None, maximum_length=None):
+    """
+    Description: breaches pits by lowering the cells along the path that requires the least total cut to reach a cell lower than the pit or the edge of the data
+    Inputs: 'elevation_array' -- a two-dimensional float array of elevation with no data stored as NaN
+            'maximum_depth' -- a value in the vertical units of the elevation array for the maximum cut at any cell of a breach path, or None for no limit
+            'maximum_length' -- an integer number of cells for the maximum length of a breach path, or None for no limit
+    Returned Value: Returns a float array of the same shape and float type as the elevation array with breach paths lowered to decrease monotonically from each pit and no data as NaN
+    Preconditions: cells on the array edge and cells adjacent to no data are outlets; pits are cells with all neighbors strictly higher, so flats are left for the subsequent fill; pits are processed from lowest to highest and the search from each pit is limited to cells within the depth and length limits, so remaining depressions must be resolved with fill_depressions
+    """
+
+    # Import packages
+    import heapq
+    import numpy as np
+
+    # Create a padded flat copy of elevation with a border of no data so neighbors never leave the array
+    elevation_array = np.asarray(elevation_array)
+    if not np.issubdtype(elevation_array.dtype, np.floating):
+        elevation_array = elevation_array.astype(np.float64)
+    rows, columns = elevation_array.shape
+    padded_columns = columns + 2
+    if (rows + 2) * padded_columns >= 2 ** 31:
+        raise ValueError('Elevation array exceeds the number of cells addressable with int32 indexes')
+    breached_array = np.pad(elevation_array, 1, constant_values=np.nan)
+    missing_array = np.isnan(breached_array)
+
+    # Identify outlets as valid cells on the edge of the data and pits as other cells with all neighbors strictly higher
+    padded_elevation = np.pad(breached_array, 1, constant_values=np.nan)
+    edge_array = np.zeros(missing_array.shape, dtype=bool)
+    higher_array = np.ones(missing_array.shape, dtype=bool)
+    for row_shift in (-1, 0, 1):
+        for column_shift in (-1, 0, 1):
+            if row_shift == 0 and column_shift == 0:
+                continue
+            neighbor_array = padded_elevation[1 + row_shift:1 + row_shift + rows + 2,
+                                              1 + column_shift:1 + column_shift + columns + 2]
+            edge_array |= np.isnan(neighbor_array)
+            with np.errstate(invalid='ignore'):
+                higher_array &= neighbor_array > breached_array
+    edge_array &= ~missing_array
+    pit_array = ~missing_array & ~edge_array & higher_array
+    pit_indexes = np.flatnonzero(pit_array)
+    pit_indexes = pit_indexes[np.argsort(breached_array.reshape(-1)[pit_indexes], kind='stable')]
+    del padded_elevation, higher_array, pit_array
+
+    # Create compact flat views for the searches
+    breached_flat = breached_array.reshape(-1)
+    breached_view = memoryview(breached_flat)
+    missing_view = memoryview(missing_array.reshape(-1).view(np.uint8))
+    edge_view = memoryview(edge_array.reshape(-1).view(np.uint8))
+    offsets = (-padded_columns - 1, -padded_columns, -padded_columns + 1, -1, 1,
+               padded_columns - 1, padded_columns, padded_columns + 1)
+    value_type = breached_array.dtype.type
+    minimum_value = value_type(-np.inf)
+    depth_limit = np.inf if maximum_depth is None else float(maximum_depth)
+    length_limit = np.inf if maximum_length is None else int(maximum_length)
+
+    # Create search buffers for path cost, back link, and path length that are valid where stamped with the search number
+    cost_array = np.zeros(breached_flat.shape[0], dtype=np.float64)
+    link_array = np.zeros(breached_flat.shape[0], dtype=np.int32)
+    length_array = np.zeros(breached_flat.shape[0], dtype=np.int32)
+    stamp_array = np.full(breached_flat.shape[0], -1, dtype=np.int32)
+    cost_view = memoryview(cost_array)
+    link_view = memoryview(link_array)
+    length_view = memoryview(length_array)
+    stamp_view = memoryview(stamp_array)
+    heappop = heapq.heappop
+    heappush = heapq.heappush
+
+    # Search from each pit for the least-cost path to a lower cell or outlet
+    for search_number, pit_index in enumerate(pit_indexes.tolist()):
+        pit_elevation = breached_view[pit_index]
+        if any(breached_view[pit_index + offset] < pit_elevation for offset in offsets):
+            continue
+        search_queue = [(0.0, pit_index)]
+        cost_view[pit_index] = 0.0
+        length_view[pit_index] = 0
+        stamp_view[pit_index] = search_number
+        end_index = -1
+        while search_queue:
+            path_cost, current_index = heappop(search_queue)
+            if path_cost > cost_view[current_index]:
+                continue
+            if current_index != pit_index and (breached_view[current_index] < pit_elevation
+                                               or edge_view[current_index]):
+                end_index = current_index
+                break
+            path_length = length_view[current_index] + 1
+            if path_length > length_limit:
+                continue
+            for offset in offsets:
+                neighbor_index = current_index + offset
+                if missing_view[neighbor_index]:
+                    continue
+                cut_depth = breached_view[neighbor_index] - pit_elevation
+                if cut_depth > depth_limit:
+                    continue
+                neighbor_cost = path_cost + cut_depth if cut_depth > 0.0 else path_cost
+                if stamp_view[neighbor_index] != search_number or neighbor_cost < cost_view[neighbor_index]:
+                    stamp_view[neighbor_index] = search_number
+                    cost_view[neighbor_index] = neighbor_cost
+                    link_view[neighbor_index] = current_index
+                    length_view[neighbor_index] = path_length
+                    heappush(search_queue, (neighbor_cost, neighbor_index))
+
+        # Lower the path so that elevation decreases from the pit to the end of the path
+        if end_index < 0:
+            continue
+        path_indexes = []
+        current_index = end_index
+        while current_index != pit_index:
+            path_indexes.append(current_index)
+            current_index = link_view[current_index]
+        path_elevation = value_type(pit_elevation)
+        for path_index in reversed(path_indexes):
+            path_elevation = min(value_type(breached_view[path_index]), np.nextafter(path_elevation, minimum_value))
+            breached_view[path_index] = float(path_elevation)
+
+    # Release views and remove padding
+    cost_view.release()
+    link_view.release()
+    length_view.release()
+    stamp_view.release()
+    breached_view.release()
+    missing_view.release()
+    edge_view.release()
+    return breached_array[1:-1, 1:-1].copy()
@@ -2,21 +2,25 @@
 # ---------------------------------------------------------------------------
 # Calculate aspect
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
+# Last Updated: 2026-10-17
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
 # Description: "Calculate aspect" is a function that calculates float and integer aspect.
 # ---------------------------------------------------------------------------
 
 # Define function to calculate aspect
-def calculate_aspect(area_raster, elevation_float, z_unit, aspect_float, aspect_integer):
+def calculate_aspect(area_raster, elevation_float, z_unit, aspect_float, aspect_integer, intermediate_factor=None,
+                     processing_factor='50%', scratch_workspace=None):
     """
     Description: calculates 32-bit float raw aspect and 16-bit signed linear aspect
     Inputs: 'area_raster' -- a raster of the study area to set snap raster and extract area
             'elevation_float' -- an input float elevation raster
             'aspect_float' -- a file path for an output float aspect raster in degrees
             'aspect_integer' -- a file path for an output integer aspect raster in degrees
+            'intermediate_factor' -- an optional integer to store the float aspect raster as a compressed 16-bit signed raster of aspect multiplied by the factor, or None to store 32-bit float
+            'processing_factor' -- an optional string value for the arcpy parallel processing factor, such as a share of the cores divided among tasks that run at the same time (defaults to '50%')
+            'scratch_workspace' -- an optional folder for temporary arcpy datasets that must not be shared with tasks that run at the same time (defaults to the current scratch workspace)
     Returned Value: Returns a raster dataset on disk
-    Preconditions: requires float input elevation raster
+    Preconditions: requires float input elevation raster; functions that read a scaled aspect raster must be given the same factor
     """
 
     # Import packages
@@ -30,7 +34,11 @@ def calculate_aspect(area_raster, elevation_float, z_unit, aspect_float, aspect_
     arcpy.env.overwriteOutput = True
 
     # Specify core usage
-    arcpy.env.parallelProcessingFactor = '50%'
+    arcpy.env.parallelProcessingFactor = processing_factor
+
+    # Set scratch workspace if supplied
+    if scratch_workspace is not None:
+        arcpy.env.scratchWorkspace = scratch_workspace
 
     # Set snap raster and extent
     arcpy.env.snapRaster = area_raster
@@ -62,21 +70,38 @@ def calculate_aspect(area_raster, elevation_float, z_unit, aspect_float, aspect_
     extract_integer = ExtractByMask(integer_raster, area_raster)
 
     # Export rasters
-    print('\t\tExporting aspect as 32-bit float raster...')
-    arcpy.management.CopyRaster(aspect_raster,
-                                aspect_float,
-                                '',
-                                '0',
-                                '-2147483648',
-                                'NONE',
-                                'NONE',
-                                '32_BIT_FLOAT',
-                                'NONE',
-                                'NONE',
-                                'TIFF',
-                                'NONE',
-                                'CURRENT_SLICE',
-                                'NO_TRANSPOSE')
+    if intermediate_factor is None:
+        print('\t\tExporting aspect as 32-bit float raster...')
+        arcpy.management.CopyRaster(aspect_raster,
+                                    aspect_float,
+                                    '',
+                                    '0',
+                                    '-2147483648',
+                                    'NONE',
+                                    'NONE',
+                                    '32_BIT_FLOAT',
+                                    'NONE',
+                                    'NONE',
+                                    'TIFF',
+                                    'NONE',
+                                    'CURRENT_SLICE',
+                                    'NO_TRANSPOSE')
+    else:
+        print(f'\t\tExporting aspect multiplied by {intermediate_factor} as compressed 16-bit signed raster...')
+        scaled_raster = Int((aspect_raster * intermediate_factor) + 0.5)
+        with arcpy.EnvManager(compression='LZW', tileSize='256 256'):
+            arcpy.management.CopyRaster(scaled_raster,
+                                        aspect_float,
+                                        '',
+                                        '32767',
+                                        '-32768',
+                                        'NONE',
+                                        'NONE',
+                                        '16_BIT_SIGNED',
+                                        'NONE',
+                                        'NONE',
+                                        'TIFF',
+                                        'NONE')
     print('\t\tExporting aspect as 16-bit integer raster...')
     arcpy.management.CopyRaster(extract_integer,
                                 aspect_integer,
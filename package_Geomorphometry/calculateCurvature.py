@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Calculate curvature
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
+# Description: "Calculate curvature" is a function that calculates integer profile, plan, or mean curvature from a quadratic surface.
+# ---------------------------------------------------------------------------
+
+# Define function to calculate curvature
+def calculate_curvature(area_raster, elevation_float, z_unit, curvature_type, conversion_factor, curvature_output,
+                        processing_factor='50%', scratch_workspace=None):
+    """
+    Description: calculates 16-bit signed curvature
+    Inputs: 'area_raster' -- a raster of the study area to set snap raster and extract area
+            'elevation_float' -- an input float elevation raster
+            'z_unit' -- a string of the elevation unit
+            'curvature_type' -- a string value of either 'profile', 'plan', or 'mean'
+            'conversion_factor' -- an integer to be multiplied with the output for conversion to integer raster
+            'curvature_output' -- an output curvature raster
+            'processing_factor' -- an optional string value for the arcpy parallel processing factor, such as a share of the cores divided among tasks that run at the same time (defaults to '50%')
+            'scratch_workspace' -- an optional folder for temporary arcpy datasets that must not be shared with tasks that run at the same time (defaults to the current scratch workspace)
+    Returned Value: Returns a raster dataset on disk
+    Preconditions: requires float input elevation raster; profile curvature is the normal slope line curvature and plan curvature is the projected contour curvature
+    """
+
+    # Import packages
+    import arcpy
+    from arcpy.sa import ExtractByMask
+    from arcpy.sa import Int
+    from arcpy.sa import Raster
+    from arcpy.sa import SurfaceParameters
+
+    # Define surface parameter for curvature type
+    parameter_dictionary = {'profile': 'PROFILE_CURVATURE',
+                            'plan': 'CONTOUR_CURVATURE',
+                            'mean': 'MEAN_CURVATURE'}
+
+    # Set overwrite option
+    arcpy.env.overwriteOutput = True
+
+    # Specify core usage
+    arcpy.env.parallelProcessingFactor = processing_factor
+
+    # Set scratch workspace if supplied
+    if scratch_workspace is not None:
+        arcpy.env.scratchWorkspace = scratch_workspace
+
+    # Set snap raster and extent
+    arcpy.env.snapRaster = area_raster
+    arcpy.env.extent = Raster(area_raster).extent
+
+    # Set cell size environment
+    cell_size = arcpy.management.GetRasterProperties(elevation_float, 'CELLSIZEX', '').getOutput(0)
+    arcpy.env.cellSize = int(cell_size)
+
+    # Calculate raw curvature
+    print(f'\t\tCalculating raw {curvature_type} curvature...')
+    curvature_raster = SurfaceParameters(elevation_float,
+                                         parameter_dictionary[curvature_type],
+                                         'QUADRATIC',
+                                         cell_size,
+                                         'FIXED_NEIGHBORHOOD',
+                                         z_unit)
+
+    # Convert to integer
+    print('\t\tConverting to integer...')
+    integer_raster = Int((curvature_raster * conversion_factor) + 0.5)
+
+    # Extract to area raster
+    print('\t\tExtracting raster to area...')
+    extract_integer = ExtractByMask(integer_raster, area_raster)
+
+    # Export raster
+    print(f'\t\tExporting {curvature_type} curvature raster as 16-bit signed...')
+    arcpy.management.CopyRaster(extract_integer,
+                                curvature_output,
+                                '',
+                                '32767',
+                                '-32768',
+                                'NONE',
+                                'NONE',
+                                '16_BIT_SIGNED',
+                                'NONE',
+                                'NONE',
+                                'TIFF',
+                                'NONE')
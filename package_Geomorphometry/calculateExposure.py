@@ -2,13 +2,14 @@
 # ---------------------------------------------------------------------------
 # Calculate exposure
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
+# Last Updated: 2026-10-17
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
 # Description: "Calculate exposure" is a function that calculates a continuous index of solar exposure weighted by steepness of the slope. This function is adapted from Geomorphometry and Gradient Metrics Toolbox 2.0 by Jeff Evans and Jim Oakleaf (2014) available at https://github.com/jeffreyevans/GradientMetrics.
 # ---------------------------------------------------------------------------
 
 # Define function to calculate solar exposure index
-def calculate_exposure(area_raster, aspect_float, slope_float, conversion_factor, exposure_output):
+def calculate_exposure(area_raster, aspect_float, slope_float, conversion_factor, exposure_output,
+                       slope_factor=1, aspect_factor=1, processing_factor='50%', scratch_workspace=None):
     """
     Description: calculates 16-bit signed solar exposure index
     Inputs: 'area_raster' -- a raster of the study area to set snap raster and extract area
@@ -16,6 +17,10 @@ def calculate_exposure(area_raster, aspect_float, slope_float, conversion_factor
             'slope_float' -- an input float slope raster in degrees
             'conversion_factor' -- an integer to be multiplied with the output for conversion to integer raster
             'exposure_output' -- an output exposure raster
+            'slope_factor' -- an optional integer that the slope raster was multiplied by if it is stored as a scaled integer raster (defaults to 1)
+            'aspect_factor' -- an optional integer that the aspect raster was multiplied by if it is stored as a scaled integer raster (defaults to 1)
+            'processing_factor' -- an optional string value for the arcpy parallel processing factor, such as a share of the cores divided among tasks that run at the same time (defaults to '50%')
+            'scratch_workspace' -- an optional folder for temporary arcpy datasets that must not be shared with tasks that run at the same time (defaults to the current scratch workspace)
     Returned Value: Returns a raster dataset on disk
     Preconditions: requires an input aspect and slope raster
     """
@@ -31,7 +36,11 @@ def calculate_exposure(area_raster, aspect_float, slope_float, conversion_factor
     arcpy.env.overwriteOutput = True
 
     # Specify core usage
-    arcpy.env.parallelProcessingFactor = '50%'
+    arcpy.env.parallelProcessingFactor = processing_factor
+
+    # Set scratch workspace if supplied
+    if scratch_workspace is not None:
+        arcpy.env.scratchWorkspace = scratch_workspace
 
     # Set snap raster and extent
     arcpy.env.snapRaster = area_raster
@@ -43,7 +52,7 @@ def calculate_exposure(area_raster, aspect_float, slope_float, conversion_factor
 
     # Convert degrees to radians
     print('\t\tConverting degrees to radians...')
-    aspect_radian = Raster(aspect_float) * 0.0174533
+    aspect_radian = Raster(aspect_float) * (0.0174533 / aspect_factor)
 
     # Calculate cosine of modified aspect
     print('\t\tCalculating cosine of aspect...')
@@ -51,7 +60,7 @@ def calculate_exposure(area_raster, aspect_float, slope_float, conversion_factor
 
     # Calculate solar exposure index
     print('\t\tMultiplying cosine by slope...')
-    exposure_raster = cos_aspect * slope_float
+    exposure_raster = cos_aspect * (Raster(slope_float) * (1.0 / slope_factor))
 
     # Convert to integer
     print('\t\tConverting to integer...')
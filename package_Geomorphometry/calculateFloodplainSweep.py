@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Calculate floodplain sweep
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy and rasterio.
+# Description: "Calculate floodplain sweep" is a function that calculates preliminary floodplain masks for every combination of a set of thresholds per hydrographic position raster in a single block-wise pass, storing one bit per combination in an 8-bit or 16-bit unsigned raster and totaling the floodplain area of each combination.
+# ---------------------------------------------------------------------------
+
+# Define function to calculate floodplain masks for combinations of position thresholds
+def calculate_floodplain_sweep(area_raster, position_list, threshold_list, output_raster, block_size=1024):
+    """
+    Description: calculates bit-packed floodplain masks where a cell is floodplain for a combination if any position raster is less than or equal to its threshold in that combination
+    Inputs: 'area_raster' -- a raster of the study area that defines the output grid and extract area
+            'position_list' -- a list of hydrographic position rasters aligned to the area raster
+            'threshold_list' -- a list of threshold lists in the order of the position rasters, where every combination of one threshold from each list is calculated
+            'output_raster' -- an output raster with one bit per combination in the order of the returned list, using one band per 16 combinations
+            'block_size' -- an integer number of rows and columns per processing block
+    Returned Value: Returns a raster on disk and a list of tuples of threshold combination and floodplain area in the squared horizontal units
+    Preconditions: requires position rasters with the same cell size and cell alignment as the area raster; bit n of band b is combination 16 * b + n, or bit n of an 8-bit raster if there are 8 or fewer combinations; cells outside the study area are 0 in every band
+    """
+
+    # Import packages
+    import itertools
+    import numpy as np
+    import rasterio
+    from rasterio.windows import Window
+    from package_Geomorphometry.calculateGridOffset import calculate_grid_offset
+    from package_Geomorphometry.generateBlockWindows import generate_block_windows
+    from package_Geomorphometry.readHaloBlock import read_halo_block
+
+    # Check inputs
+    if len(position_list) != len(threshold_list):
+        raise ValueError('One threshold list must be supplied per position raster.')
+
+    # Define threshold combinations as indexes into each threshold list
+    combination_indexes = list(itertools.product(*[range(len(thresholds)) for thresholds in threshold_list]))
+    combination_total = len(combination_indexes)
+    if combination_total <= 8:
+        output_type = np.uint8
+        bit_total = 8
+    else:
+        output_type = np.uint16
+        bit_total = 16
+    band_total = int(np.ceil(combination_total / bit_total))
+
+    # Open input datasets and calculate offsets of the area grid within the position grids
+    area_dataset = rasterio.open(area_raster)
+    cell_area = abs(area_dataset.res[0] * area_dataset.res[1])
+    position_datasets = [rasterio.open(position_raster) for position_raster in position_list]
+    position_offsets = [calculate_grid_offset(area_dataset, position_dataset)
+                        for position_dataset in position_datasets]
+
+    # Create output raster with the area grid
+    output_profile = area_dataset.profile.copy()
+    output_profile.update(driver='GTiff', dtype=np.dtype(output_type).name, nodata=None, count=band_total,
+                          tiled=True, blockxsize=256, blockysize=256, BIGTIFF='IF_SAFER')
+    output_dataset = rasterio.open(output_raster, 'w', **output_profile)
+
+    # Process each block
+    cell_counts = np.zeros(combination_total, dtype=np.int64)
+    block_count = 1
+    block_total = int(np.ceil(area_dataset.height / block_size) * np.ceil(area_dataset.width / block_size))
+    for row_offset, column_offset, block_height, block_width in generate_block_windows(area_dataset.height,
+                                                                                       area_dataset.width,
+                                                                                       block_size):
+        print(f'\t\tProcessing block {block_count} of {block_total}...')
+        block_window = Window(column_offset, row_offset, block_width, block_height)
+        block_count += 1
+
+        # Read area mask
+        area_mask = area_dataset.read_masks(1, window=block_window) == 0
+        output_block = np.zeros((band_total, block_height, block_width), dtype=output_type)
+        if area_mask.all():
+            output_dataset.write(output_block, window=block_window)
+            continue
+
+        # Read each position raster once and apply each of its thresholds
+        threshold_masks = []
+        for position_dataset, (position_row, position_column), thresholds in zip(position_datasets,
+                                                                                position_offsets,
+                                                                                threshold_list):
+            position_block = read_halo_block(position_dataset,
+                                             position_row + row_offset,
+                                             position_column + column_offset,
+                                             block_height, block_width, 0)
+            with np.errstate(invalid='ignore'):
+                threshold_masks.append([(position_block <= threshold) & ~area_mask for threshold in thresholds])
+
+        # Combine threshold masks for each combination and set its bit
+        for count, indexes in enumerate(combination_indexes):
+            floodplain_mask = threshold_masks[0][indexes[0]].copy()
+            for position_index in range(1, len(indexes)):
+                floodplain_mask |= threshold_masks[position_index][indexes[position_index]]
+            cell_counts[count] += np.count_nonzero(floodplain_mask)
+            output_block[count // bit_total] |= floodplain_mask.astype(output_type) << (count % bit_total)
+
+        # Write block
+        output_dataset.write(output_block, window=block_window)
+
+    # Close datasets
+    output_dataset.close()
+    for position_dataset in position_datasets:
+        position_dataset.close()
+    area_dataset.close()
+
+    # Report floodplain area for each combination
+    area_list = []
+    for count, indexes in enumerate(combination_indexes):
+        combination = tuple(threshold_list[position_index][indexes[position_index]]
+                            for position_index in range(len(indexes)))
+        area_list.append((combination, float(cell_counts[count] * cell_area)))
+
+    return area_list
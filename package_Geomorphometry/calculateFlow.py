@@ -2,22 +2,81 @@
 # ---------------------------------------------------------------------------
 # Calculate flow accumulation
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
-# Description: "Calculate flow accumulation" is a function that calculates flow accumulation from a float elevation raster.
+# Last Updated: 2026-10-17
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation, or in a Python 3.7+ distribution with numpy and rasterio if the numpy engine is selected.
+# Description: "Calculate flow accumulation" is a function that calculates D-infinity flow accumulation from a float elevation raster.
 # ---------------------------------------------------------------------------
 
 # Define function to calculate flow accumulation
-def calculate_flow(area_raster, elevation_float, flow_accumulation):
+def calculate_flow(area_raster, elevation_float, flow_accumulation, engine='arcpy', conditioning='fill',
+                   breach_depth=3, breach_length=100, processing_factor='50%', scratch_workspace=None):
     """
     Description: calculates 32-bit float flow direction and accumulation rasters
     Inputs: 'area_raster' -- a raster of the study area to set snap raster and extract area
             'elevation_float' -- an input float elevation raster
             'flow_accumulation' -- a file path for an output float flow direction raster
+            'engine' -- a string value of either 'arcpy' to use Spatial Analyst or 'numpy' to fill, route, and accumulate in memory with the functions in this package
+            'conditioning' -- a string value for the numpy engine of either 'fill' to fill depressions or 'breach' to breach depressions with least-cost paths before filling the depressions that remain
+            'breach_depth' -- a value in the vertical units for the maximum cut of a breach path (defaults to 3), or None for no limit
+            'breach_length' -- a length in the horizontal units for the maximum length of a breach path (defaults to 100), or None for no limit
+            'processing_factor' -- an optional string value for the arcpy parallel processing factor, such as a share of the cores divided among tasks that run at the same time (defaults to '50%')
+            'scratch_workspace' -- an optional folder for temporary arcpy datasets that must not be shared with tasks that run at the same time (defaults to the current scratch workspace)
     Returned Value: Returns a raster dataset on disk
-    Preconditions: requires float input elevation raster
+    Preconditions: requires float input elevation raster; the numpy engine requires the elevation raster to have the same cell size and cell alignment as the area raster and memory for the area grid
     """
 
+    # Calculate flow accumulation without arcpy if requested
+    if engine == 'numpy':
+        # Import packages
+        import numpy as np
+        import rasterio
+        from package_Geomorphometry.accumulateFlow import accumulate_flow
+        from package_Geomorphometry.breachDepressions import breach_depressions
+        from package_Geomorphometry.calculateGridOffset import calculate_grid_offset
+        from package_Geomorphometry.fillDepressions import fill_depressions
+        from package_Geomorphometry.readHaloBlock import read_halo_block
+        from package_Geomorphometry.routeDinfinity import route_dinfinity
+
+        # Read elevation within the area extent
+        area_dataset = rasterio.open(area_raster)
+        elevation_dataset = rasterio.open(elevation_float)
+        cell_size = elevation_dataset.res[0]
+        elevation_row, elevation_column = calculate_grid_offset(area_dataset, elevation_dataset)
+        elevation_array = read_halo_block(elevation_dataset, elevation_row, elevation_column,
+                                          area_dataset.height, area_dataset.width, 0).astype(np.float32)
+        elevation_dataset.close()
+
+        # Breach elevation raster if requested
+        if conditioning == 'breach':
+            print('\t\tBreaching elevation raster...')
+            breach_cells = None if breach_length is None else int(breach_length / cell_size)
+            elevation_array = breach_depressions(elevation_array, breach_depth, breach_cells)
+
+        # Fill elevation raster
+        print('\t\tFilling elevation raster...')
+        fill_array = fill_depressions(elevation_array, 3, epsilon=True)
+        del elevation_array
+
+        # Calculate flow direction
+        print('\t\tCalculating flow direction...')
+        direction_array, receiver_array, proportion_array = route_dinfinity(fill_array, cell_size)
+        del direction_array
+
+        # Calculate flow accumulation
+        print('\t\tCalculating flow accumulation...')
+        accumulation_array = accumulate_flow(receiver_array, proportion_array)
+        accumulation_array[np.isnan(fill_array)] = -2147483648
+
+        # Export final raster
+        print('\t\tExporting flow accumulation raster as 32-bit float...')
+        output_profile = area_dataset.profile.copy()
+        output_profile.update(driver='GTiff', dtype='float32', nodata=-2147483648, count=1,
+                              tiled=True, blockxsize=256, blockysize=256, BIGTIFF='IF_SAFER')
+        with rasterio.open(flow_accumulation, 'w', **output_profile) as output_dataset:
+            output_dataset.write(accumulation_array.astype(np.float32), 1)
+        area_dataset.close()
+        return
+
     # Import packages
     import arcpy
     from arcpy.sa import Fill
@@ -29,7 +88,11 @@ def calculate_flow(area_raster, elevation_float, flow_accumulation):
     arcpy.env.overwriteOutput = True
 
     # Specify core usage
-    arcpy.env.parallelProcessingFactor = '50%'
+    arcpy.env.parallelProcessingFactor = processing_factor
+
+    # Set scratch workspace if supplied
+    if scratch_workspace is not None:
+        arcpy.env.scratchWorkspace = scratch_workspace
 
     # Set snap raster and extent
     arcpy.env.snapRaster = area_raster
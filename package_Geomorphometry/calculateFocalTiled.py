@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Calculate tiled focal statistics
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy and rasterio.
+# Description: "Calculate tiled focal statistics" is a function that streams a float raster in blocks with a halo of half the neighborhood width to calculate one or more focal statistics out of core.
+# ---------------------------------------------------------------------------
+
+# Define function to calculate focal statistics in tiles
+def calculate_focal_tiled(input_raster, width, output_dictionary, block_size=1024):
+    """
+    Description: calculates 32-bit float focal statistics over a square neighborhood in halo-padded blocks
+    Inputs: 'input_raster' -- an input float raster such as a float elevation raster
+            'width' -- an integer number of cells for the axis length of the square neighborhood
+            'output_dictionary' -- a dictionary with statistic names ('MEAN', 'SUM', 'STD', 'MINIMUM', 'MAXIMUM') as keys and output raster paths as values
+            'block_size' -- an integer number of rows and columns per processing block
+    Returned Value: Returns a raster dataset on disk for each statistic
+    Preconditions: peak memory scales with (block_size + width) squared rather than raster size, and each output cell is computed from the same neighborhood values in the same order as a whole-raster calculation so results are identical at tile seams
+    """
+
+    # Import packages
+    import numpy as np
+    import rasterio
+    from rasterio.windows import Window
+    from package_Geomorphometry.focalStatistics import focal_statistics
+    from package_Geomorphometry.generateBlockWindows import generate_block_windows
+    from package_Geomorphometry.readHaloBlock import read_halo_block
+
+    # Define halo as half of the neighborhood width
+    halo = int(width) // 2
+
+    # Open input dataset and create outputs with the input grid
+    input_dataset = rasterio.open(input_raster)
+    output_profile = input_dataset.profile.copy()
+    output_profile.update(driver='GTiff', dtype='float32', nodata=-2147483648, count=1,
+                          tiled=True, blockxsize=256, blockysize=256, BIGTIFF='IF_SAFER')
+    output_datasets = dict()
+    for statistic in output_dictionary:
+        output_datasets[statistic] = rasterio.open(output_dictionary[statistic], 'w', **output_profile)
+
+    # Process each block
+    for row_offset, column_offset, block_height, block_width in generate_block_windows(input_dataset.height,
+                                                                                       input_dataset.width,
+                                                                                       block_size):
+        block_window = Window(column_offset, row_offset, block_width, block_height)
+        input_block = read_halo_block(input_dataset, row_offset, column_offset, block_height, block_width, halo)
+        interior = (slice(halo, halo + block_height), slice(halo, halo + block_width))
+        valid_block = ~np.isnan(input_block[interior])
+        for statistic in output_dictionary:
+            statistic_block = focal_statistics(input_block, width, statistic)[interior]
+            statistic_block[~valid_block | np.isnan(statistic_block)] = -2147483648
+            output_datasets[statistic].write(statistic_block.astype(np.float32), 1, window=block_window)
+
+    # Close datasets
+    for statistic in output_dictionary:
+        output_datasets[statistic].close()
+    input_dataset.close()
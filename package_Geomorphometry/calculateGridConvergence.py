@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Calculate grid convergence
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy and rasterio.
+# Description: "Calculate grid convergence" is a function that calculates a lookup of grid convergence and latitude for a block of a projected raster, such as a block of the EPSG:3338 grid, so that grid aspect can be converted to geodesic aspect and heat load can use the latitude of each cell.
+# ---------------------------------------------------------------------------
+
+# Define function to calculate grid convergence and latitude for a raster block
+def calculate_grid_convergence(raster_dataset, row_offset, column_offset, block_height, block_width, halo):
+    """
+    Description: calculates grid convergence and latitude in degrees for a block plus a halo from one projected row and one projected column of the block
+    Inputs: 'raster_dataset' -- an open rasterio dataset with a coordinate reference system that defines the grid
+            'row_offset' -- the first row of the block in the pixel space of the dataset
+            'column_offset' -- the first column of the block in the pixel space of the dataset
+            'block_height' -- the number of rows in the block
+            'block_width' -- the number of columns in the block
+            'halo' -- the number of cells beyond each edge of the block
+    Returned Value: Returns a tuple of two float64 arrays of shape (block_height + 2 * halo, block_width + 2 * halo) for grid convergence and latitude in degrees
+    Preconditions: grid convergence is the grid azimuth of true north measured clockwise from grid north, so geodesic aspect is grid aspect minus convergence; only the middle column and middle row of the block are projected and the two lookups are combined with a broadcast addition, so the error is second order in the block extent and negligible for blocks of a few thousand cells
+    """
+
+    # Import packages
+    import numpy as np
+    from rasterio.warp import transform
+
+    # Check coordinate reference system
+    if raster_dataset.crs is None:
+        raise ValueError(f'{raster_dataset.name} does not have a coordinate reference system.')
+
+    # Define cell centers along the middle column for each row, along the middle row for each column, and at the middle of the block
+    row_positions = np.arange(row_offset - halo, row_offset + block_height + halo, dtype=np.float64) + 0.5
+    column_positions = np.arange(column_offset - halo, column_offset + block_width + halo, dtype=np.float64) + 0.5
+    middle_row = row_offset + block_height / 2
+    middle_column = column_offset + block_width / 2
+    row_list = np.concatenate([row_positions, np.full(column_positions.shape, middle_row), [middle_row]])
+    column_list = np.concatenate([np.full(row_positions.shape, middle_column), column_positions, [middle_column]])
+    x_list, y_list = raster_dataset.transform * (column_list, row_list)
+
+    # Calculate geographic coordinates and the projected direction of a small step north
+    longitude_list, latitude_list = transform(raster_dataset.crs, 'EPSG:4326', x_list, y_list)
+    latitude_list = np.asarray(latitude_list)
+    north_x, north_y = transform('EPSG:4326', raster_dataset.crs,
+                                 longitude_list, np.minimum(latitude_list + 0.0001, 90).tolist())
+    convergence_list = np.degrees(np.arctan2(np.asarray(north_x) - x_list, np.asarray(north_y) - y_list))
+
+    # Combine the row and column lookups relative to the middle of the block
+    row_count = row_positions.shape[0]
+    output_list = []
+    for value_list in [convergence_list, latitude_list]:
+        row_lookup = value_list[0:row_count] - value_list[-1]
+        column_lookup = value_list[row_count:-1]
+        output_list.append(row_lookup[:, np.newaxis] + column_lookup[np.newaxis, :])
+
+    return tuple(output_list)
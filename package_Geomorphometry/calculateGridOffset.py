@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Calculate grid offset
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with rasterio.
+# Description: "Calculate grid offset" is a function that calculates the row and column offset of a reference raster grid within another raster grid with the same cell size and alignment.
+# ---------------------------------------------------------------------------
+
+# Define function to calculate the offset of a reference grid within another grid
+def calculate_grid_offset(reference_dataset, raster_dataset):
+    """
+    Description: calculates the pixel offset of the upper left cell of a reference raster within another raster
+    Inputs: 'reference_dataset' -- an open rasterio dataset that defines the processing grid, such as the area raster
+            'raster_dataset' -- an open rasterio dataset to read in the processing grid
+    Returned Value: Returns a tuple of integer row offset and column offset
+    Preconditions: both rasters must share cell size and cell alignment
+    """
+
+    # Check cell size
+    if (abs(reference_dataset.res[0] - raster_dataset.res[0]) > 1E-6
+            or abs(reference_dataset.res[1] - raster_dataset.res[1]) > 1E-6):
+        raise ValueError(f'{raster_dataset.name} does not have the same cell size as {reference_dataset.name}.')
+
+    # Calculate offsets and check cell alignment
+    row_offset = (raster_dataset.transform.f - reference_dataset.transform.f) / abs(raster_dataset.transform.e)
+    column_offset = (reference_dataset.transform.c - raster_dataset.transform.c) / raster_dataset.transform.a
+    if abs(row_offset - round(row_offset)) > 1E-3 or abs(column_offset - round(column_offset)) > 1E-3:
+        raise ValueError(f'{raster_dataset.name} is not aligned to {reference_dataset.name}.')
+
+    return int(round(row_offset)), int(round(column_offset))
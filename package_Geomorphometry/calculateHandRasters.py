@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Calculate height above nearest drainage rasters
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy and rasterio.
+# Description: "Calculate height above nearest drainage rasters" is a function that calculates 16-bit signed hydrographic position from the height above the flowline cell that each cell drains to along a D8 flow direction grid, so that position does not cross drainage divides.
+# ---------------------------------------------------------------------------
+
+# Define function to calculate height above nearest drainage from flowline rasters
+def calculate_hand_rasters(area_raster, elevation_float, direction_raster, flowline_list):
+    """
+    Description: calculates hydrographic position as the squared vertical difference between landscape elevation and the elevation of the first flowline cell downstream along D8 flow paths
+    Inputs: 'area_raster' -- a raster of the study area that defines the output grid and extract area
+            'elevation_float' -- an input float elevation raster aligned to the area raster
+            'direction_raster' -- a D8 flow direction raster aligned to the area raster, such as the flow direction exported by the numpy engine of generate_flowlines
+            'flowline_list' -- a list of tuples of flowline raster, search distance in the horizontal units or None for no limit, and output raster, where flowline cells are any cells with data
+    Returned Value: Returns a 16-bit signed raster on disk for each flowline raster with values of 100 times the squared height above nearest drainage capped at 32000, and 32000 where a cell does not drain to a flowline or is beyond the search distance
+    Preconditions: calculations use the grid of the direction raster so that flow paths that leave the study area are followed; rasters must have the same cell size and cell alignment as the area raster
+    """
+
+    # Import packages
+    import numpy as np
+    import rasterio
+    from package_Geomorphometry.calculateGridOffset import calculate_grid_offset
+    from package_Geomorphometry.calculateNearestSource import calculate_nearest_source
+    from package_Geomorphometry.convertD8Receivers import convert_d8_receivers
+    from package_Geomorphometry.readHaloBlock import read_halo_block
+    from package_Geomorphometry.sortFlowTopology import sort_flow_topology
+
+    # Read flow direction and sort cells from upstream to downstream
+    print('\t\tSorting flow direction...')
+    direction_dataset = rasterio.open(direction_raster)
+    cell_size = direction_dataset.res[0]
+    receiver_array = convert_d8_receivers(direction_dataset.read(1))
+    receiver_flat = receiver_array.reshape(-1)
+    cell_order, level_offsets = sort_flow_topology(receiver_array)
+
+    # Read elevation to the direction grid
+    print('\t\tReading elevation raster...')
+    with rasterio.open(elevation_float) as elevation_dataset:
+        elevation_row, elevation_column = calculate_grid_offset(direction_dataset, elevation_dataset)
+        elevation_array = read_halo_block(elevation_dataset, elevation_row, elevation_column,
+                                          direction_dataset.height, direction_dataset.width, 0)
+    elevation_array[direction_dataset.read_masks(1) == 0] = np.nan
+    elevation_flat = elevation_array.reshape(-1)
+
+    # Define the area within the direction grid and the output profile
+    area_dataset = rasterio.open(area_raster)
+    area_row, area_column = calculate_grid_offset(area_dataset, direction_dataset)
+    row_start = max(area_row, 0)
+    row_end = min(area_row + area_dataset.height, direction_dataset.height)
+    column_start = max(area_column, 0)
+    column_end = min(area_column + area_dataset.width, direction_dataset.width)
+    direction_window = (slice(row_start, row_end), slice(column_start, column_end))
+    area_window = (slice(row_start - area_row, row_end - area_row),
+                   slice(column_start - area_column, column_end - area_column))
+    area_mask = area_dataset.read_masks(1) == 0
+    output_profile = area_dataset.profile.copy()
+    output_profile.update(driver='GTiff', dtype='int16', nodata=-32768, count=1,
+                          tiled=True, blockxsize=256, blockysize=256, BIGTIFF='IF_SAFER')
+
+    # Calculate hydrographic position for each flowline raster
+    for flowline_raster, search_distance, output_raster in flowline_list:
+        print(f'\t\tCalculating height above nearest drainage for {flowline_raster}...')
+        with rasterio.open(flowline_raster) as flowline_dataset:
+            flowline_row, flowline_column = calculate_grid_offset(direction_dataset, flowline_dataset)
+            flowline_array = read_halo_block(flowline_dataset, flowline_row, flowline_column,
+                                             direction_dataset.height, direction_dataset.width, 0)
+        source_flat = (~np.isnan(flowline_array) & ~np.isnan(elevation_array)).reshape(-1)
+
+        # Pass drainage elevation from flowline cells upstream in reverse topological order
+        drainage_flat = np.full(elevation_flat.shape, np.nan)
+        for level_start, level_end in zip(level_offsets[-2::-1], level_offsets[:0:-1]):
+            level_cells = cell_order[level_start:level_end]
+            level_receivers = receiver_flat[level_cells]
+            level_drainage = np.where(level_receivers >= 0, drainage_flat[level_receivers], np.nan)
+            drainage_flat[level_cells] = np.where(source_flat[level_cells], elevation_flat[level_cells],
+                                                  level_drainage)
+        drainage_array = drainage_flat.reshape(elevation_array.shape)
+
+        # Calculate hydrographic position and control for excessively high values
+        position_array = (elevation_array - drainage_array) * (elevation_array - drainage_array) * 100
+        with np.errstate(invalid='ignore'):
+            position_array = np.where(position_array < 32000, np.trunc(position_array + 0.5), 32000)
+
+        # Restrict results to search distance if supplied
+        if search_distance is not None:
+            distance_array = calculate_nearest_source(source_flat.reshape(elevation_array.shape), cell_size)[0]
+            position_array[distance_array > search_distance] = 32000
+
+        # Convert no data to maximum and extract to area
+        integer_array = np.full(area_mask.shape, 32000, dtype=np.int16)
+        integer_array[area_window] = np.nan_to_num(position_array[direction_window], nan=32000)
+        integer_array[area_mask] = -32768
+        with rasterio.open(output_raster, 'w', **output_profile) as output_dataset:
+            output_dataset.write(integer_array, 1)
+
+    # Close datasets
+    area_dataset.close()
+    direction_dataset.close()
@@ -2,13 +2,14 @@
 # ---------------------------------------------------------------------------
 # Calculate heat load index
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
+# Last Updated: 2026-10-17
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
 # Description: "Calculate heat load index" is a function that calculates an index of solar heat. This function is adapted from Geomorphometry and Gradient Metrics Toolbox 2.0 by Jeff Evans and Jim Oakleaf (2014) available at https://github.com/jeffreyevans/GradientMetrics.
 # ---------------------------------------------------------------------------
 
 # Define function to calculate heat load index
-def calculate_heat_load(area_raster, elevation_float, slope_float, aspect_float, conversion_factor, heatload_output):
+def calculate_heat_load(area_raster, elevation_float, slope_float, aspect_float, conversion_factor, heatload_output,
+                        slope_factor=1, aspect_factor=1, processing_factor='50%', scratch_workspace=None):
     """
     Description: calculates 16-bit signed heat load index
     Inputs: 'area_raster' -- a raster of the study area to set snap raster and extract area
@@ -17,8 +18,12 @@ def calculate_heat_load(area_raster, elevation_float, slope_float, aspect_float,
             'aspect_float' -- an input float aspect raster in degrees
             'conversion_factor' -- an integer to be multiplied with the output for conversion to integer raster
             'heatload_output' -- a file path for an output heat load index raster
+            'slope_factor' -- an optional integer that the slope raster was multiplied by if it is stored as a scaled integer raster (defaults to 1)
+            'aspect_factor' -- an optional integer that the aspect raster was multiplied by if it is stored as a scaled integer raster (defaults to 1)
+            'processing_factor' -- an optional string value for the arcpy parallel processing factor, such as a share of the cores divided among tasks that run at the same time (defaults to '50%')
+            'scratch_workspace' -- an optional folder for temporary arcpy datasets that must not be shared with tasks that run at the same time (defaults to the current scratch workspace)
     Returned Value: Returns a raster dataset on disk
-    Preconditions: requires input elevation, slope, and aspects rasters
+    Preconditions: requires input elevation, slope, and aspects rasters; uses the latitude of the middle of the extent for every cell, whereas the numpy engine in calculate_terrain_rasters uses the latitude of each cell
     """
 
     # Import packages
@@ -36,7 +41,11 @@ def calculate_heat_load(area_raster, elevation_float, slope_float, aspect_float,
     arcpy.env.overwriteOutput = True
 
     # Specify core usage
-    arcpy.env.parallelProcessingFactor = '50%'
+    arcpy.env.parallelProcessingFactor = processing_factor
+
+    # Set scratch workspace if supplied
+    if scratch_workspace is not None:
+        arcpy.env.scratchWorkspace = scratch_workspace
 
     # Set snap raster and extent
     arcpy.env.snapRaster = area_raster
@@ -46,18 +55,21 @@ def calculate_heat_load(area_raster, elevation_float, slope_float, aspect_float,
     cell_size = arcpy.management.GetRasterProperties(elevation_float, 'CELLSIZEX', '').getOutput(0)
     arcpy.env.cellSize = int(cell_size)
 
-    # Calculate middle latitude of extent
+    # Calculate geographic latitude of the middle of the extent
     print('\t\tCalculating raster properties...')
     grid_extent = Raster(elevation_float).extent
-    middle_latitude = (grid_extent.YMin + grid_extent.YMax) / 2
+    middle_point = arcpy.PointGeometry(arcpy.Point((grid_extent.XMin + grid_extent.XMax) / 2,
+                                                   (grid_extent.YMin + grid_extent.YMax) / 2),
+                                       grid_extent.spatialReference)
+    middle_latitude = middle_point.projectAs(arcpy.SpatialReference(4326)).firstPoint.Y
     middle_radian = middle_latitude * 0.0174533
     cos_latitude = math.cos(middle_radian)
     sin_latitude = math.sin(middle_radian)
 
     # Convert degrees to radians
     print('\t\tConverting degrees to radians...')
-    slope_radian = Raster(slope_float) * 0.0174533
-    aspect_radian = Raster(aspect_float) * 0.0174533
+    slope_radian = Raster(slope_float) * (0.0174533 / slope_factor)
+    aspect_radian = Raster(aspect_float) * (0.0174533 / aspect_factor)
 
     # Calculate heat load index
     print('\t\tCalculating heat load index...')
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Calculate hydrographic rasters
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy and rasterio.
+# Description: "Calculate hydrographic rasters" is a function that calculates 16-bit signed hydrographic position for one or more flowline rasters in a single pass over a float elevation raster, using one distance transform per flowline raster both to find the nearest flowline elevation and to restrict results to the search distance.
+# ---------------------------------------------------------------------------
+
+# Define function to calculate hydrographic position from flowline rasters
+def calculate_hydrographic_rasters(area_raster, elevation_float, flowline_list):
+    """
+    Description: calculates hydrographic position as the squared vertical difference between landscape elevation and the elevation of the nearest flowline cell
+    Inputs: 'area_raster' -- a raster of the study area that defines the output grid and extract area
+            'elevation_float' -- an input float elevation raster aligned to the area raster
+            'flowline_list' -- a list of tuples of flowline raster, search distance in the horizontal units or None for no limit, and output raster, where flowline cells are any cells with data
+    Returned Value: Returns a 16-bit signed raster on disk for each flowline raster with values of 100 times the squared vertical difference capped at 32000, and 32000 beyond the search distance
+    Preconditions: requires rasters with the same cell size and cell alignment as the area raster and memory for the area grid; the search distance is measured between cell centers rather than from the flowline geometry
+    """
+
+    # Import packages
+    import numpy as np
+    import rasterio
+    from package_Geomorphometry.calculateGridOffset import calculate_grid_offset
+    from package_Geomorphometry.calculateNearestSource import calculate_nearest_source
+    from package_Geomorphometry.readHaloBlock import read_halo_block
+
+    # Extract elevation to the area raster
+    print('\t\tExtracting elevation raster...')
+    area_dataset = rasterio.open(area_raster)
+    area_mask = area_dataset.read_masks(1) == 0
+    with rasterio.open(elevation_float) as elevation_dataset:
+        cell_size = elevation_dataset.res[0]
+        elevation_row, elevation_column = calculate_grid_offset(area_dataset, elevation_dataset)
+        elevation_array = read_halo_block(elevation_dataset, elevation_row, elevation_column,
+                                          area_dataset.height, area_dataset.width, 0)
+    elevation_array[area_mask] = np.nan
+
+    # Define output profile
+    output_profile = area_dataset.profile.copy()
+    output_profile.update(driver='GTiff', dtype='int16', nodata=-32768, count=1,
+                          tiled=True, blockxsize=256, blockysize=256, BIGTIFF='IF_SAFER')
+
+    # Calculate hydrographic position for each flowline raster
+    for flowline_raster, search_distance, output_raster in flowline_list:
+        print(f'\t\tCalculating hydrographic position for {flowline_raster}...')
+        with rasterio.open(flowline_raster) as flowline_dataset:
+            flowline_row, flowline_column = calculate_grid_offset(area_dataset, flowline_dataset)
+            flowline_array = read_halo_block(flowline_dataset, flowline_row, flowline_column,
+                                             area_dataset.height, area_dataset.width, 0)
+        source_array = ~np.isnan(flowline_array) & ~np.isnan(elevation_array)
+
+        # Find the nearest flowline cell and its elevation
+        distance_array, source_row, source_column = calculate_nearest_source(source_array, cell_size)
+        if source_row.min() < 0:
+            flowline_elevation = np.full(elevation_array.shape, np.nan)
+        else:
+            flowline_elevation = elevation_array[source_row, source_column]
+
+        # Calculate hydrographic position and control for excessively high values
+        position_array = (elevation_array - flowline_elevation) * (elevation_array - flowline_elevation) * 100
+        with np.errstate(invalid='ignore'):
+            integer_array = np.where(position_array < 32000, np.trunc(position_array + 0.5), 32000)
+
+        # Restrict results to search distance, convert no data to maximum, and extract to area
+        integer_array[np.isnan(position_array)] = 32000
+        if search_distance is not None:
+            integer_array[distance_array > search_distance] = 32000
+        integer_array[area_mask] = -32768
+        with rasterio.open(output_raster, 'w', **output_profile) as output_dataset:
+            output_dataset.write(integer_array.astype(np.int16), 1)
+
+    # Close area dataset
+    area_dataset.close()
@@ -8,12 +8,15 @@
 # ---------------------------------------------------------------------------
 
 # Define function to calculate integer elevation
-def calculate_integer_elevation(area_raster, elevation_float, elevation_integer):
+def calculate_integer_elevation(area_raster, elevation_float, elevation_integer,
+                                processing_factor='50%', scratch_workspace=None):
     """
     Description: calculates 16-bit signed elevation
     Inputs: 'area_raster' -- a raster of the study area to set snap raster and extract area
             'elevation_float' -- an input float elevation raster
             'elevation_integer' -- a file path for an output integer elevation raster
+            'processing_factor' -- an optional string value for the arcpy parallel processing factor, such as a share of the cores divided among tasks that run at the same time (defaults to '50%')
+            'scratch_workspace' -- an optional folder for temporary arcpy datasets that must not be shared with tasks that run at the same time (defaults to the current scratch workspace)
     Returned Value: Returns a raster dataset on disk
     Preconditions: requires float input elevation raster
     """
@@ -28,7 +31,11 @@ def calculate_integer_elevation(area_raster, elevation_float, elevation_integer)
     arcpy.env.overwriteOutput = True
 
     # Specify core usage
-    arcpy.env.parallelProcessingFactor = '50%'
+    arcpy.env.parallelProcessingFactor = processing_factor
+
+    # Set scratch workspace if supplied
+    if scratch_workspace is not None:
+        arcpy.env.scratchWorkspace = scratch_workspace
 
     # Set snap raster and extent
     arcpy.env.snapRaster = area_raster
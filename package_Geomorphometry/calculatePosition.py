@@ -2,23 +2,88 @@
 # ---------------------------------------------------------------------------
 # Calculate topographic position
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
+# Last Updated: 2026-10-17
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation for a single width, or in a Python 3.7+ distribution with numpy and rasterio 1.4+ for a list of widths.
 # Description: "Calculate topographic position" is a function that calculates a continuous index of topographic position using a user-defined window, ideally of multiple kilometers. This function is adapted from Geomorphometry and Gradient Metrics Toolbox 2.0 by Jeff Evans and Jim Oakleaf (2014) available at https://github.com/jeffreyevans/GradientMetrics.
 # ---------------------------------------------------------------------------
 
 # Define function to calculate topographic position
-def calculate_position(area_raster, elevation_float, position_width, position_output):
+def calculate_position(area_raster, elevation_float, position_width, position_output, block_size=1024,
+                       processing_factor='50%', scratch_workspace=None):
     """
-    Description: calculates 16-bit signed topographic position
+    Description: calculates 16-bit signed topographic position at one or more neighborhood widths
     Inputs: 'area_raster' -- a raster of the study area to set snap raster and extract area
             'elevation_float' -- an input float elevation raster
-            'position_width' -- a length in meters to define the axis length for a neighborhood square
-            'position_output' -- a file path for an output topographic position raster
-    Returned Value: Returns a raster dataset on disk
-    Preconditions: requires an input elevation raster
+            'position_width' -- a length in meters to define the axis length for a neighborhood square, or a list of lengths to calculate multiple scales in one sweep
+            'position_output' -- a file path for an output topographic position raster, or a list of file paths in the order of the widths
+            'block_size' -- an integer number of rows and columns per processing block when a list of widths is supplied
+            'processing_factor' -- an optional string value for the arcpy parallel processing factor, such as a share of the cores divided among tasks that run at the same time (defaults to '50%')
+            'scratch_workspace' -- an optional folder for temporary arcpy datasets that must not be shared with tasks that run at the same time (defaults to the current scratch workspace)
+    Returned Value: Returns a raster dataset on disk for each width
+    Preconditions: requires an input elevation raster; multiple widths require the elevation raster to share cell size and alignment with the area raster
     """
 
+    # Calculate every scale from shared summed-area tables if a list of widths is supplied
+    if isinstance(position_width, (list, tuple)):
+        # Import packages
+        import numpy as np
+        import rasterio
+        from rasterio.windows import Window
+        from package_Geomorphometry.calculateGridOffset import calculate_grid_offset
+        from package_Geomorphometry.generateBlockWindows import generate_block_windows
+        from package_Geomorphometry.readHaloBlock import read_halo_block
+        from package_Geomorphometry.summedAreaStatistics import summed_area_statistics
+
+        # Check that there is one output per width
+        if len(position_width) != len(position_output):
+            raise ValueError('A position output must be supplied for each position width.')
+
+        # Open input datasets
+        area_dataset = rasterio.open(area_raster)
+        elevation_dataset = rasterio.open(elevation_float)
+        elevation_row, elevation_column = calculate_grid_offset(area_dataset, elevation_dataset)
+
+        # Determine neighborhood sizes and a halo of half the largest neighborhood
+        cell_size = elevation_dataset.res[0]
+        axis_lengths = [int(width / float(cell_size)) for width in position_width]
+        halo = max(axis_lengths) // 2
+
+        # Read the elevation mean from the raster statistics to center the focal means of every block
+        reference = elevation_dataset.stats(indexes=1, approx=True)[0].mean
+
+        # Create output rasters with the area grid
+        output_profile = area_dataset.profile.copy()
+        output_profile.update(driver='GTiff', dtype='int16', nodata=-32768, count=1,
+                              tiled=True, blockxsize=256, blockysize=256, BIGTIFF='IF_SAFER')
+        output_datasets = [rasterio.open(output, 'w', **output_profile) for output in position_output]
+
+        # Calculate topographic position for all widths from one read of each elevation block
+        print(f'\t\tCalculating topographic position at {len(axis_lengths)} scales...')
+        for row_offset, column_offset, block_height, block_width in generate_block_windows(area_dataset.height,
+                                                                                           area_dataset.width,
+                                                                                           block_size):
+            block_window = Window(column_offset, row_offset, block_width, block_height)
+            area_mask = np.ma.getmaskarray(area_dataset.read(1, window=block_window, masked=True))
+            elevation_block = read_halo_block(elevation_dataset,
+                                              elevation_row + row_offset,
+                                              elevation_column + column_offset,
+                                              block_height, block_width, halo)
+            interior = (slice(halo, halo + block_height), slice(halo, halo + block_width))
+            focal_means = summed_area_statistics(elevation_block, axis_lengths, 'MEAN', reference)
+            for focal_mean, output_dataset in zip(focal_means, output_datasets):
+                with np.errstate(invalid='ignore'):
+                    integer_block = np.trunc((elevation_block - focal_mean)[interior] + 0.5)
+                integer_block = np.clip(integer_block, -32767, 32767)
+                integer_block[np.isnan(integer_block) | area_mask] = -32768
+                output_dataset.write(integer_block.astype(np.int16), 1, window=block_window)
+
+        # Close datasets
+        for output_dataset in output_datasets:
+            output_dataset.close()
+        area_dataset.close()
+        elevation_dataset.close()
+        return
+
     # Import packages
     import arcpy
     from arcpy.sa import ExtractByMask
@@ -31,7 +96,11 @@ def calculate_position(area_raster, elevation_float, position_width, position_ou
     arcpy.env.overwriteOutput = True
 
     # Specify core usage
-    arcpy.env.parallelProcessingFactor = '50%'
+    arcpy.env.parallelProcessingFactor = processing_factor
+
+    # Set scratch workspace if supplied
+    if scratch_workspace is not None:
+        arcpy.env.scratchWorkspace = scratch_workspace
 
     # Set snap raster and extent
     arcpy.env.snapRaster = area_raster
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Calculate quadratic coefficients
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy.
+# Description: "Calculate quadratic coefficients" is a function that fits a quadratic surface to the 3 x 3 neighborhood of every cell with a fixed set of least squares kernels following Evans (1980) and Wood (1996), so that slope, aspect, and curvature can all be derived from one fit.
+# ---------------------------------------------------------------------------
+
+# Define function to calculate the coefficients of a local quadratic surface
+def calculate_quadratic_coefficients(elevation_array, cell_size):
+    """
+    Description: calculates the six coefficients of z = ax² + by² + cxy + dx + ey + f fitted to the 3 x 3 neighborhood of each cell, with x increasing east and y increasing north
+    Inputs: 'elevation_array' -- a two-dimensional float array of elevation with no data as NaN
+            'cell_size' -- the cell size of the elevation array in the horizontal units
+    Returned Value: Returns a tuple of six float arrays with the shape of the elevation array for the coefficients a, b, c, d, e, and f
+    Preconditions: cells on the array edge or next to no data are NaN, so arrays should be read with a halo of at least one cell; d and e are the first derivatives and 2a, 2b, and c are the second derivatives of elevation
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Define integer kernels and denominators of the least squares fit in row order from north to south
+    cell_size = float(cell_size)
+    kernel_list = [(np.array([[1, -2, 1], [1, -2, 1], [1, -2, 1]]), 6 * cell_size ** 2),
+                   (np.array([[1, 1, 1], [-2, -2, -2], [1, 1, 1]]), 6 * cell_size ** 2),
+                   (np.array([[-1, 0, 1], [0, 0, 0], [1, 0, -1]]), 4 * cell_size ** 2),
+                   (np.array([[-1, 0, 1], [-1, 0, 1], [-1, 0, 1]]), 6 * cell_size),
+                   (np.array([[1, 1, 1], [0, 0, 0], [-1, -1, -1]]), 6 * cell_size),
+                   (np.array([[-1, 2, -1], [2, 5, 2], [-1, 2, -1]]), 9)]
+
+    # Define shifted views of the 3 x 3 neighborhood from a single padded copy
+    rows, columns = elevation_array.shape
+    padded_elevation = np.pad(elevation_array, 1, constant_values=np.nan)
+    neighbor_list = [padded_elevation[row_index:row_index + rows, column_index:column_index + columns]
+                     for row_index in range(3) for column_index in range(3)]
+
+    # Apply each kernel to the neighborhood
+    coefficient_list = []
+    for kernel, denominator in kernel_list:
+        coefficient = np.zeros((rows, columns), dtype=np.float64)
+        for weight, neighbor in zip(kernel.reshape(-1).tolist(), neighbor_list):
+            if weight != 0:
+                coefficient += weight * neighbor
+        coefficient_list.append(coefficient / denominator)
+
+    return tuple(coefficient_list)
@@ -2,19 +2,23 @@
 # ---------------------------------------------------------------------------
 # Calculate topographic radiation
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
+# Last Updated: 2026-10-17
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
 # Description: "Calculate topographic radiation" is a function that calculates a continuous index of topographic radiation using a 5x5 cell window from the coolest and wettest NNE aspects to the hottest and dryest SSW aspects. This function is adapted from Geomorphometry and Gradient Metrics Toolbox 2.0 by Jeff Evans and Jim Oakleaf (2014) available at https://github.com/jeffreyevans/GradientMetrics.
 # ---------------------------------------------------------------------------
 
 # Define function to calculate topographic radiation
-def calculate_radiation(area_raster, aspect_float, conversion_factor, radiation_output):
+def calculate_radiation(area_raster, aspect_float, conversion_factor, radiation_output, aspect_factor=1,
+                        processing_factor='50%', scratch_workspace=None):
     """
     Description: calculates 16-bit signed topographic radiation
     Inputs: 'area_raster' -- a raster of the study area to set snap raster and extract area
             'aspect_float' -- an input float aspect raster in degrees
             'conversion_factor' -- an integer to be multiplied with the output for conversion to integer raster
             'radiation_output' -- an output topographic radiation raster
+            'aspect_factor' -- an optional integer that the aspect raster was multiplied by if it is stored as a scaled integer raster (defaults to 1)
+            'processing_factor' -- an optional string value for the arcpy parallel processing factor, such as a share of the cores divided among tasks that run at the same time (defaults to '50%')
+            'scratch_workspace' -- an optional folder for temporary arcpy datasets that must not be shared with tasks that run at the same time (defaults to the current scratch workspace)
     Returned Value: Returns a raster dataset on disk
     Preconditions: requires an input raw aspect raster
     """
@@ -31,7 +35,11 @@ def calculate_radiation(area_raster, aspect_float, conversion_factor, radiation_
     arcpy.env.overwriteOutput = True
 
     # Specify core usage
-    arcpy.env.parallelProcessingFactor = '50%'
+    arcpy.env.parallelProcessingFactor = processing_factor
+
+    # Set scratch workspace if supplied
+    if scratch_workspace is not None:
+        arcpy.env.scratchWorkspace = scratch_workspace
 
     # Set snap raster and extent
     arcpy.env.snapRaster = area_raster
@@ -43,7 +51,7 @@ def calculate_radiation(area_raster, aspect_float, conversion_factor, radiation_
 
     # Convert degrees to radians
     print('\t\tConverting degrees to radians...')
-    aspect_radian = Raster(aspect_float) * 0.0174533
+    aspect_radian = Raster(aspect_float) * (0.0174533 / aspect_factor)
 
     # Calculate topographic radiation
     print('\t\tCalculating topographic radiation aspect index...')
@@ -8,13 +8,16 @@
 # ---------------------------------------------------------------------------
 
 # Define function to calculate roughness
-def calculate_roughness(area_raster, elevation_float, conversion_factor, roughness_output):
+def calculate_roughness(area_raster, elevation_float, conversion_factor, roughness_output,
+                        processing_factor='50%', scratch_workspace=None):
     """
     Description: calculates 16-bit signed roughness
     Inputs: 'area_raster' -- a raster of the study area to set snap raster and extract area
             'elevation_float' -- an input float elevation raster
             'conversion_factor' -- an integer to be multiplied with the output for conversion to integer raster
             'roughness_output' -- a file path for an output roughness raster
+            'processing_factor' -- an optional string value for the arcpy parallel processing factor, such as a share of the cores divided among tasks that run at the same time (defaults to '50%')
+            'scratch_workspace' -- an optional folder for temporary arcpy datasets that must not be shared with tasks that run at the same time (defaults to the current scratch workspace)
     Returned Value: Returns a raster dataset on disk
     Preconditions: requires an input elevation raster
     """
@@ -34,7 +37,11 @@ def calculate_roughness(area_raster, elevation_float, conversion_factor, roughne
     arcpy.env.overwriteOutput = True
 
     # Specify core usage
-    arcpy.env.parallelProcessingFactor = '50%'
+    arcpy.env.parallelProcessingFactor = processing_factor
+
+    # Set scratch workspace if supplied
+    if scratch_workspace is not None:
+        arcpy.env.scratchWorkspace = scratch_workspace
 
     # Set snap raster and extent
     arcpy.env.snapRaster = area_raster
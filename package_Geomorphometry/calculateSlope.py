@@ -2,13 +2,14 @@
 # ---------------------------------------------------------------------------
 # Calculate slope
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
+# Last Updated: 2026-10-17
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
 # Description: "Calculate slope" is a function that calculates float and integer slope in degrees.
 # ---------------------------------------------------------------------------
 
 # Define function to calculate slope
-def calculate_slope(area_raster, elevation_float, z_unit, slope_float, slope_integer):
+def calculate_slope(area_raster, elevation_float, z_unit, slope_float, slope_integer, intermediate_factor=None,
+                    processing_factor='50%', scratch_workspace=None):
     """
     Description: calculates 32-bit float slope and 16-bit signed slope
     Inputs: 'area_raster' -- a raster of the study area to set snap raster and extract area
@@ -16,8 +17,11 @@ def calculate_slope(area_raster, elevation_float, z_unit, slope_float, slope_int
             'z-unit' -- a string of the elevation unit
             'slope_raw' -- a file path for an output float slope raster in degrees
             'slope_output' -- a file path for an output integer slope raster in degrees
+            'intermediate_factor' -- an optional integer to store the float slope raster as a compressed 16-bit signed raster of slope multiplied by the factor, or None to store 32-bit float
+            'processing_factor' -- an optional string value for the arcpy parallel processing factor, such as a share of the cores divided among tasks that run at the same time (defaults to '50%')
+            'scratch_workspace' -- an optional folder for temporary arcpy datasets that must not be shared with tasks that run at the same time (defaults to the current scratch workspace)
     Returned Value: Returns a raster dataset on disk
-    Preconditions: requires float input elevation raster
+    Preconditions: requires float input elevation raster; functions that read a scaled slope raster must be given the same factor
     """
 
     # Import packages
@@ -31,7 +35,11 @@ def calculate_slope(area_raster, elevation_float, z_unit, slope_float, slope_int
     arcpy.env.overwriteOutput = True
 
     # Specify core usage
-    arcpy.env.parallelProcessingFactor = '50%'
+    arcpy.env.parallelProcessingFactor = processing_factor
+
+    # Set scratch workspace if supplied
+    if scratch_workspace is not None:
+        arcpy.env.scratchWorkspace = scratch_workspace
 
     # Set snap raster and extent
     arcpy.env.snapRaster = area_raster
@@ -63,21 +71,38 @@ def calculate_slope(area_raster, elevation_float, z_unit, slope_float, slope_int
     extract_integer = ExtractByMask(integer_raster, area_raster)
 
     # Export rasters
-    print('\t\tExporting slope as 32-bit float raster...')
-    arcpy.management.CopyRaster(slope_raster,
-                                slope_float,
-                                '',
-                                '0',
-                                '-2147483648',
-                                'NONE',
-                                'NONE',
-                                '32_BIT_FLOAT',
-                                'NONE',
-                                'NONE',
-                                'TIFF',
-                                'NONE',
-                                'CURRENT_SLICE',
-                                'NO_TRANSPOSE')
+    if intermediate_factor is None:
+        print('\t\tExporting slope as 32-bit float raster...')
+        arcpy.management.CopyRaster(slope_raster,
+                                    slope_float,
+                                    '',
+                                    '0',
+                                    '-2147483648',
+                                    'NONE',
+                                    'NONE',
+                                    '32_BIT_FLOAT',
+                                    'NONE',
+                                    'NONE',
+                                    'TIFF',
+                                    'NONE',
+                                    'CURRENT_SLICE',
+                                    'NO_TRANSPOSE')
+    else:
+        print(f'\t\tExporting slope multiplied by {intermediate_factor} as compressed 16-bit signed raster...')
+        scaled_raster = Int((slope_raster * intermediate_factor) + 0.5)
+        with arcpy.EnvManager(compression='LZW', tileSize='256 256'):
+            arcpy.management.CopyRaster(scaled_raster,
+                                        slope_float,
+                                        '',
+                                        '32767',
+                                        '-32768',
+                                        'NONE',
+                                        'NONE',
+                                        '16_BIT_SIGNED',
+                                        'NONE',
+                                        'NONE',
+                                        'TIFF',
+                                        'NONE')
     print('\t\tExporting slope as 16-bit integer raster...')
     arcpy.management.CopyRaster(extract_integer,
                                 slope_integer,
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Calculate Strahler order
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy.
+# Description: "Calculate Strahler order" is a function that calculates Strahler stream order over a stream network in topological order, equivalent to StreamOrder with the 'STRAHLER' option.
+# ---------------------------------------------------------------------------
+
+# Define function to calculate Strahler stream order
+def calculate_strahler_order(receiver_array, stream_array, flow_topology=None):
+    """
+    Description: calculates Strahler stream order by passing the order of each stream cell downstream level by level
+    Inputs: 'receiver_array' -- an int32 array of shape (1, rows, columns) with the flat index of the downstream cell or -1 from a D8 routing function in this package
+            'stream_array' -- a boolean array of shape (rows, columns) that is True for stream cells
+            'flow_topology' -- an optional tuple of cell order and level offsets from sort_flow_topology to reuse an existing sort of the receivers
+    Returned Value: Returns a uint8 array of shape (rows, columns) with the Strahler order of each stream cell and 0 elsewhere
+    Preconditions: stream cells without upstream stream cells are first order, and the order increases by one where two or more tributaries of the highest upstream order meet
+    """
+
+    # Import packages
+    import numpy as np
+    from package_Geomorphometry.sortFlowTopology import sort_flow_topology
+
+    # Sort cells from upstream to downstream
+    rows, columns = stream_array.shape
+    if flow_topology is None:
+        flow_topology = sort_flow_topology(receiver_array)
+    cell_order, level_offsets = flow_topology
+    receiver_flat = receiver_array.reshape(-1)
+    stream_flat = stream_array.reshape(-1)
+
+    # Track the highest upstream order and the number of tributaries with that order for each cell
+    order_array = np.zeros(rows * columns, dtype=np.uint8)
+    upstream_maximum = np.zeros(rows * columns, dtype=np.uint8)
+    upstream_count = np.zeros(rows * columns, dtype=np.uint8)
+
+    # Assign the order of each level of stream cells and pass it to downstream stream cells
+    for level_start, level_end in zip(level_offsets[:-1], level_offsets[1:]):
+        level_cells = cell_order[level_start:level_end]
+        level_cells = level_cells[stream_flat[level_cells]]
+        if level_cells.size == 0:
+            continue
+        level_maximum = upstream_maximum[level_cells]
+        level_order = np.where(upstream_count[level_cells] >= 2, level_maximum + 1, np.maximum(level_maximum, 1))
+        order_array[level_cells] = level_order
+
+        # Group tributaries by receiver
+        level_receivers = receiver_flat[level_cells]
+        keep = level_receivers >= 0
+        keep[keep] = stream_flat[level_receivers[keep]]
+        level_receivers = level_receivers[keep]
+        level_order = level_order[keep].astype(np.uint8)
+        if level_receivers.size == 0:
+            continue
+        sort_index = np.lexsort((level_order, level_receivers))
+        level_receivers = level_receivers[sort_index]
+        level_order = level_order[sort_index]
+        group_start = np.concatenate([[True], level_receivers[1:] != level_receivers[:-1]])
+        group_number = np.cumsum(group_start) - 1
+        group_end = np.concatenate([group_start[1:], [True]])
+        group_receivers = level_receivers[group_end]
+        group_maximum = level_order[group_end]
+        group_count = np.bincount(group_number[level_order == group_maximum[group_number]],
+                                  minlength=group_receivers.size).astype(np.uint8)
+
+        # Combine with tributaries passed from earlier levels
+        previous_maximum = upstream_maximum[group_receivers]
+        previous_count = upstream_count[group_receivers]
+        upstream_count[group_receivers] = np.where(group_maximum > previous_maximum, group_count,
+                                                   np.where(group_maximum == previous_maximum,
+                                                            previous_count + group_count, previous_count))
+        upstream_maximum[group_receivers] = np.maximum(previous_maximum, group_maximum)
+
+    return order_array.reshape(rows, columns)
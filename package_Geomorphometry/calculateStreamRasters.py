@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Calculate stream rasters
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy and rasterio, and fiona if lines are written.
+# Description: "Calculate stream rasters" is a function that fills a float elevation raster, routes D8 flow, accumulates flow, and orders the stream network in memory to write river and stream masks without arcpy. The filled elevation, flow direction, and flow accumulation can be cached so that thresholds can be changed without routing flow again.
+# ---------------------------------------------------------------------------
+
+# Define function to calculate river and stream masks
+def calculate_stream_rasters(area_raster, elevation_float, fill_value, threshold, river_raster, stream_raster,
+                             mask_raster=None, cache_dictionary=None, line_dictionary=None, conditioning='fill',
+                             breach_depth=3, breach_length=100):
+    """
+    Description: calculates river and stream mask rasters from D8 flow accumulation and Strahler stream order
+    Inputs: 'area_raster' -- a raster of the calculation area that defines the output grid and extract area
+            'elevation_float' -- an input float elevation raster aligned to the area raster
+            'fill_value' -- a value in the vertical units of the elevation raster to set as the fill limit
+            'threshold' -- flow accumulation threshold for minimum stream size
+            'river_raster' -- an output raster of cells with stream order greater than 3
+            'stream_raster' -- an output raster of cells with stream order of 3 or less
+            'mask_raster' -- an optional raster aligned to the area raster to which the stream order is extracted
+            'cache_dictionary' -- an optional dictionary with 'fill', 'direction', and 'accumulation' as keys and raster paths as values to read if they all exist or write otherwise
+            'line_dictionary' -- an optional dictionary with 'river' and 'stream' as keys and GeoPackage or GeoJSON paths as values to write flowlines traced along flow direction with Strahler order as the grid code
+            'conditioning' -- a string value of either 'fill' to fill depressions or 'breach' to breach depressions with least-cost paths before filling the depressions that remain
+            'breach_depth' -- a value in the vertical units for the maximum cut of a breach path (defaults to 3), or None for no limit
+            'breach_length' -- a length in the horizontal units for the maximum length of a breach path (defaults to 100), or None for no limit
+    Returned Value: Returns an 8-bit unsigned raster on disk for rivers and streams with a value of 1 for flowline cells and no data elsewhere, and a line file on disk for each key in the line dictionary
+    Preconditions: requires float input elevation raster with the same cell size and cell alignment as the area raster and memory for the area grid; cache paths must be unique to the elevation, area, fill value, and conditioning parameters because cached rasters are reused without checking their inputs
+    """
+
+    # Import packages
+    import numpy as np
+    import os
+    import rasterio
+    from package_Geomorphometry.accumulateFlow import accumulate_flow
+    from package_Geomorphometry.breachDepressions import breach_depressions
+    from package_Geomorphometry.calculateGridOffset import calculate_grid_offset
+    from package_Geomorphometry.calculateStrahlerOrder import calculate_strahler_order
+    from package_Geomorphometry.convertD8Receivers import convert_d8_receivers
+    from package_Geomorphometry.fillDepressions import fill_depressions
+    from package_Geomorphometry.readHaloBlock import read_halo_block
+    from package_Geomorphometry.routeD8 import route_d8
+    from package_Geomorphometry.sortFlowTopology import sort_flow_topology
+    from package_Geomorphometry.traceStreamLines import trace_stream_lines
+    from package_Geomorphometry.writeLineFeatures import write_line_features
+
+    # Define output grid
+    area_dataset = rasterio.open(area_raster)
+    output_profile = area_dataset.profile.copy()
+    output_profile.update(driver='GTiff', count=1, tiled=True, blockxsize=256, blockysize=256, BIGTIFF='IF_SAFER')
+
+    # Read cached flow direction and accumulation if they exist
+    if cache_dictionary is not None and all(os.path.exists(cache_dictionary[key])
+                                            for key in ['fill', 'direction', 'accumulation']):
+        print('\t\tReading cached flow direction and accumulation...')
+        with rasterio.open(cache_dictionary['direction']) as direction_dataset:
+            direction_array = direction_dataset.read(1)
+        with rasterio.open(cache_dictionary['accumulation']) as accumulation_dataset:
+            accumulation_array = accumulation_dataset.read(1, masked=True).filled(np.nan).astype(np.float64)
+        valid_array = ~np.isnan(accumulation_array)
+        direction_array[~valid_array] = 0
+        receiver_array = convert_d8_receivers(direction_array)
+        flow_topology = sort_flow_topology(receiver_array)
+    else:
+        # Extract elevation to the area raster
+        print('\t\tExtracting elevation raster...')
+        elevation_dataset = rasterio.open(elevation_float)
+        cell_size = elevation_dataset.res[0]
+        elevation_row, elevation_column = calculate_grid_offset(area_dataset, elevation_dataset)
+        elevation_array = read_halo_block(elevation_dataset, elevation_row, elevation_column,
+                                          area_dataset.height, area_dataset.width, 0).astype(np.float32)
+        elevation_array[area_dataset.read_masks(1) == 0] = np.nan
+        elevation_dataset.close()
+
+        # Breach elevation if requested
+        if conditioning == 'breach':
+            print('\t\tBreaching elevation raster...')
+            breach_cells = None if breach_length is None else int(breach_length / cell_size)
+            elevation_array = breach_depressions(elevation_array, breach_depth, breach_cells)
+
+        # Fill elevation
+        print('\t\tFilling elevation raster...')
+        fill_array = fill_depressions(elevation_array, fill_value, epsilon=True)
+        valid_array = ~np.isnan(fill_array)
+        del elevation_array
+
+        # Calculate flow direction and sort cells from upstream to downstream
+        print('\t\tCalculating flow direction...')
+        direction_array, receiver_array = route_d8(fill_array, cell_size)
+        flow_topology = sort_flow_topology(receiver_array)
+
+        # Calculate flow accumulation
+        print('\t\tCalculating flow accumulation...')
+        accumulation_array = accumulate_flow(receiver_array, flow_topology=flow_topology)
+
+        # Write cached rasters through temporary files so that an interrupted write is never reused
+        if cache_dictionary is not None:
+            print('\t\tCaching filled elevation, flow direction, and flow accumulation...')
+            for key, cache_array, cache_type, cache_nodata in [
+                    ('fill', fill_array, 'float32', -2147483648),
+                    ('direction', direction_array, 'uint8', 255),
+                    ('accumulation', accumulation_array, 'float32', -2147483648)]:
+                os.makedirs(os.path.dirname(cache_dictionary[key]), exist_ok=True)
+                cache_profile = output_profile.copy()
+                cache_profile.update(dtype=cache_type, nodata=cache_nodata)
+                temporary_raster = os.path.splitext(cache_dictionary[key])[0] + '_temporary.tif'
+                with rasterio.open(temporary_raster, 'w', **cache_profile) as cache_dataset:
+                    cache_dataset.write(np.where(valid_array, cache_array, cache_nodata).astype(cache_type), 1)
+                os.replace(temporary_raster, cache_dictionary[key])
+        del fill_array
+
+    # Apply threshold to the flow accumulation and calculate stream order
+    print('\t\tDefining stream order...')
+    stream_array = (accumulation_array >= threshold) & valid_array
+    order_array = calculate_strahler_order(receiver_array, stream_array, flow_topology)
+
+    # Extract stream order to mask raster if supplied
+    if mask_raster is not None:
+        with rasterio.open(mask_raster) as mask_dataset:
+            mask_row, mask_column = calculate_grid_offset(area_dataset, mask_dataset)
+            mask_array = read_halo_block(mask_dataset, mask_row, mask_column,
+                                         area_dataset.height, area_dataset.width, 0)
+        order_array[np.isnan(mask_array)] = 0
+
+    # Export river and stream masks
+    print('\t\tExporting river and stream rasters...')
+    output_profile.update(dtype='uint8', nodata=255)
+    for output_raster, output_mask in [(river_raster, order_array > 3),
+                                       (stream_raster, (order_array >= 1) & (order_array <= 3))]:
+        with rasterio.open(output_raster, 'w', **output_profile) as output_dataset:
+            output_dataset.write(np.where(output_mask, 1, 255).astype(np.uint8), 1)
+
+    # Trace river and stream lines if supplied
+    if line_dictionary is not None:
+        for key, minimum_order, maximum_order in [('river', 4, 255), ('stream', 1, 3)]:
+            if key in line_dictionary:
+                print(f'\t\tTracing {key} lines...')
+                line_generator = trace_stream_lines(receiver_array, order_array, area_dataset.transform,
+                                                    minimum_order, maximum_order)
+                write_line_features(line_generator, line_dictionary[key], area_dataset.crs)
+    area_dataset.close()
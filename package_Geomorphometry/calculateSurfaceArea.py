@@ -2,19 +2,23 @@
 # ---------------------------------------------------------------------------
 # Calculate surface area ratio
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
+# Last Updated: 2026-10-17
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
 # Description: "Calculate surface area ratio" is a function that calculates surface area ratio. This function is adapted from Geomorphometry and Gradient Metrics Toolbox 2.0 by Jeff Evans and Jim Oakleaf (2014) available at https://github.com/jeffreyevans/GradientMetrics.
 # ---------------------------------------------------------------------------
 
 # Define function to calculate surface area ratio
-def calculate_surface_area(area_raster, slope_float, conversion_factor, area_output):
+def calculate_surface_area(area_raster, slope_float, conversion_factor, area_output, slope_factor=1,
+                           processing_factor='50%', scratch_workspace=None):
     """
     Description: calculates 16-bit signed surface area ratio
     Inputs: 'area_raster' -- a raster of the study area to set snap raster and extract area
             'slope_float' -- an input float slope raster in degrees
             'conversion_factor' -- an integer to be multiplied with the output for conversion to integer raster
             'area_output' -- an output surface area ratio raster
+            'slope_factor' -- an optional integer that the slope raster was multiplied by if it is stored as a scaled integer raster (defaults to 1)
+            'processing_factor' -- an optional string value for the arcpy parallel processing factor, such as a share of the cores divided among tasks that run at the same time (defaults to '50%')
+            'scratch_workspace' -- an optional folder for temporary arcpy datasets that must not be shared with tasks that run at the same time (defaults to the current scratch workspace)
     Returned Value: Returns a raster dataset on disk
     Preconditions: requires an input float slope raster
     """
@@ -31,7 +35,11 @@ def calculate_surface_area(area_raster, slope_float, conversion_factor, area_out
     arcpy.env.overwriteOutput = True
 
     # Specify core usage
-    arcpy.env.parallelProcessingFactor = '50%'
+    arcpy.env.parallelProcessingFactor = processing_factor
+
+    # Set scratch workspace if supplied
+    if scratch_workspace is not None:
+        arcpy.env.scratchWorkspace = scratch_workspace
 
     # Set snap raster and extent
     arcpy.env.snapRaster = area_raster
@@ -46,7 +54,7 @@ def calculate_surface_area(area_raster, slope_float, conversion_factor, area_out
 
     # Convert degrees to radians
     print('\t\tConverting degrees to radians...')
-    slope_radian = Raster(slope_float) * 0.0174533
+    slope_radian = Raster(slope_float) * (0.0174533 / slope_factor)
 
     # Calculate surface area ratio
     print('\t\tCalculating surface area ratio...')
@@ -2,18 +2,22 @@
 # ---------------------------------------------------------------------------
 # Calculate surface relief ratio
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
+# Last Updated: 2026-10-17
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
-# Description: "Calculate surface relief ratio" is a function that calculates surface relief ratio using a 5x5 cell window. This function is adapted from Geomorphometry and Gradient Metrics Toolbox 2.0 by Jeff Evans and Jim Oakleaf (2014) available at https://github.com/jeffreyevans/GradientMetrics.
+# Description: "Calculate surface relief ratio" is a function that calculates surface relief ratio using a square cell window that defaults to 5x5 cells. This function is adapted from Geomorphometry and Gradient Metrics Toolbox 2.0 by Jeff Evans and Jim Oakleaf (2014) available at https://github.com/jeffreyevans/GradientMetrics.
 # ---------------------------------------------------------------------------
 
 # Define function to calculate surface relief ratio
-def calculate_surface_relief(area_raster, elevation_float, conversion_factor, relief_output):
+def calculate_surface_relief(area_raster, elevation_float, conversion_factor, relief_output, relief_width=5,
+                             processing_factor='50%', scratch_workspace=None):
     """
     Description: calculates 16-bit signed surface relief ratio
     Inputs: 'area_raster' -- a raster of the study area to set snap raster and extract area
             'elevation_float' -- an input float elevation raster
             'relief_output' -- an output surface relief ratio raster
+            'relief_width' -- an integer number of cells for the axis length of the neighborhood square
+            'processing_factor' -- an optional string value for the arcpy parallel processing factor, such as a share of the cores divided among tasks that run at the same time (defaults to '50%')
+            'scratch_workspace' -- an optional folder for temporary arcpy datasets that must not be shared with tasks that run at the same time (defaults to the current scratch workspace)
     Returned Value: Returns a raster dataset on disk
     Preconditions: requires an input elevation raster
     """
@@ -32,7 +36,11 @@ def calculate_surface_relief(area_raster, elevation_float, conversion_factor, re
     arcpy.env.overwriteOutput = True
 
     # Specify core usage
-    arcpy.env.parallelProcessingFactor = '50%'
+    arcpy.env.parallelProcessingFactor = processing_factor
+
+    # Set scratch workspace if supplied
+    if scratch_workspace is not None:
+        arcpy.env.scratchWorkspace = scratch_workspace
 
     # Set snap raster and extent
     arcpy.env.snapRaster = area_raster
@@ -43,7 +51,7 @@ def calculate_surface_relief(area_raster, elevation_float, conversion_factor, re
     arcpy.env.cellSize = int(cell_size)
 
     # Define a neighborhood variable
-    neighborhood = NbrRectangle(5, 5, "CELL")
+    neighborhood = NbrRectangle(relief_width, relief_width, "CELL")
 
     # Calculate focal minimum
     print('\t\tCalculating focal minimum...')
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Calculate terrain block
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy.
+# Description: "Calculate terrain block" is a function that calculates float topographic properties for a block of a float elevation raster from shared intermediates in memory. The formulas reproduce the arcpy functions in this package.
+# ---------------------------------------------------------------------------
+
+# Define function to calculate topographic properties for a block
+def calculate_terrain_block(elevation_block, accumulation_block, cell_size, position_cells, halo,
+                            latitude, derivatives, relief_cells=5, convergence=0, reference=None):
+    """
+    Description: calculates float topographic properties for the interior of an elevation block read with a halo
+    Inputs: 'elevation_block' -- a float array of elevation with no data as NaN that includes a halo on every side
+            'accumulation_block' -- a float array of flow accumulation aligned to the elevation block, or None if wetness is not requested
+            'cell_size' -- the cell size of the elevation raster in the horizontal units
+            'position_cells' -- an integer number of cells for the axis length of the topographic position neighborhood
+            'halo' -- the number of halo cells on each side of the block
+            'latitude' -- the latitude in degrees used by the heat load index as a single value or an array aligned to the elevation block
+            'derivatives' -- a list of topographic properties to return from 'elevation', 'slope', 'aspect', 'exposure', 'heat_load', 'position', 'radiation', 'roughness', 'surface_area', 'surface_relief', 'wetness', 'profile_curvature', 'plan_curvature', 'mean_curvature'
+            'relief_cells' -- an integer number of cells for the axis length of the surface relief neighborhood
+            'convergence' -- the grid azimuth of true north in degrees as a single value or an array aligned to the elevation block, which is subtracted from grid aspect to return geodesic aspect
+            'reference' -- an optional elevation on which to center the summed-area statistics, such as the mean of the elevation raster, that is shared by all blocks (defaults to the block mean)
+    Returned Value: Returns a dictionary of float arrays cropped to the block interior with no data as NaN
+    Preconditions: the halo must be at least half of the largest neighborhood width for results to match a whole-raster calculation; curvatures are in inverse horizontal units and follow the normal slope line, projected contour, and mean curvature definitions of Minár et al. (2020), with 0 where slope is 0; missing wetness is filled from the nearest valid cell only where that cell is within the halo distance, which matches a whole-raster fill, and other cells are left as no data for a whole-raster pass
+    """
+
+    # Import packages
+    import numpy as np
+    from package_Geomorphometry.calculateNearestSource import calculate_nearest_source
+    from package_Geomorphometry.calculateQuadraticCoefficients import calculate_quadratic_coefficients
+    from package_Geomorphometry.focalRelief import focal_relief
+    from package_Geomorphometry.summedAreaStatistics import summed_area_statistics
+
+    # Define interior of the block
+    rows, columns = elevation_block.shape
+    interior = (slice(halo, rows - halo), slice(halo, columns - halo))
+    cell_size = float(cell_size)
+    output_dictionary = dict()
+
+    # Calculate slope and geodesic aspect from a quadratic surface over the 3 x 3 neighborhood
+    surface_derivatives = ['slope', 'aspect', 'exposure', 'heat_load', 'radiation', 'surface_area', 'wetness',
+                           'profile_curvature', 'plan_curvature', 'mean_curvature']
+    if any(derivative in derivatives for derivative in surface_derivatives):
+        coefficient_a, coefficient_b, coefficient_c, gradient_x, gradient_y = \
+            calculate_quadratic_coefficients(elevation_block, cell_size)[0:5]
+        slope_degree = np.degrees(np.arctan(np.hypot(gradient_x, gradient_y)))
+        with np.errstate(invalid='ignore'):
+            aspect_degree = np.mod(np.degrees(np.arctan2(-gradient_x, -gradient_y)) - convergence, 360)
+            aspect_degree = np.where((gradient_x == 0) & (gradient_y == 0), -1, aspect_degree)
+        slope_radian = slope_degree * 0.0174533
+        aspect_radian = aspect_degree * 0.0174533
+
+    # Calculate curvatures from the second derivatives of the quadratic surface
+    if any(derivative in derivatives for derivative in ['profile_curvature', 'plan_curvature', 'mean_curvature']):
+        second_xx = 2 * coefficient_a
+        second_yy = 2 * coefficient_b
+        second_xy = coefficient_c
+        gradient_squared = gradient_x * gradient_x + gradient_y * gradient_y
+        surface_factor = 1 + gradient_squared
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if 'profile_curvature' in derivatives:
+                profile = -((second_xx * gradient_x * gradient_x + 2 * second_xy * gradient_x * gradient_y
+                             + second_yy * gradient_y * gradient_y)
+                            / (gradient_squared * np.sqrt(surface_factor ** 3)))
+                output_dictionary['profile_curvature'] = np.where(gradient_squared == 0, 0, profile)[interior]
+            if 'plan_curvature' in derivatives:
+                plan = -((second_xx * gradient_y * gradient_y - 2 * second_xy * gradient_x * gradient_y
+                          + second_yy * gradient_x * gradient_x)
+                         / np.sqrt(gradient_squared ** 3))
+                output_dictionary['plan_curvature'] = np.where(gradient_squared == 0, 0, plan)[interior]
+            if 'mean_curvature' in derivatives:
+                mean = -(((1 + gradient_y * gradient_y) * second_xx - 2 * gradient_x * gradient_y * second_xy
+                          + (1 + gradient_x * gradient_x) * second_yy)
+                         / (2 * np.sqrt(surface_factor ** 3)))
+                output_dictionary['mean_curvature'] = mean[interior]
+
+    # Calculate elevation
+    if 'elevation' in derivatives:
+        output_dictionary['elevation'] = elevation_block[interior]
+
+    # Store slope and aspect
+    if 'slope' in derivatives:
+        output_dictionary['slope'] = slope_degree[interior]
+    if 'aspect' in derivatives:
+        output_dictionary['aspect'] = aspect_degree[interior]
+
+    # Calculate solar exposure index
+    if 'exposure' in derivatives:
+        output_dictionary['exposure'] = (np.cos(aspect_radian - 3.31613) * slope_degree)[interior]
+
+    # Calculate heat load index
+    if 'heat_load' in derivatives:
+        latitude_radian = latitude * 0.0174533
+        cos_latitude = np.cos(latitude_radian)
+        sin_latitude = np.sin(latitude_radian)
+        modified_aspect = np.abs(3.141593 - np.abs(aspect_radian - 3.926991))
+        cos_slope = np.cos(slope_radian)
+        sin_slope = np.sin(slope_radian)
+        heat_load = np.exp(-1.467 + 1.582 * cos_latitude * cos_slope
+                           - 1.5 * np.cos(modified_aspect) * sin_slope * sin_latitude
+                           - 0.262 * sin_latitude * sin_slope
+                           + 0.607 * np.sin(modified_aspect) * sin_slope)
+        output_dictionary['heat_load'] = heat_load[interior]
+
+    # Calculate topographic radiation
+    if 'radiation' in derivatives:
+        radiation = np.where(aspect_radian < 0, 0.5, (1 - np.cos(aspect_radian - 0.523599)) / 2)
+        radiation[np.isnan(aspect_radian)] = np.nan
+        output_dictionary['radiation'] = radiation[interior]
+
+    # Calculate surface area ratio
+    if 'surface_area' in derivatives:
+        output_dictionary['surface_area'] = ((cell_size ** 2) / np.cos(slope_radian))[interior]
+
+    # Calculate roughness with null values converted to zero
+    if 'roughness' in derivatives:
+        standard_deviation = summed_area_statistics(elevation_block, 5, 'STD', reference)
+        roughness = np.nan_to_num(standard_deviation * standard_deviation, nan=0.0)
+        output_dictionary['roughness'] = roughness[interior]
+
+    # Calculate surface relief ratio from a fused focal minimum, maximum, and mean
+    if 'surface_relief' in derivatives:
+        focal_minimum, focal_maximum, focal_mean = focal_relief(elevation_block, relief_cells)
+        maximum_drop = focal_maximum - focal_minimum
+        with np.errstate(invalid='ignore', divide='ignore'):
+            relief = np.where(maximum_drop == 0, 0, (focal_mean - focal_minimum) / maximum_drop)
+        output_dictionary['surface_relief'] = relief[interior]
+
+    # Calculate topographic position
+    if 'position' in derivatives:
+        focal_mean = summed_area_statistics(elevation_block, position_cells, 'MEAN', reference)
+        output_dictionary['position'] = (elevation_block - focal_mean)[interior]
+
+    # Calculate topographic wetness and fill missing values from the nearest valid cell within the halo
+    if 'wetness' in derivatives:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            slope_tangent = np.where(slope_radian > 0, np.tan(slope_radian), 0.001)
+            slope_tangent[np.isnan(slope_radian)] = np.nan
+            wetness = np.log(((accumulation_block + 1) * cell_size) / slope_tangent)
+        wetness[np.isinf(wetness)] = np.nan
+        missing = np.isnan(wetness)
+        if missing[interior].any() and not missing.all():
+            distance, source_row, source_column = calculate_nearest_source(~missing)
+            wetness = np.where(distance <= halo, wetness[source_row, source_column], np.nan)
+        output_dictionary['wetness'] = wetness[interior]
+
+    return output_dictionary
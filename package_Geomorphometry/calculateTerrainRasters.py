@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Calculate terrain rasters
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy and rasterio 1.4+.
+# Description: "Calculate terrain rasters" is a function that calculates multiple 16-bit signed topographic properties in a single block-wise pass over a float elevation raster without arcpy.
+# ---------------------------------------------------------------------------
+
+# Define function to calculate topographic properties in a single pass
+def calculate_terrain_rasters(area_raster, elevation_float, flow_accumulation, position_width, output_dictionary,
+                              block_size=1024, relief_width=5):
+    """
+    Description: calculates 16-bit signed topographic properties reading each elevation block once and writing every output in the same pass
+    Inputs: 'area_raster' -- a raster of the study area that defines the output grid and extract area
+            'elevation_float' -- an input float elevation raster aligned to the area raster
+            'flow_accumulation' -- an input float flow accumulation raster aligned to the area raster, only read if wetness is requested
+            'position_width' -- a length in the horizontal units to define the axis length for the topographic position neighborhood
+            'output_dictionary' -- a dictionary with topographic property names as keys and tuples of output raster path and conversion factor as values
+            'block_size' -- an integer number of rows and columns per processing block
+            'relief_width' -- an integer number of cells for the axis length of the surface relief neighborhood
+    Returned Value: Returns a raster dataset on disk for each key in the output dictionary
+    Preconditions: requires float input elevation raster with the same cell size and cell alignment as the area raster and a defined coordinate reference system; aspect and the properties derived from it are geodesic and heat load uses the latitude of each cell; wetness that is missing farther than the halo from a valid cell is filled in a second pass over the affected blocks from the nearest cell with a value after the block pass, reading each block with a margin that doubles until it contains the nearest cell, so memory depends on the block size and the width of the gap rather than the raster size; summed-area statistics of every block are centered on the approximate elevation mean from the raster statistics so that blocks differ at seams only by floating-point rounding
+    """
+
+    # Import packages
+    import numpy as np
+    import os
+    import rasterio
+    from rasterio.windows import Window
+    from package_Geomorphometry.calculateGridConvergence import calculate_grid_convergence
+    from package_Geomorphometry.calculateGridOffset import calculate_grid_offset
+    from package_Geomorphometry.calculateNearestSource import calculate_nearest_source
+    from package_Geomorphometry.calculateTerrainBlock import calculate_terrain_block
+    from package_Geomorphometry.generateBlockWindows import generate_block_windows
+    from package_Geomorphometry.readHaloBlock import read_halo_block
+
+    # Define derivatives
+    derivatives = list(output_dictionary.keys())
+
+    # Open input datasets
+    area_dataset = rasterio.open(area_raster)
+    elevation_dataset = rasterio.open(elevation_float)
+    accumulation_dataset = None
+    if 'wetness' in derivatives:
+        accumulation_dataset = rasterio.open(flow_accumulation)
+
+    # Set cell size and calculate offsets of the area grid within the input grids
+    cell_size = elevation_dataset.res[0]
+    elevation_row, elevation_column = calculate_grid_offset(area_dataset, elevation_dataset)
+    if accumulation_dataset is not None:
+        accumulation_row, accumulation_column = calculate_grid_offset(area_dataset, accumulation_dataset)
+
+    # Determine neighborhood size and a halo of half the largest neighborhood so memory depends on block size
+    position_cells = int(position_width / float(cell_size))
+    halo = max(position_cells // 2, int(relief_width) // 2, 2)
+
+    # Read the elevation mean from the raster statistics to center the summed-area statistics of every block
+    reference = elevation_dataset.stats(indexes=1, approx=True)[0].mean
+
+    # Determine whether geodesic aspect or latitude are required
+    geodesic_derivatives = ['aspect', 'exposure', 'heat_load', 'radiation']
+    geodesic_required = any(derivative in derivatives for derivative in geodesic_derivatives)
+
+    # Create output rasters with the area grid
+    output_profile = area_dataset.profile.copy()
+    output_profile.update(driver='GTiff', dtype='int16', nodata=-32768, count=1,
+                          tiled=True, blockxsize=256, blockysize=256, BIGTIFF='IF_SAFER')
+    output_datasets = dict()
+    for derivative in derivatives:
+        output_datasets[derivative] = rasterio.open(output_dictionary[derivative][0], 'w', **output_profile)
+
+    # Create a temporary float wetness raster for cells that remain missing beyond the halo
+    wetness_dataset = None
+    missing_windows = []
+    if 'wetness' in derivatives:
+        wetness_float = os.path.splitext(output_dictionary['wetness'][0])[0] + '_Float.tif'
+        float_profile = output_profile.copy()
+        float_profile.update(dtype='float32', nodata=np.nan)
+        wetness_dataset = rasterio.open(wetness_float, 'w', **float_profile)
+
+    # Process each block
+    block_count = 1
+    block_total = int(np.ceil(area_dataset.height / block_size) * np.ceil(area_dataset.width / block_size))
+    for row_offset, column_offset, block_height, block_width in generate_block_windows(area_dataset.height,
+                                                                                       area_dataset.width,
+                                                                                       block_size):
+        print(f'\t\tProcessing block {block_count} of {block_total}...')
+        block_window = Window(column_offset, row_offset, block_width, block_height)
+        block_count += 1
+
+        # Read area mask
+        area_block = area_dataset.read(1, window=block_window, masked=True)
+        area_mask = np.ma.getmaskarray(area_block)
+        if area_mask.all():
+            for derivative in derivatives:
+                output_datasets[derivative].write(np.full((block_height, block_width), -32768, dtype=np.int16),
+                                                  1, window=block_window)
+            if wetness_dataset is not None:
+                wetness_dataset.write(np.full((block_height, block_width), np.nan, dtype=np.float32),
+                                      1, window=block_window)
+            continue
+
+        # Read elevation and flow accumulation with halo
+        elevation_block = read_halo_block(elevation_dataset,
+                                          elevation_row + row_offset,
+                                          elevation_column + column_offset,
+                                          block_height, block_width, halo)
+        accumulation_block = None
+        if accumulation_dataset is not None:
+            accumulation_block = read_halo_block(accumulation_dataset,
+                                                 accumulation_row + row_offset,
+                                                 accumulation_column + column_offset,
+                                                 block_height, block_width, halo)
+
+        # Calculate grid convergence and latitude lookup for the block
+        convergence_block = 0
+        latitude_block = None
+        if geodesic_required:
+            convergence_block, latitude_block = calculate_grid_convergence(elevation_dataset,
+                                                                           elevation_row + row_offset,
+                                                                           elevation_column + column_offset,
+                                                                           block_height, block_width, halo)
+
+        # Calculate topographic properties
+        property_dictionary = calculate_terrain_block(elevation_block, accumulation_block, cell_size,
+                                                      position_cells, halo, latitude_block, derivatives,
+                                                      relief_width, convergence_block, reference)
+
+        # Convert to integer, extract to area, and write each property
+        for derivative in derivatives:
+            conversion_factor = output_dictionary[derivative][1]
+            with np.errstate(invalid='ignore'):
+                integer_block = np.trunc(property_dictionary[derivative] * conversion_factor + 0.5)
+            integer_block = np.clip(integer_block, -32767, 32767)
+            integer_block[np.isnan(integer_block) | area_mask] = -32768
+            output_datasets[derivative].write(integer_block.astype(np.int16), 1, window=block_window)
+
+        # Store float wetness and record blocks with cells in the area that are still missing
+        if wetness_dataset is not None:
+            wetness_dataset.write(property_dictionary['wetness'].astype(np.float32), 1, window=block_window)
+            if np.isnan(property_dictionary['wetness'][~area_mask]).any():
+                missing_windows.append((row_offset, column_offset, block_height, block_width))
+
+    # Close datasets
+    for derivative in derivatives:
+        output_datasets[derivative].close()
+
+    # Fill wetness that remains missing block by block from a window that grows until it contains the nearest valid cell
+    if wetness_dataset is not None:
+        wetness_dataset.close()
+        if len(missing_windows) > 0:
+            print(f'\t\tFilling missing wetness values in {len(missing_windows)} blocks...')
+            raster_size = max(area_dataset.height, area_dataset.width)
+            with rasterio.open(wetness_float) as float_dataset, \
+                    rasterio.open(output_dictionary['wetness'][0], 'r+') as output_dataset:
+                for row_offset, column_offset, block_height, block_width in missing_windows:
+                    block_window = Window(column_offset, row_offset, block_width, block_height)
+                    area_mask = np.ma.getmaskarray(area_dataset.read(1, window=block_window, masked=True))
+                    search_distance = 2 * halo
+                    while True:
+                        wetness_block = read_halo_block(float_dataset, row_offset, column_offset,
+                                                        block_height, block_width, search_distance)
+                        interior = (slice(search_distance, search_distance + block_height),
+                                    slice(search_distance, search_distance + block_width))
+                        distance, source_row, source_column = calculate_nearest_source(~np.isnan(wetness_block))
+                        # Stop once every nearest cell is closer than any cell outside the window
+                        if distance[interior].max() <= search_distance or search_distance >= raster_size:
+                            break
+                        search_distance = min(2 * search_distance, raster_size)
+                    # Convert only the filled cells so that values written in the block pass are kept
+                    fill_mask = np.isnan(wetness_block[interior]) & ~area_mask & np.isfinite(distance[interior])
+                    filled_block = wetness_block[source_row[interior][fill_mask], source_column[interior][fill_mask]]
+                    del distance, source_row, source_column, wetness_block
+                    integer_block = output_dataset.read(1, window=block_window)
+                    integer_block[fill_mask] = np.clip(np.trunc(filled_block * output_dictionary['wetness'][1] + 0.5),
+                                                       -32767, 32767).astype(np.int16)
+                    output_dataset.write(integer_block, 1, window=block_window)
+        os.remove(wetness_float)
+    area_dataset.close()
+    elevation_dataset.close()
+    if accumulation_dataset is not None:
+        accumulation_dataset.close()
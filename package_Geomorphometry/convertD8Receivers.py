@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Convert D8 receivers
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy.
+# Description: "Convert D8 receivers" is a function that converts D8 flow direction codes to the flat indexes of the downstream cells so that a direction raster can be accumulated or ordered without recalculating flow direction.
+# ---------------------------------------------------------------------------
+
+# Define function to convert D8 flow direction codes to receiver indexes
+def convert_d8_receivers(direction_array):
+    """
+    Description: converts D8 flow direction codes to flat receiver indexes
+    Inputs: 'direction_array' -- a two-dimensional integer array of D8 flow direction codes (1 east, 2 southeast, 4 south, 8 southwest, 16 west, 32 northwest, 64 north, 128 northeast) with any other value for cells without a direction
+    Returned Value: Returns an int32 array of shape (1, rows, columns) with the flat index of the downstream cell or -1 where a cell has no direction or flows out of the array
+    Preconditions: requires a direction array with the same conventions as FlowDirection with the 'D8' option
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Define direction codes and neighbor shifts
+    code_list = [(1, 0, 1), (2, 1, 1), (4, 1, 0), (8, 1, -1), (16, 0, -1), (32, -1, -1), (64, -1, 0), (128, -1, 1)]
+
+    # Calculate receivers for each direction code
+    rows, columns = direction_array.shape
+    row_array, column_array = np.divmod(np.arange(rows * columns, dtype=np.int32).reshape(rows, columns), columns)
+    receiver_array = np.full((1, rows, columns), -1, dtype=np.int32)
+    for code, row_shift, column_shift in code_list:
+        selection = direction_array == code
+        receiver_row = row_array[selection] + row_shift
+        receiver_column = column_array[selection] + column_shift
+        inside = (receiver_row >= 0) & (receiver_row < rows) & (receiver_column >= 0) & (receiver_column < columns)
+        receiver_array[0][selection] = np.where(inside, receiver_row * columns + receiver_column, -1)
+
+    return receiver_array
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Fill depressions
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy and scipy.
+# Description: "Fill depressions" is a function that fills sinks in a float elevation array, equivalent to Fill with an optional z-limit, so that every cell drains to the edge of the data. Sinks are filled to the spill elevation of their drainage basin, which is solved on a graph of basins rather than cell by cell so that all steps run as vectorized or compiled operations.
+# ---------------------------------------------------------------------------
+
+# Define function to fill depressions from the spill elevations of drainage basins
+def fill_depressions(elevation_array, z_limit=None, epsilon=False):
+    """
+    Description: fills depressions in a float elevation array to the lowest elevation at which each cell can drain to the edge of the data
+    Inputs: 'elevation_array' -- a two-dimensional float array of elevation with no data stored as NaN
+            'z_limit' -- a value in the vertical units of the elevation array for the maximum depth of a sink that will be filled, or None to fill all sinks
+            'epsilon' -- a boolean value that raises filled cells and flats by the smallest representable increment per cell of distance from their outlet so that filled areas have no flats
+    Returned Value: Returns a float array of the same shape and float type as the elevation array with depressions filled and no data as NaN
+    Preconditions: cells on the array edge and cells adjacent to no data are outlets; sinks deeper than the z-limit are kept with their lowest cell as an outlet while shallower sinks inside them are filled; every cell belongs to the basin of the pit reached by steepest descent, and the filled elevation of a cell is the greater of its elevation and the minimax spill elevation of its basin along a minimum spanning tree of the basin graph, which is identical to a priority-flood; the whole array and its basin graph are held in memory at a peak of about 100 bytes per cell, so grids of several hundred million cells must be filled with Fill through the arcpy engine
+    """
+
+    # Import packages
+    import numpy as np
+    from scipy.ndimage import label
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import breadth_first_order
+    from scipy.sparse.csgraph import dijkstra
+    from scipy.sparse.csgraph import minimum_spanning_tree
+
+    # Create a flat copy of elevation
+    elevation_array = np.asarray(elevation_array)
+    if not np.issubdtype(elevation_array.dtype, np.floating):
+        elevation_array = elevation_array.astype(np.float64)
+    rows, columns = elevation_array.shape
+    cell_count = rows * columns
+    if cell_count >= 2 ** 31:
+        raise ValueError('Elevation array exceeds the number of cells addressable with int32 indexes')
+    value_type = elevation_array.dtype.type
+    valid_array = ~np.isnan(elevation_array)
+    index_array = np.arange(cell_count, dtype=np.int32).reshape(rows, columns)
+
+    # Define function to return the slices of cells and of their neighbors at a row and column shift
+    def shift_slices(row_shift, column_shift):
+        cell_slice = (slice(max(0, -row_shift), rows - max(0, row_shift)),
+                      slice(max(0, -column_shift), columns - max(0, column_shift)))
+        neighbor_slice = (slice(max(0, row_shift), rows - max(0, -row_shift)),
+                          slice(max(0, column_shift), columns - max(0, -column_shift)))
+        return cell_slice, neighbor_slice
+    neighbor_shifts = [(row_shift, column_shift) for row_shift in (-1, 0, 1) for column_shift in (-1, 0, 1)
+                       if row_shift != 0 or column_shift != 0]
+    forward_shifts = [(0, 1), (1, -1), (1, 0), (1, 1)]
+
+    # Identify outlets as valid cells on the array edge or adjacent to no data
+    edge_array = np.ones((rows, columns), dtype=bool)
+    edge_array[1:-1, 1:-1] = False
+    for row_shift, column_shift in neighbor_shifts:
+        cell_slice, neighbor_slice = shift_slices(row_shift, column_shift)
+        edge_array[cell_slice] |= ~valid_array[neighbor_slice]
+    edge_array &= valid_array
+
+    # Link each cell to its lowest neighbor that is strictly lower, so that outlets, pits, and flats are roots
+    receiver_array = index_array.copy()
+    lowest_array = elevation_array.copy()
+    for row_shift, column_shift in neighbor_shifts:
+        cell_slice, neighbor_slice = shift_slices(row_shift, column_shift)
+        with np.errstate(invalid='ignore'):
+            lower_array = elevation_array[neighbor_slice] < lowest_array[cell_slice]
+        lower_array &= ~edge_array[cell_slice]
+        lowest_array[cell_slice] = np.where(lower_array, elevation_array[neighbor_slice], lowest_array[cell_slice])
+        receiver_array[cell_slice] = np.where(lower_array, index_array[neighbor_slice], receiver_array[cell_slice])
+    del lowest_array, lower_array
+    receiver_flat = receiver_array.reshape(-1)
+
+    # Find the root of each cell by pointer jumping
+    root_flat = receiver_flat
+    while True:
+        next_flat = root_flat[root_flat]
+        if np.array_equal(next_flat, root_flat):
+            break
+        root_flat = next_flat
+    del next_flat, receiver_array, receiver_flat
+
+    # Number basins from the roots of pits and flats, where all outlets share basin zero
+    elevation_flat = elevation_array.reshape(-1)
+    valid_flat = valid_array.reshape(-1)
+    pit_roots = np.flatnonzero((root_flat == index_array.reshape(-1)) & valid_flat & ~edge_array.reshape(-1))
+    basin_count = pit_roots.shape[0] + 1
+    basin_lookup = np.zeros(cell_count, dtype=np.int32)
+    basin_lookup[pit_roots] = np.arange(1, basin_count, dtype=np.int32)
+    basin_flat = basin_lookup[root_flat]
+    basin_array = basin_flat.reshape(rows, columns)
+    del basin_lookup, root_flat
+
+    # Calculate the lowest spill elevation between each pair of adjacent basins
+    key_list = []
+    spill_list = []
+    for row_shift, column_shift in forward_shifts:
+        cell_slice, neighbor_slice = shift_slices(row_shift, column_shift)
+        pair_mask = (valid_array[cell_slice] & valid_array[neighbor_slice]
+                     & (basin_array[cell_slice] != basin_array[neighbor_slice]))
+        cell_basins = basin_array[cell_slice][pair_mask].astype(np.int64)
+        neighbor_basins = basin_array[neighbor_slice][pair_mask].astype(np.int64)
+        key_list.append(np.minimum(cell_basins, neighbor_basins) * basin_count
+                        + np.maximum(cell_basins, neighbor_basins))
+        spill_list.append(np.maximum(elevation_array[cell_slice][pair_mask],
+                                     elevation_array[neighbor_slice][pair_mask]))
+    pair_keys = np.concatenate(key_list)
+    spill_values = np.concatenate(spill_list)
+    del key_list, spill_list, cell_basins, neighbor_basins
+    pair_order = np.argsort(pair_keys)
+    pair_keys = pair_keys[pair_order]
+    spill_values = spill_values[pair_order]
+    first_mask = np.ones(pair_keys.shape[0], dtype=bool)
+    first_mask[1:] = pair_keys[1:] != pair_keys[:-1]
+    first_cells = np.flatnonzero(first_mask)
+    spill_values = np.minimum.reduceat(spill_values, first_cells)
+    pair_keys = pair_keys[first_cells]
+    low_basins = (pair_keys // basin_count).astype(np.int32)
+    high_basins = (pair_keys % basin_count).astype(np.int32)
+    del pair_order, pair_keys, first_mask, first_cells
+
+    # Rank spill elevations so that the spanning tree uses exact positive integer weights
+    pit_elevation = np.append(value_type(-np.inf), elevation_flat[pit_roots])
+    level_values, spill_ranks = np.unique(np.concatenate([spill_values, pit_elevation[1:]]), return_inverse=True)
+    spill_ranks = spill_ranks.astype(np.int64) + 1
+    pit_ranks = np.append(0, spill_ranks[spill_values.shape[0]:])
+    spill_ranks = spill_ranks[0:spill_values.shape[0]]
+    del spill_values
+
+    # Solve the spill level of each basin and reopen the lowest cell of sinks deeper than the z-limit as an outlet
+    outlet_basins = np.zeros(basin_count, dtype=bool)
+    outlet_basins[0] = True
+    structure = np.ones((3, 3), dtype=bool)
+    while True:
+        # Link reopened basins to the outlets at their pit elevation, lowering existing links because the sparse graph sums duplicate links
+        outlet_links = (low_basins == 0) & outlet_basins[high_basins]
+        link_ranks = np.where(outlet_links, np.minimum(spill_ranks, pit_ranks[high_basins]), spill_ranks)
+        linked_basins = np.zeros(basin_count, dtype=bool)
+        linked_basins[high_basins[low_basins == 0]] = True
+        linked_basins[0] = True
+        reopened_basins = np.flatnonzero(outlet_basins & ~linked_basins)
+
+        # Calculate the minimum spanning tree of the basin graph
+        basin_graph = csr_matrix((np.concatenate([link_ranks, pit_ranks[reopened_basins]]),
+                                  (np.concatenate([low_basins, np.zeros(reopened_basins.shape, dtype=np.int32)]),
+                                   np.concatenate([high_basins, reopened_basins]))),
+                                 shape=(basin_count, basin_count))
+        spanning_tree = minimum_spanning_tree(basin_graph).tocoo()
+        parent_array = breadth_first_order(spanning_tree, 0, directed=False, return_predecessors=True)[1]
+
+        # Calculate the highest spill rank on the path from each basin to the outlets by pointer jumping
+        level_ranks = np.zeros(basin_count, dtype=np.int64)
+        child_basins = np.where(parent_array[spanning_tree.row] == spanning_tree.col,
+                                spanning_tree.row, spanning_tree.col)
+        level_ranks[child_basins] = spanning_tree.data.astype(np.int64)
+        parent_array[parent_array < 0] = 0
+        while True:
+            level_ranks = np.maximum(level_ranks, level_ranks[parent_array])
+            next_parents = parent_array[parent_array]
+            if np.array_equal(next_parents, parent_array):
+                break
+            parent_array = next_parents
+        basin_levels = np.append(value_type(-np.inf), level_values)[level_ranks]
+        filled_flat = np.where(valid_flat, np.maximum(elevation_flat, basin_levels[basin_flat]), np.nan)
+        if z_limit is None:
+            break
+
+        # Find the lowest cell and depth of each sink as a connected area of raised cells
+        sink_array, sink_count = label((filled_flat > elevation_flat).reshape(rows, columns), structure=structure)
+        if sink_count == 0:
+            break
+        sink_flat = sink_array.reshape(-1)
+        sink_cells = np.flatnonzero(sink_flat)
+        sink_cells = sink_cells[np.lexsort((elevation_flat[sink_cells], sink_flat[sink_cells]))]
+        first_mask = np.ones(sink_cells.shape[0], dtype=bool)
+        first_mask[1:] = sink_flat[sink_cells[1:]] != sink_flat[sink_cells[:-1]]
+        lowest_cells = sink_cells[first_mask]
+        deep_cells = lowest_cells[filled_flat[lowest_cells] - elevation_flat[lowest_cells] > z_limit]
+        del sink_array, sink_flat, sink_cells
+        if deep_cells.shape[0] == 0:
+            break
+        outlet_basins[basin_flat[deep_cells]] = True
+    filled_array = (filled_flat.astype(value_type) + value_type(0)).reshape(rows, columns)
+    del basin_graph, spanning_tree, filled_flat
+
+    # Raise filled areas and flats by one increment per cell of distance from the cells where they drain
+    if epsilon:
+        # Identify cells without a strictly lower neighbor other than outlets and reopened pits
+        lower_array = edge_array.copy()
+        for row_shift, column_shift in neighbor_shifts:
+            cell_slice, neighbor_slice = shift_slices(row_shift, column_shift)
+            with np.errstate(invalid='ignore'):
+                lower_array[cell_slice] |= filled_array[neighbor_slice] < filled_array[cell_slice]
+        reopened_array = np.zeros(cell_count, dtype=bool)
+        reopened_array[pit_roots[np.flatnonzero(outlet_basins[1:])]] = True
+        flat_array = valid_array & ~lower_array & ~reopened_array.reshape(rows, columns)
+        del lower_array
+
+        # Link cells of equal filled elevation where either cell is flat
+        if flat_array.any():
+            start_list = []
+            end_list = []
+            for row_shift, column_shift in forward_shifts:
+                cell_slice, neighbor_slice = shift_slices(row_shift, column_shift)
+                link_mask = ((filled_array[cell_slice] == filled_array[neighbor_slice])
+                             & (flat_array[cell_slice] | flat_array[neighbor_slice]))
+                start_list.append(index_array[cell_slice][link_mask])
+                end_list.append(index_array[neighbor_slice][link_mask])
+            link_starts = np.concatenate(start_list)
+            link_ends = np.concatenate(end_list)
+            del start_list, end_list
+
+            # Calculate the number of steps from cells that drain to each flat cell
+            node_cells = np.flatnonzero(np.bincount(np.concatenate([link_starts, link_ends]),
+                                                    minlength=cell_count))
+            node_lookup = np.full(cell_count, -1, dtype=np.int32)
+            node_lookup[node_cells] = np.arange(node_cells.shape[0], dtype=np.int32)
+            link_graph = csr_matrix((np.ones(link_starts.shape[0], dtype=np.float32),
+                                     (node_lookup[link_starts], node_lookup[link_ends])),
+                                    shape=(node_cells.shape[0], node_cells.shape[0]))
+            source_nodes = np.flatnonzero(~flat_array.reshape(-1)[node_cells])
+            if source_nodes.shape[0] > 0:
+                step_array = dijkstra(link_graph, directed=False, indices=source_nodes,
+                                      unweighted=True, min_only=True)
+                raise_mask = flat_array.reshape(-1)[node_cells] & np.isfinite(step_array)
+                raise_cells = node_cells[raise_mask]
+                raise_steps = step_array[raise_mask].astype(np.int64)
+
+                # Add the number of steps in units of the last place of the float type
+                integer_type = np.int32 if value_type == np.float32 else np.int64
+                filled_flat = filled_array.reshape(-1)
+                raise_values = filled_flat[raise_cells]
+                raise_bits = raise_values.view(integer_type).astype(np.int64)
+                raise_bits = np.where(raise_values >= 0, raise_bits + raise_steps, raise_bits - raise_steps)
+                filled_flat[raise_cells] = raise_bits.astype(integer_type).view(value_type)
+
+    return filled_array
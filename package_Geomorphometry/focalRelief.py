@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Focal relief
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy.
+# Description: "Focal relief" is a function that calculates the focal minimum, maximum, and mean over a square neighborhood together using separable van Herk/Gil-Werman running extremes, so that the cost of the extremes per cell does not depend on the neighborhood width.
+# ---------------------------------------------------------------------------
+
+# Define function to calculate focal minimum, maximum, and mean together
+def focal_relief(input_array, width):
+    """
+    Description: calculates the focal minimum, maximum, and mean over a square neighborhood ignoring no data cells in one fused kernel
+    Inputs: 'input_array' -- a two-dimensional float array with no data stored as NaN
+            'width' -- an integer number of cells for the axis length of the square neighborhood
+    Returned Value: Returns a tuple of float64 arrays for the focal minimum, maximum, and mean with NaN where the neighborhood contains no data
+    Preconditions: neighborhoods follow the same cell offsets as focal_statistics; the mean is a separable sum in a fixed order relative to each cell, so all three statistics are identical at tile seams and the cost grows with the width rather than the neighborhood area
+    """
+
+    # Import packages
+    import numpy as np
+    from package_Geomorphometry.focalStatistics import focal_statistics
+
+    # Define neighborhood offsets (even widths extend one more cell up and left)
+    width = int(width)
+    before = width // 2
+    after = width - 1 - before
+
+    # Define a running extreme along one axis from forward and backward cumulative extremes within blocks of the window width
+    def running_extreme(array, axis, function, fill_value):
+        array = np.moveaxis(array, axis, -1)
+        length = array.shape[-1]
+        block_number = -(-(length + before + after) // width)
+        padding = [(0, 0)] * (array.ndim - 1) + [(before, block_number * width - length - before)]
+        padded = np.pad(array, padding, constant_values=fill_value)
+        blocks = padded.reshape(array.shape[:-1] + (block_number, width))
+        forward = function.accumulate(blocks, axis=-1).reshape(padded.shape)
+        backward = np.flip(function.accumulate(np.flip(blocks, axis=-1), axis=-1), axis=-1).reshape(padded.shape)
+        result = function(backward[..., 0:length], forward[..., width - 1:width - 1 + length])
+        return np.moveaxis(result, -1, axis)
+
+    # Calculate separable running minimum and maximum with no data excluded
+    input_array = np.asarray(input_array, dtype=np.float64)
+    missing_array = np.isnan(input_array)
+    minimum_array = np.where(missing_array, np.inf, input_array)
+    minimum_array = running_extreme(running_extreme(minimum_array, 1, np.minimum, np.inf), 0, np.minimum, np.inf)
+    maximum_array = np.where(missing_array, -np.inf, input_array)
+    maximum_array = running_extreme(running_extreme(maximum_array, 1, np.maximum, -np.inf), 0, np.maximum, -np.inf)
+
+    # Calculate focal mean and remove neighborhoods without data
+    mean_array = focal_statistics(input_array, width, 'MEAN')
+    minimum_array[np.isnan(mean_array)] = np.nan
+    maximum_array[np.isnan(mean_array)] = np.nan
+
+    return minimum_array, maximum_array, mean_array
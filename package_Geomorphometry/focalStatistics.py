@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Focal statistics
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy.
+# Description: "Focal statistics" is a function that calculates a focal statistic over a square neighborhood of a float array while ignoring no data, equivalent to FocalStatistics with a rectangle neighborhood and the 'DATA' option.
+# ---------------------------------------------------------------------------
+
+# Define function to calculate focal statistics
+def focal_statistics(input_array, width, statistic):
+    """
+    Description: calculates a focal statistic over a square neighborhood ignoring no data cells
+    Inputs: 'input_array' -- a two-dimensional float array with no data stored as NaN
+            'width' -- an integer number of cells for the axis length of the square neighborhood
+            'statistic' -- a string value of 'MEAN', 'SUM', 'STD', 'MINIMUM', or 'MAXIMUM'
+    Returned Value: Returns a float64 array of the same shape as the input array with NaN where the neighborhood contains no data
+    Preconditions: cells outside the input array are treated as no data, so blocks must be read with a halo of at least half the width to reproduce whole-raster results
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Define neighborhood offsets (even widths extend one more cell up and left)
+    before = int(width) // 2
+    after = int(width) - 1 - before
+
+    # Define a separable pass that combines shifted views in a fixed order relative to each cell
+    def separable_pass(array, combine, fill_value):
+        rows, columns = array.shape
+        padded = np.pad(array, ((0, 0), (before, after)), constant_values=fill_value)
+        result = padded[:, 0:columns].copy()
+        for shift in range(1, int(width)):
+            result = combine(result, padded[:, shift:shift + columns])
+        padded = np.pad(result, ((before, after), (0, 0)), constant_values=fill_value)
+        result = padded[0:rows, :].copy()
+        for shift in range(1, int(width)):
+            result = combine(result, padded[shift:shift + rows, :])
+        return result
+
+    # Calculate extreme statistics with NaN-ignoring comparisons
+    input_array = np.asarray(input_array, dtype=np.float64)
+    if statistic == 'MINIMUM':
+        return separable_pass(input_array, np.fmin, np.nan)
+    elif statistic == 'MAXIMUM':
+        return separable_pass(input_array, np.fmax, np.nan)
+    elif statistic not in ('MEAN', 'SUM', 'STD'):
+        raise ValueError(f'Unsupported focal statistic: {statistic}')
+
+    # Calculate neighborhood sums and counts of valid cells
+    valid_array = ~np.isnan(input_array)
+    value_array = np.where(valid_array, input_array, 0)
+    count_array = separable_pass(valid_array.astype(np.float64), np.add, 0)
+    sum_array = separable_pass(value_array, np.add, 0)
+
+    # Calculate requested statistic
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if statistic == 'SUM':
+            output_array = sum_array
+        else:
+            output_array = sum_array / count_array
+        if statistic == 'STD':
+            square_array = separable_pass(value_array * value_array, np.add, 0)
+            variance_array = np.maximum(square_array / count_array - output_array * output_array, 0)
+            output_array = np.sqrt(variance_array)
+    output_array[count_array == 0] = np.nan
+
+    return output_array
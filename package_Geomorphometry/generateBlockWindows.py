@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Generate block windows
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution.
+# Description: "Generate block windows" is a function that generates the row and column offsets and dimensions of processing blocks that tile a raster grid.
+# ---------------------------------------------------------------------------
+
+# Define function to generate block windows
+def generate_block_windows(raster_height, raster_width, block_size):
+    """
+    Description: generates processing blocks that tile a raster grid in row-major order
+    Inputs: 'raster_height' -- the number of rows in the raster grid
+            'raster_width' -- the number of columns in the raster grid
+            'block_size' -- an integer number of rows and columns per processing block
+    Returned Value: Returns a generator of tuples of row offset, column offset, block height, and block width
+    Preconditions: none
+    """
+
+    # Yield each block in row-major order
+    for row_offset in range(0, raster_height, block_size):
+        block_height = min(block_size, raster_height - row_offset)
+        for column_offset in range(0, raster_width, block_size):
+            block_width = min(block_size, raster_width - column_offset)
+            yield row_offset, column_offset, block_height, block_width
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Read halo block
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy and rasterio.
+# Description: "Read halo block" is a function that reads a raster block with a surrounding halo of cells into a float array, padding cells outside the raster extent as no data.
+# ---------------------------------------------------------------------------
+
+# Define function to read a raster block with a halo
+def read_halo_block(raster_dataset, row_offset, column_offset, block_height, block_width, halo):
+    """
+    Description: reads a block of a raster plus a halo of cells on every side as a float64 array
+    Inputs: 'raster_dataset' -- an open rasterio dataset
+            'row_offset' -- the first row of the block in the pixel space of the dataset
+            'column_offset' -- the first column of the block in the pixel space of the dataset
+            'block_height' -- the number of rows in the block
+            'block_width' -- the number of columns in the block
+            'halo' -- the number of cells to read beyond each edge of the block
+    Returned Value: Returns a float64 array of shape (block_height + 2 * halo, block_width + 2 * halo) with no data and cells outside the raster stored as NaN
+    Preconditions: requires a single band raster opened with rasterio
+    """
+
+    # Import packages
+    import numpy as np
+    from rasterio.windows import Window
+
+    # Define requested window including halo
+    row_start = row_offset - halo
+    row_end = row_offset + block_height + halo
+    column_start = column_offset - halo
+    column_end = column_offset + block_width + halo
+
+    # Clip requested window to raster extent
+    read_row_start = max(row_start, 0)
+    read_row_end = min(row_end, raster_dataset.height)
+    read_column_start = max(column_start, 0)
+    read_column_end = min(column_end, raster_dataset.width)
+
+    # Create output block filled with no data
+    output_block = np.full((row_end - row_start, column_end - column_start), np.nan, dtype=np.float64)
+    if read_row_end <= read_row_start or read_column_end <= read_column_start:
+        return output_block
+
+    # Read the available portion of the window
+    read_window = Window(read_column_start, read_row_start,
+                         read_column_end - read_column_start,
+                         read_row_end - read_row_start)
+    values = raster_dataset.read(1, window=read_window).astype(np.float64)
+    if raster_dataset.nodata is not None:
+        values[values == raster_dataset.nodata] = np.nan
+
+    # Place values in the padded block
+    output_block[read_row_start - row_start:read_row_end - row_start,
+                 read_column_start - column_start:read_column_end - column_start] = values
+
+    return output_block
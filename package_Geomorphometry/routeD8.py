@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Route D8
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy.
+# Description: "Route D8" is a function that calculates D8 flow direction from a float elevation array, equivalent to FlowDirection with the 'D8' option, by assigning each cell to its steepest downward neighbor.
+# ---------------------------------------------------------------------------
+
+# Define function to calculate D8 flow direction
+def route_d8(elevation_array, cell_size):
+    """
+    Description: calculates D8 flow direction codes and downstream receivers from the steepest distance-weighted drop to the eight neighbors
+    Inputs: 'elevation_array' -- a two-dimensional float array of depression-filled elevation with no data stored as NaN
+            'cell_size' -- the cell size of the elevation array in the horizontal units
+    Returned Value: Returns a uint8 array of D8 flow direction codes (1 east, 2 southeast, 4 south, 8 southwest, 16 west, 32 northwest, 64 north, 128 northeast) with 0 where no downward neighbor exists and an int32 array of shape (1, rows, columns) with the flat index of the downstream cell or -1
+    Preconditions: neighbors that are no data or outside the array are not considered and equal drops are resolved in the order of the direction codes; depressions should be filled with the epsilon option so that filled flats drain
+    """
+
+    # Import packages
+    import numpy as np
+    from package_Geomorphometry.convertD8Receivers import convert_d8_receivers
+
+    # Define direction codes and neighbor shifts
+    code_list = [(1, 0, 1), (2, 1, 1), (4, 1, 0), (8, 1, -1), (16, 0, -1), (32, -1, -1), (64, -1, 0), (128, -1, 1)]
+
+    # Define a function to return shifted views of the 3 x 3 neighborhood from a single padded copy
+    elevation_array = np.asarray(elevation_array, dtype=np.float64)
+    rows, columns = elevation_array.shape
+    padded_elevation = np.pad(elevation_array, 1, constant_values=np.nan)
+    def neighbor(row_shift, column_shift):
+        return padded_elevation[1 + row_shift:1 + row_shift + rows, 1 + column_shift:1 + column_shift + columns]
+
+    # Find the steepest downward neighbor of each cell
+    maximum_drop = np.zeros((rows, columns), dtype=np.float64)
+    direction_array = np.zeros((rows, columns), dtype=np.uint8)
+    with np.errstate(invalid='ignore'):
+        for code, row_shift, column_shift in code_list:
+            distance = float(cell_size) * (np.sqrt(2) if row_shift and column_shift else 1)
+            drop = (elevation_array - neighbor(row_shift, column_shift)) / distance
+            steeper = drop > maximum_drop
+            maximum_drop[steeper] = drop[steeper]
+            direction_array[steeper] = code
+
+    return direction_array, convert_d8_receivers(direction_array)
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Route D-infinity
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy.
+# Description: "Route D-infinity" is a function that calculates D-infinity flow direction from a float elevation array following Tarboton (1997), equivalent to FlowDirection with the 'DINF' option, and splits flow between the two cells that bound the steepest facet.
+# ---------------------------------------------------------------------------
+
+# Define function to calculate D-infinity flow direction and flow proportions
+def route_dinfinity(elevation_array, cell_size):
+    """
+    Description: calculates D-infinity flow direction from the steepest downward slope over eight triangular facets and the proportion of flow passed to each bounding cell
+    Inputs: 'elevation_array' -- a two-dimensional float array of depression-filled elevation with no data stored as NaN
+            'cell_size' -- the cell size of the elevation array in the horizontal units
+    Returned Value: Returns a float32 array of flow direction in degrees counterclockwise from east with -1 where no downward facet exists, an int32 array of shape (2, rows, columns) with the flat indexes of the cardinal and diagonal receivers or -1, and a float32 array of the same shape with the proportion of flow passed to each receiver
+    Preconditions: facets that include no data or cells outside the array are not considered; depressions should be filled with the epsilon option so that filled flats drain
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Define facets as cardinal neighbor, diagonal neighbor, and angle multipliers
+    facet_list = [((0, 1), (-1, 1), 0, 1),
+                  ((-1, 0), (-1, 1), 1, -1),
+                  ((-1, 0), (-1, -1), 1, 1),
+                  ((0, -1), (-1, -1), 2, -1),
+                  ((0, -1), (1, -1), 2, 1),
+                  ((1, 0), (1, -1), 3, -1),
+                  ((1, 0), (1, 1), 3, 1),
+                  ((0, 1), (1, 1), 4, -1)]
+    quarter_angle = np.pi / 4
+
+    # Define a function to return shifted views of the 3 x 3 neighborhood from a single padded copy
+    elevation_array = np.asarray(elevation_array, dtype=np.float64)
+    rows, columns = elevation_array.shape
+    padded_elevation = np.pad(elevation_array, 1, constant_values=np.nan)
+    def neighbor(row_shift, column_shift):
+        return padded_elevation[1 + row_shift:1 + row_shift + rows, 1 + column_shift:1 + column_shift + columns]
+
+    # Find the steepest downward facet of each cell
+    cell_size = float(cell_size)
+    maximum_slope = np.zeros((rows, columns), dtype=np.float64)
+    facet_angle = np.zeros((rows, columns), dtype=np.float64)
+    facet_array = np.full((rows, columns), -1, dtype=np.int8)
+    with np.errstate(invalid='ignore'):
+        for facet_number, (cardinal, diagonal, cardinal_multiplier, facet_multiplier) in enumerate(facet_list):
+            cardinal_elevation = neighbor(*cardinal)
+            diagonal_elevation = neighbor(*diagonal)
+            slope_cardinal = (elevation_array - cardinal_elevation) / cell_size
+            slope_across = (cardinal_elevation - diagonal_elevation) / cell_size
+            angle = np.arctan2(slope_across, slope_cardinal)
+            slope = np.hypot(slope_cardinal, slope_across)
+            slope = np.where(angle < 0, slope_cardinal, slope)
+            slope = np.where(angle > quarter_angle,
+                             (elevation_array - diagonal_elevation) / (np.sqrt(2) * cell_size), slope)
+            angle = np.clip(angle, 0, quarter_angle)
+            steeper = slope > maximum_slope
+            maximum_slope[steeper] = slope[steeper]
+            facet_angle[steeper] = angle[steeper]
+            facet_array[steeper] = facet_number
+
+    # Calculate flow direction in degrees and flow proportions to the bounding cells
+    has_direction = facet_array >= 0
+    cardinal_multiplier = np.array([facet[2] for facet in facet_list])[facet_array]
+    facet_multiplier = np.array([facet[3] for facet in facet_list])[facet_array]
+    direction_array = np.mod(np.degrees(facet_multiplier * facet_angle + cardinal_multiplier * np.pi / 2), 360)
+    direction_array = np.where(has_direction, direction_array, -1).astype(np.float32)
+    diagonal_proportion = facet_angle / quarter_angle
+    proportion_array = np.stack([1 - diagonal_proportion, diagonal_proportion]).astype(np.float32)
+
+    # Convert facet neighbors to flat receiver indexes
+    offset_table = np.array([[facet[0][0] * columns + facet[0][1] for facet in facet_list],
+                             [facet[1][0] * columns + facet[1][1] for facet in facet_list]], dtype=np.int32)
+    cell_index = np.arange(rows * columns, dtype=np.int32).reshape(rows, columns)
+    receiver_array = cell_index + offset_table[:, facet_array]
+    receiver_array[(proportion_array <= 0) | ~has_direction] = -1
+    proportion_array[receiver_array < 0] = 0
+
+    return direction_array, receiver_array, proportion_array
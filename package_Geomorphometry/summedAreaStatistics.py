@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Summed area statistics
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy.
+# Description: "Summed area statistics" is a function that calculates focal mean, sum, or standard deviation over a square neighborhood from integral images (summed-area tables) so that the cost per cell does not depend on the neighborhood width.
+# ---------------------------------------------------------------------------
+
+# Define function to calculate focal statistics from summed-area tables
+def summed_area_statistics(input_array, width, statistic, reference=None):
+    """
+    Description: calculates a focal mean, sum, or standard deviation over one or more square neighborhoods ignoring no data cells using summed-area tables
+    Inputs: 'input_array' -- a two-dimensional float array with no data stored as NaN
+            'width' -- an integer number of cells for the axis length of the square neighborhood, or a list of integers to calculate several neighborhoods from the same tables
+            'statistic' -- a string value of 'MEAN', 'SUM', or 'STD'
+            'reference' -- an optional value on which to center the input values, such as the mean from the statistics of the raster that the array was read from, or None to use the array mean
+    Returned Value: Returns a float64 array of the same shape as the input array with NaN where the neighborhood contains no data, or a list of arrays in the order of the widths if a list was supplied
+    Preconditions: neighborhoods follow the same cell offsets as focal_statistics; values are centered on the reference and accumulated in float64 so results agree with focal_statistics to floating-point rounding; blocks of the same raster must share a reference that does not depend on the block so that their results differ at seams only by the rounding of the window sums
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Check statistic
+    if statistic not in ('MEAN', 'SUM', 'STD'):
+        raise ValueError(f'Unsupported summed area statistic: {statistic}')
+
+    # Define neighborhood offsets for each width (even widths extend one more cell up and left)
+    width_list = [int(value) for value in width] if isinstance(width, (list, tuple)) else [int(width)]
+    before = max(value // 2 for value in width_list)
+    after = max(value - 1 - value // 2 for value in width_list)
+
+    # Identify valid cells and return no data if none exist
+    input_array = np.asarray(input_array, dtype=np.float64)
+    rows, columns = input_array.shape
+    valid_array = ~np.isnan(input_array)
+    if not valid_array.any():
+        output_list = [np.full(input_array.shape, np.nan) for value in width_list]
+        return output_list if isinstance(width, (list, tuple)) else output_list[0]
+
+    # Center values on the reference to limit the magnitude of the accumulated sums
+    if reference is None:
+        reference = input_array[valid_array].mean()
+    reference = float(reference)
+    value_array = np.where(valid_array, input_array - reference, 0)
+
+    # Define a function to build a summed-area table with a leading row and column of zeros
+    def summed_area_table(array, data_type):
+        padded = np.pad(array.astype(data_type), ((before + 1, after), (before + 1, after)))
+        return padded.cumsum(axis=0, dtype=data_type).cumsum(axis=1, dtype=data_type)
+
+    # Define a function to query the window total for every cell with four table lookups
+    def window_total(table, window_width):
+        upper = before + 1 + (window_width - 1 - window_width // 2)
+        lower = before - window_width // 2
+        return (table[upper:upper + rows, upper:upper + columns]
+                - table[lower:lower + rows, upper:upper + columns]
+                - table[upper:upper + rows, lower:lower + columns]
+                + table[lower:lower + rows, lower:lower + columns])
+
+    # Build the tables once for all widths
+    count_table = summed_area_table(valid_array, np.int64)
+    sum_table = summed_area_table(value_array, np.float64)
+    square_table = None
+    if statistic == 'STD':
+        square_table = summed_area_table(value_array * value_array, np.float64)
+
+    # Calculate requested statistic for each width
+    output_list = []
+    for window_width in width_list:
+        count_array = window_total(count_table, window_width)
+        sum_array = window_total(sum_table, window_width)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean_array = sum_array / count_array
+            if statistic == 'SUM':
+                output_array = sum_array + reference * count_array
+            elif statistic == 'MEAN':
+                output_array = mean_array + reference
+            else:
+                square_array = window_total(square_table, window_width)
+                variance_array = np.maximum(square_array / count_array - mean_array * mean_array, 0)
+                variance_array[count_array == 1] = 0
+                output_array = np.sqrt(variance_array)
+        output_array[count_array == 0] = np.nan
+        output_list.append(output_array)
+
+    return output_list if isinstance(width, (list, tuple)) else output_list[0]
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Trace stream lines
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy.
+# Description: "Trace stream lines" is a function that traces stream cells downstream along D8 receivers from channel heads, confluences, and changes in stream order to yield one line at a time with its Strahler order, similar to RasterToPolyline with the 'SIMPLIFY' option applied to a stream order raster.
+# ---------------------------------------------------------------------------
+
+# Define function to trace stream lines from D8 receivers
+def trace_stream_lines(receiver_array, order_array, transform, minimum_order=1, maximum_order=255):
+    """
+    Description: traces lines of stream cells between nodes, where a node is a stream cell with no upstream stream cell, more than one upstream stream cell, or an upstream stream cell of a different order
+    Inputs: 'receiver_array' -- an int32 array of shape (1, rows, columns) with the flat index of the downstream cell or -1 from a D8 routing function in this package
+            'order_array' -- an integer array of shape (rows, columns) with the Strahler order of each stream cell and 0 elsewhere
+            'transform' -- the affine transform of the grid used to convert cell centers to coordinates
+            'minimum_order' -- the lowest stream order to trace
+            'maximum_order' -- the highest stream order to trace
+    Returned Value: Returns a generator of tuples of a list of (x, y) coordinates, stream order, flat index of the first cell plus one, and flat index of the last cell plus one
+    Preconditions: each stream cell is visited once so that time is linear in the number of stream cells; lines end at the first cell of the next line downstream so that the network is connected, and vertices along straight runs of the same direction are removed; a node with no downstream stream cell would form a zero-length line, so it is skipped and counted; where the node is a confluence or a change of order the upstream lines already end at that cell, so only isolated single stream cells are lost
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Define stream cells within the order range
+    rows, columns = order_array.shape
+    receiver_flat = receiver_array.reshape(-1)
+    order_flat = order_array.reshape(-1)
+    stream_flat = (order_flat >= max(minimum_order, 1)) & (order_flat <= maximum_order)
+
+    # Count upstream stream cells and record the order of the upstream cell where there is only one
+    stream_cells = np.flatnonzero(stream_flat & (receiver_flat >= 0))
+    stream_cells = stream_cells[stream_flat[receiver_flat[stream_cells]]]
+    donor_count = np.bincount(receiver_flat[stream_cells], minlength=rows * columns)
+    donor_order = np.zeros(rows * columns, dtype=order_flat.dtype)
+    donor_order[receiver_flat[stream_cells]] = order_flat[stream_cells]
+
+    # Define nodes that start lines
+    node_flat = stream_flat & ((donor_count != 1) | (donor_order != order_flat))
+    del stream_cells, donor_count, donor_order
+
+    # Access arrays through memoryviews for fast scalar indexing
+    receiver_view = memoryview(np.ascontiguousarray(receiver_flat, dtype=np.int32))
+    stream_view = memoryview(stream_flat.view(np.uint8))
+    node_view = memoryview(node_flat.view(np.uint8))
+
+    # Define cell center coordinates
+    def cell_coordinates(cell):
+        row, column = divmod(cell, columns)
+        return transform * (column + 0.5, row + 0.5)
+
+    # Trace each line downstream from its node
+    skipped_count = 0
+    for node in np.flatnonzero(node_flat).tolist():
+        vertex_list = [cell_coordinates(node)]
+        cell = node
+        previous_step = None
+        receiver = receiver_view[cell]
+        while receiver >= 0 and stream_view[receiver]:
+            step = receiver - cell
+            if step == previous_step:
+                vertex_list[-1] = cell_coordinates(receiver)
+            else:
+                vertex_list.append(cell_coordinates(receiver))
+            previous_step = step
+            cell = receiver
+            if node_view[cell]:
+                break
+            receiver = receiver_view[cell]
+
+        # Yield lines with at least two vertices and count single-cell lines that are skipped
+        if len(vertex_list) >= 2:
+            yield vertex_list, int(order_flat[node]), node + 1, cell + 1
+        else:
+            skipped_count += 1
+
+    # Report skipped single-cell lines
+    if skipped_count > 0:
+        print(f'\t\tSkipped {skipped_count} single-cell lines without a downstream stream cell.')
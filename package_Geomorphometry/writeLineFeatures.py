@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Write line features
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with fiona.
+# Description: "Write line features" is a function that streams lines through the OGR drivers of fiona to a GeoPackage or GeoJSON file in batches of features with the same attribute fields as RasterToPolyline, so that a line set never needs to be held in memory.
+# ---------------------------------------------------------------------------
+
+# Define function to write lines to a GeoPackage or GeoJSON file
+def write_line_features(line_generator, output_file, crs=None, batch_size=10000):
+    """
+    Description: writes lines with arcid, grid_code, from_node, and to_node fields to a GeoPackage or GeoJSON file
+    Inputs: 'line_generator' -- an iterable of tuples of a list of (x, y) coordinates, grid code, from node, and to node, such as from trace_stream_lines
+            'output_file' -- an output file path ending in '.gpkg' to write a GeoPackage layer named by the file name or in '.geojson' or '.json' to write a GeoJSON feature collection
+            'crs' -- an optional rasterio coordinate reference system of the coordinates
+            'batch_size' -- an integer number of features to pass to the driver in each write
+    Returned Value: Returns the number of features written to disk
+    Preconditions: an existing output file is replaced; the GeoPackage driver builds the spatial index of the layer; every line must have at least two vertices; GeoJSON coordinates are written in the coordinate reference system of the input rather than reprojected to geographic coordinates
+    """
+
+    # Import packages
+    import fiona
+    import os
+
+    # Define output driver and schema
+    output_format = os.path.splitext(output_file)[1].lower()
+    if output_format == '.gpkg':
+        driver = 'GPKG'
+    elif output_format in ('.geojson', '.json'):
+        driver = 'GeoJSON'
+    else:
+        raise ValueError(f'{output_file} must end in .gpkg, .geojson, or .json.')
+    schema = {'geometry': 'LineString',
+              'properties': {'arcid': 'int', 'grid_code': 'int', 'from_node': 'int', 'to_node': 'int'}}
+    layer_name = os.path.splitext(os.path.basename(output_file))[0]
+    if os.path.exists(output_file):
+        os.remove(output_file)
+
+    # Write lines in batches
+    feature_count = 0
+    with fiona.open(output_file, 'w', driver=driver, schema=schema, layer=layer_name,
+                    crs_wkt=crs.to_wkt() if crs is not None else None) as output_collection:
+        record_list = []
+        for vertex_list, grid_code, from_node, to_node in line_generator:
+            feature_count += 1
+            record_list.append({'geometry': {'type': 'LineString',
+                                             'coordinates': [tuple(vertex) for vertex in vertex_list]},
+                                'properties': {'arcid': feature_count, 'grid_code': int(grid_code),
+                                               'from_node': int(from_node), 'to_node': int(to_node)}})
+            if len(record_list) == batch_size:
+                output_collection.writerecords(record_list)
+                record_list = []
+        if len(record_list) > 0:
+            output_collection.writerecords(record_list)
+
+    return feature_count
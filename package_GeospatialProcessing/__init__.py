@@ -2,16 +2,21 @@
 # ---------------------------------------------------------------------------
 # Initialization for Geospatial Processing Module
 # Author: Timm Nawrocki
-# Last Updated: 2023-03-06
+# Last Updated: 2026-10-17
 # Usage: Individual functions have varying requirements. All functions that use arcpy must be executed in an ArcGIS Pro Python 3.6+ distribution.
 # Description: This initialization file imports modules in the package so that the contents are accessible.
 # ---------------------------------------------------------------------------
 
 # Import functions from modules
 from package_GeospatialProcessing.arcpyGeoprocessing import arcpy_geoprocessing
+from package_GeospatialProcessing.accumulateZonalMoments import accumulate_zonal_moments
 from package_GeospatialProcessing.addCategoricalAttributes import add_categorical_attributes
+from package_GeospatialProcessing.buildZoneIndex import build_zone_index
+from package_GeospatialProcessing.calculateContentHash import calculate_content_hash
 from package_GeospatialProcessing.calculateTopographicProperties import calculate_topographic_properties
+from package_GeospatialProcessing.calculateZonalGrids import calculate_zonal_grids
 from package_GeospatialProcessing.calculateZonalStatistics import calculate_zonal_statistics
+from package_GeospatialProcessing.calculateZonePoints import calculate_zone_points
 from package_GeospatialProcessing.compileSpotMultiband import compile_spot_multiband
 from package_GeospatialProcessing.compositeSegmentationImagery import composite_segmentation_imagery
 from package_GeospatialProcessing.convertClassData import convert_class_data
@@ -21,6 +26,7 @@ from package_GeospatialProcessing.createGridIndex import create_grid_index
 from package_GeospatialProcessing.createSampleBlock import create_sample_block
 from package_GeospatialProcessing.downloadFromCSV import download_from_csv
 from package_GeospatialProcessing.downloadFromDrive import download_from_drive
+from package_GeospatialProcessing.executeTaskGraph import execute_task_graph
 from package_GeospatialProcessing.extractRaster import extract_raster
 from package_GeospatialProcessing.formatSiteData import format_site_data
 from package_GeospatialProcessing.generateHydrographicPosition import generate_hydrographic_position
@@ -29,6 +35,7 @@ from package_GeospatialProcessing.listFromDrive import list_from_drive
 from package_GeospatialProcessing.mergeFloodplains import merge_floodplains
 from package_GeospatialProcessing.mergeElevationTiles import merge_elevation_tiles
 from package_GeospatialProcessing.mergeSegmentationImagery import merge_segmentation_imagery
+from package_GeospatialProcessing.mergeZonalTables import merge_zonal_tables
 from package_GeospatialProcessing.normalizedMetrics import normalized_metrics
 from package_GeospatialProcessing.parseRasterBand import parse_raster_band
 from package_GeospatialProcessing.postprocessCategoricalRaster import postprocess_categorical_raster
@@ -36,6 +43,9 @@ from package_GeospatialProcessing.postprocessContinuousRaster import postprocess
 from package_GeospatialProcessing.postprocessSegments import postprocess_segments
 from package_GeospatialProcessing.predictionsToRaster import predictions_to_raster
 from package_GeospatialProcessing.probabilisticSiteSelection import probabilistic_site_selection
+from package_GeospatialProcessing.readZoneLabels import read_zone_labels
 from package_GeospatialProcessing.reprojectExtract import reproject_extract
 from package_GeospatialProcessing.spliceSegmentsFloodplains import splice_segments_floodplains
+from package_GeospatialProcessing.summarizeZoneIndex import summarize_zone_index
 from package_GeospatialProcessing.tableToProjectedFeatureClass import table_to_feature_projected
+from package_GeospatialProcessing.updateBuildManifest import update_build_manifest
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Accumulate zonal moments
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy and rasterio.
+# Description: "Accumulate zonal moments" is a function that streams an input raster block by block on the grid of a zone raster and accumulates the count, mean, and sum of squared deviations of its values per zone with np.bincount over the zones of each block, merging blocks with the parallel algorithm of Chan et al. (1979) so that zones that cross blocks are combined exactly.
+# ---------------------------------------------------------------------------
+
+# Define a function to accumulate the count, mean, and sum of squared deviations of raster values per zone
+def accumulate_zonal_moments(zone_dataset, label_array, zone_count, input_raster, block_size=1024):
+    """
+    Description: accumulates per zone moments of an input raster read on the zone raster grid in one pass
+    Inputs: 'zone_dataset' -- an open rasterio dataset of the zone raster that defines the grid
+            'label_array' -- an integer array of zone labels with the shape of the zone raster from read_zone_labels
+            'zone_count' -- the number of zones, which is also the label of cells without a zone
+            'input_raster' -- a single band raster of values to summarize
+            'block_size' -- an integer number of rows and columns per processing block
+    Returned Value: Returns a tuple of three float64 arrays of length zone_count for the number of valid cells, the mean, and the sum of squared deviations from the mean in each zone, where the population variance is the sum of squared deviations divided by the count
+    Preconditions: the input raster is resampled to the zone raster grid with nearest neighbor like the cell size and snap raster environments of ZonalStatistics; cells with no data in either raster are ignored; deviations are taken from the block mean of each zone before merging, so the variance does not lose precision for large scaled values as a sum of squares does, and the result does not depend on block order
+    """
+
+    # Import packages
+    import numpy as np
+    import rasterio
+    from rasterio.enums import Resampling
+    from rasterio.vrt import WarpedVRT
+    from rasterio.windows import Window
+    from package_Geomorphometry import generate_block_windows
+
+    # Create empty accumulators
+    count_array = np.zeros(zone_count, dtype=np.float64)
+    mean_array = np.zeros(zone_count, dtype=np.float64)
+    deviation_array = np.zeros(zone_count, dtype=np.float64)
+
+    # Read input raster on the zone grid and accumulate each block
+    with rasterio.open(input_raster) as input_dataset:
+        with WarpedVRT(input_dataset,
+                       crs=zone_dataset.crs,
+                       transform=zone_dataset.transform,
+                       width=zone_dataset.width,
+                       height=zone_dataset.height,
+                       resampling=Resampling.nearest,
+                       add_alpha=input_dataset.nodata is None) as input_grid:
+            for row_offset, column_offset, block_height, block_width in generate_block_windows(zone_dataset.height,
+                                                                                               zone_dataset.width,
+                                                                                               block_size):
+                # Skip blocks without zones
+                label_block = label_array[row_offset:row_offset + block_height,
+                                          column_offset:column_offset + block_width]
+                zone_mask = label_block < zone_count
+                if not zone_mask.any():
+                    continue
+
+                # Read values and select cells with a zone and a value
+                value_block = input_grid.read(1, window=Window(column_offset, row_offset, block_width, block_height),
+                                              masked=True)
+                valid_mask = zone_mask & ~np.ma.getmaskarray(value_block)
+                if not valid_mask.any():
+                    continue
+                values = value_block.data[valid_mask].astype(np.float64)
+
+                # Relabel the zones of the block consecutively so that the block sums do not scale with all zones
+                block_zones, block_labels = np.unique(label_block[valid_mask], return_inverse=True)
+                block_labels = block_labels.reshape(-1)
+
+                # Calculate the count, mean, and sum of squared deviations of each zone in the block
+                block_count = np.bincount(block_labels).astype(np.float64)
+                block_mean = np.bincount(block_labels, weights=values) / block_count
+                block_deviation = np.bincount(block_labels, weights=(values - block_mean[block_labels]) ** 2)
+
+                # Merge the block moments into the accumulated moments of each zone
+                previous_count = count_array[block_zones]
+                merged_count = previous_count + block_count
+                mean_difference = block_mean - mean_array[block_zones]
+                mean_array[block_zones] += mean_difference * (block_count / merged_count)
+                deviation_array[block_zones] += (block_deviation + mean_difference * mean_difference
+                                                 * (previous_count * block_count / merged_count))
+                count_array[block_zones] = merged_count
+
+    return count_array, mean_array, deviation_array
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Build zone index
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy and rasterio.
+# Description: "Build zone index" is a function that stores the cells of each zone of a zone raster, such as a gridded segment raster, as a compressed sparse row index of memory-mapped arrays that is rebuilt only when the content of the zone raster changes.
+# ---------------------------------------------------------------------------
+
+# Define a function to build or load a cached zone index
+def build_zone_index(zone_raster, index_folder, zone_hash=None):
+    """
+    Description: builds or loads an index of the zone values, the offsets of each zone, and the flat cell indexes of the cells of each zone
+    Inputs: 'zone_raster' -- a single band integer raster of zones, such as segments with the segment id as the value
+            'index_folder' -- a folder to store the index, where each zone raster is stored in a subfolder named for the raster and its full path
+            'zone_hash' -- an optional content hash of the zone raster from summarize_zone_index, which replaces reading the zone raster to check the cached index
+    Returned Value: Returns a tuple of read-only memory-mapped arrays of the sorted zone values, the int64 offsets with one more value than the number of zones, and the flat row-major indexes of the cells of each zone
+    Preconditions: the cells of zone i are cell_indices[offsets[i]:offsets[i + 1]] in row-major order, so any per zone reduction can be calculated as a segmented reduction over values gathered with the cell indexes; the index is keyed by the content hash of the zone raster, which is only recalculated if no hash is given and the file size or modification time of the zone raster differ from the cached index
+    """
+
+    # Import packages
+    import hashlib
+    import json
+    import numpy as np
+    import os
+    from package_GeospatialProcessing.calculateContentHash import calculate_content_hash
+    from package_GeospatialProcessing.readZoneLabels import read_zone_labels
+    from package_GeospatialProcessing.updateBuildManifest import update_build_manifest
+
+    # Define index datasets in a folder unique to the path of the zone raster
+    path_hash = hashlib.sha256(os.path.abspath(zone_raster).encode('utf-8')).hexdigest()
+    zone_folder = os.path.join(index_folder,
+                               f'{os.path.splitext(os.path.split(zone_raster)[1])[0]}_{path_hash[0:12]}')
+    manifest_file = os.path.join(zone_folder, 'Zone_Index.json')
+    array_names = ['zone_values', 'offsets', 'cell_indices']
+    array_files = [os.path.join(zone_folder, array_name + '.npy') for array_name in array_names]
+
+    # Read the entry of the existing index
+    index_entry = dict()
+    if os.path.exists(manifest_file) and all(os.path.exists(array_file) for array_file in array_files):
+        with open(manifest_file, 'r') as manifest_stream:
+            index_entry = json.load(manifest_stream).get('zone_index', dict())
+
+    # Hash the zone raster content only if no hash is given and the file differs from the indexed file
+    zone_stat = os.stat(zone_raster)
+    file_properties = [zone_stat.st_size, zone_stat.st_mtime_ns]
+    if zone_hash is None:
+        if index_entry.get('file') == file_properties:
+            zone_hash = index_entry['signature']
+        else:
+            zone_hash = calculate_content_hash([zone_raster])
+
+    # Load the existing index if it was built from the same zone raster content
+    if index_entry.get('signature') == zone_hash:
+        if index_entry.get('file') != file_properties:
+            index_entry['file'] = file_properties
+            update_build_manifest(manifest_file, {'zone_index': index_entry})
+        return tuple(np.load(array_file, mmap_mode='r') for array_file in array_files)
+
+    # Sort cells by zone label in a stable order so cells without a zone follow all zones
+    print('\t\tBuilding zone index...')
+    zone_values, label_array = read_zone_labels(zone_raster)
+    zone_count = zone_values.shape[0]
+    label_array = label_array.reshape(-1)
+    offsets = np.zeros(zone_count + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(np.bincount(label_array, minlength=zone_count + 1)[0:zone_count])
+    index_type = np.int32 if label_array.shape[0] < 2 ** 31 else np.int64
+    cell_indices = np.argsort(label_array, kind='stable')[0:offsets[-1]].astype(index_type)
+    del label_array
+
+    # Write each array through a temporary file and record the zone raster hash last
+    os.makedirs(zone_folder, exist_ok=True)
+    for array, array_file in zip([zone_values, offsets, cell_indices], array_files):
+        temporary_file = f'{array_file}.{os.getpid()}.temporary.npy'
+        np.save(temporary_file, array)
+        os.replace(temporary_file, array_file)
+    update_build_manifest(manifest_file, {'zone_index': {'signature': zone_hash,
+                                                         'zone_raster': zone_raster,
+                                                         'file': file_properties,
+                                                         'zone_count': zone_count}})
+
+    return tuple(np.load(array_file, mmap_mode='r') for array_file in array_files)
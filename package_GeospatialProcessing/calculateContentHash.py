@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Calculate content hash
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy and rasterio.
+# Description: "Calculate content hash" is a function that calculates a hash of the cell values and grid of one or more rasters plus a set of parameters so that intermediate results can be reused when their inputs have not changed.
+# ---------------------------------------------------------------------------
+
+# Define a function to calculate a content hash of rasters and parameters
+def calculate_content_hash(raster_list, parameter_dictionary=None, block_size=1024):
+    """
+    Description: calculates a SHA-256 hash of the grid and cell values of rasters and of parameter values
+    Inputs: 'raster_list' -- a list of raster paths to include in the hash
+            'parameter_dictionary' -- an optional dictionary of parameter names and JSON-serializable values to include in the hash
+            'block_size' -- an integer number of rows and columns per block read from each raster
+    Returned Value: Returns a hexadecimal string that changes if any raster grid, cell value, or parameter value changes
+    Preconditions: the hash depends on raster content rather than file metadata, so rewriting an identical raster does not change the hash
+    """
+
+    # Import packages
+    import hashlib
+    import json
+    import rasterio
+    from rasterio.windows import Window
+    from package_Geomorphometry import generate_block_windows
+
+    # Create hash
+    content_hash = hashlib.sha256()
+
+    # Add grid properties and cell values of each raster
+    for input_raster in raster_list:
+        with rasterio.open(input_raster) as input_dataset:
+            grid_properties = [input_dataset.crs.to_wkt() if input_dataset.crs else None,
+                               list(input_dataset.transform)[0:6],
+                               input_dataset.height,
+                               input_dataset.width,
+                               input_dataset.count,
+                               list(input_dataset.dtypes),
+                               input_dataset.nodata]
+            content_hash.update(json.dumps(grid_properties).encode('utf-8'))
+            for row_offset, column_offset, block_height, block_width in generate_block_windows(input_dataset.height,
+                                                                                               input_dataset.width,
+                                                                                               block_size):
+                block_window = Window(column_offset, row_offset, block_width, block_height)
+                content_hash.update(input_dataset.read(window=block_window).tobytes())
+
+    # Add parameter values
+    if parameter_dictionary is not None:
+        content_hash.update(json.dumps(parameter_dictionary, sort_keys=True, default=str).encode('utf-8'))
+
+    return content_hash.hexdigest()
@@ -2,8 +2,8 @@
 # ---------------------------------------------------------------------------
 # Calculate Topographic Properties
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
+# Last Updated: 2026-10-17
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation, or in a Python 3.7+ distribution with numpy and rasterio if the numpy engine is selected.
 # Description: "Calculate Topographic Properties" is a function that calculates multiple integer topographic properties from a float elevation raster.
 # ---------------------------------------------------------------------------
 
@@ -14,14 +14,23 @@ def calculate_topographic_properties(**kwargs):
     Inputs: 'z_unit' -- a string value of either 'Meter' or 'Foot' representing the vertical unit of the elevation raster
             'position_width' -- an integer value of the distance to consider for topographic position in the same units as the input raster
             'input_array' -- an array containing the grid raster (must be first) and the float elevation raster
-            'output_array' -- an array containing the output rasters for elevation (integer), slope, aspect, exposure, heat load, position, radiation, roughness, surface area, surface relief, wetness (in that order).
-    Returned Value: Returns a raster dataset on disk for each topographic property
-    Preconditions: requires an input DEM that can be created through other scripts in this repository
+            'output_array' -- an array containing the output rasters for elevation (integer), slope, aspect, exposure, heat load, position, radiation, roughness, surface area, surface relief, wetness (in that order), optionally followed by profile curvature, plan curvature, and mean curvature
+            'engine' -- an optional string value of either 'arcpy' (default) to calculate each property with a separate arcpy function or 'numpy' to calculate all properties in a single block-wise pass
+            'block_size' -- an optional integer number of rows and columns per processing block for the numpy engine
+            'flow_engine' -- an optional string value for the numpy engine of either 'numpy' (default) to calculate the flow accumulation for wetness in memory or 'arcpy' to calculate it with Fill and Spatial Analyst, which is required for elevation rasters too large to fill in memory
+            'conditioning' -- an optional string value for the numpy engine of either 'fill' (default) to fill depressions before calculating flow or 'breach' to breach depressions with least-cost paths before filling the depressions that remain
+            'breach_depth' -- an optional value in the vertical units for the maximum cut of a breach path (defaults to 3)
+            'breach_length' -- an optional length in the horizontal units for the maximum length of a breach path (defaults to 100)
+            'worker_count' -- an optional integer number of worker processes that calculate independent properties at the same time (defaults to 1), where each arcpy task uses a parallel processing factor of 100 percent divided by the worker count and its own scratch folder
+            'manifest_file' -- an optional JSON file that records the input hashes and parameters of each output (defaults to Topography_Manifest.json beside the integer elevation output)
+            'intermediate_type' -- an optional string value for the arcpy engine of either 'int16' (default) to store the intermediate slope and aspect rasters as compressed scaled 16-bit signed rasters or 'float32' to store them as 32-bit float rasters
+    Returned Value: Returns a raster dataset on disk for each topographic property and a manifest on disk
+    Preconditions: requires an input DEM that can be created through other scripts in this repository; an output is only reused if it exists and the manifest records the same input hashes, parameters, and upstream outputs, so outputs from runs before the manifest existed are recalculated once
     """
 
     # Import packages
-    import arcpy
     from package_Geomorphometry import calculate_aspect
+    from package_Geomorphometry import calculate_curvature
     from package_Geomorphometry import calculate_exposure
     from package_Geomorphometry import calculate_flow
     from package_Geomorphometry import calculate_heat_load
@@ -32,10 +41,14 @@ def calculate_topographic_properties(**kwargs):
     from package_Geomorphometry import calculate_slope
     from package_Geomorphometry import calculate_surface_area
     from package_Geomorphometry import calculate_surface_relief
+    from package_Geomorphometry import calculate_terrain_rasters
     from package_Geomorphometry import calculate_wetness
-    import datetime
+    import json
     import os
-    import time
+    from functools import partial
+    from package_GeospatialProcessing.calculateContentHash import calculate_content_hash
+    from package_GeospatialProcessing.executeTaskGraph import execute_task_graph
+    from package_GeospatialProcessing.updateBuildManifest import update_build_manifest
 
     # Parse key word argument inputs
     z_unit = kwargs['z_unit']
@@ -53,6 +66,17 @@ def calculate_topographic_properties(**kwargs):
     surfacearea_output = kwargs['output_array'][8]
     surfacerelief_output = kwargs['output_array'][9]
     wetness_output = kwargs['output_array'][10]
+    curvature_list = list(zip(['profile', 'plan', 'mean'], kwargs['output_array'][11:14]))
+    engine = kwargs.get('engine', 'arcpy')
+    block_size = kwargs.get('block_size', 1024)
+    flow_engine = kwargs.get('flow_engine', 'numpy')
+    conditioning = kwargs.get('conditioning', 'fill')
+    breach_depth = kwargs.get('breach_depth', 3)
+    breach_length = kwargs.get('breach_length', 100)
+    worker_count = kwargs.get('worker_count', 1)
+    manifest_file = kwargs.get('manifest_file', os.path.join(os.path.split(elevation_integer)[0],
+                                                             'Topography_Manifest.json'))
+    intermediate_type = kwargs.get('intermediate_type', 'int16')
 
     # Define folder structure
     float_folder = os.path.split(elevation_float)[0]
@@ -62,6 +86,151 @@ def calculate_topographic_properties(**kwargs):
     slope_float = os.path.join(float_folder, 'Slope.tif')
     aspect_float = os.path.join(float_folder, 'Aspect.tif')
 
+    # Define factors for intermediate slope and aspect that keep 0.0033 and 0.011 degree precision within 16 bits
+    slope_factor = 1
+    aspect_factor = 1
+    intermediate_factor = {'slope': None, 'aspect': None}
+    if intermediate_type == 'int16':
+        slope_factor = 300
+        aspect_factor = 90
+        intermediate_factor = {'slope': slope_factor, 'aspect': aspect_factor}
+
+    # Read the manifest of existing outputs
+    manifest_folder = os.path.split(manifest_file)[0]
+    manifest_dictionary = dict()
+    if os.path.exists(manifest_file):
+        with open(manifest_file, 'r') as manifest_stream:
+            manifest_dictionary = json.load(manifest_stream)
+    input_hashes = dict()
+    signature_dictionary = dict()
+    record_dictionary = dict()
+    task_outputs = dict()
+
+    # Define function to calculate the signature of an output and check whether the existing output matches
+    def check_current(output_name, output_list, parameter_dictionary, dependency_list):
+        signature = calculate_content_hash([], {'inputs': input_hashes,
+                                                'parameters': parameter_dictionary,
+                                                'dependencies': [signature_dictionary[dependency]
+                                                                 for dependency in dependency_list]})
+        signature_dictionary[output_name] = signature
+        record_dictionary[output_name] = {os.path.relpath(output_raster, manifest_folder):
+                                          {'output': output_name,
+                                           'signature': signature,
+                                           'inputs': input_hashes,
+                                           'parameters': parameter_dictionary}
+                                          for output_raster in output_list}
+        return all(os.path.exists(output_raster)
+                   and manifest_dictionary.get(manifest_key, dict()).get('signature') == signature
+                   for output_raster, manifest_key in zip(output_list, record_dictionary[output_name]))
+
+    # Define function to record the outputs of a finished task in the manifest
+    def record_task(task):
+        entry_dictionary = dict()
+        for output_name in task_outputs[task]:
+            entry_dictionary.update(record_dictionary[output_name])
+        update_build_manifest(manifest_file, entry_dictionary)
+
+    #### CALCULATE TOPOGRAPHY DATASETS IN A SINGLE PASS
+
+    if engine == 'numpy':
+        # Import packages
+        import rasterio
+
+        # Check projection and units of elevation raster
+        print(f'\tChecking projection and units of elevation raster...')
+        with rasterio.open(elevation_float) as elevation_dataset:
+            spatial_reference = elevation_dataset.crs
+        if spatial_reference is None or spatial_reference.is_projected is False:
+            print(
+                '\tERROR: Elevation raster must be in a projected spatial reference, not a geographic spatial reference.')
+            quit()
+        else:
+            print('\tElevation raster is in a projected spatial reference.')
+        reference_unit = spatial_reference.linear_units.upper().replace('METRE', 'METER')
+        if reference_unit.rstrip('S') != z_unit.upper().rstrip('S'):
+            print(f'\tERROR: Vertical units ({z_unit}) and horizontal units ({reference_unit}) do not match.')
+            quit()
+        else:
+            print(f'\tVertical units ({z_unit}) and horizontal units ({reference_unit}) match.')
+        print('\t----------')
+
+        # Hash the area and elevation rasters
+        print('\tCalculating input hashes...')
+        input_hashes.update(area=calculate_content_hash([area_raster]),
+                            elevation=calculate_content_hash([elevation_float]))
+
+        # Define outputs that do not already exist or that are out of date
+        flow_parameters = {'engine': flow_engine, 'output': 'flow', 'conditioning': conditioning,
+                           'breach_depth': breach_depth, 'breach_length': breach_length}
+        flow_current = check_current('flow', [flow_accumulation], flow_parameters, [])
+        output_dictionary = dict()
+        output_list = [['elevation', elevation_integer, 1],
+                       ['slope', slope_integer, 1],
+                       ['aspect', aspect_integer, 1],
+                       ['exposure', exposure_output, 100],
+                       ['heat_load', heatload_output, 10000],
+                       ['position', position_output, 1],
+                       ['radiation', radiation_output, 1000],
+                       ['roughness', roughness_output, 10],
+                       ['surface_area', surfacearea_output, 10],
+                       ['surface_relief', surfacerelief_output, 10000],
+                       ['wetness', wetness_output, 100]]
+        output_list += [[f'{curvature_type}_curvature', curvature_output, 10000]
+                        for curvature_type, curvature_output in curvature_list]
+        for derivative, output_raster, conversion_factor in output_list:
+            parameter_dictionary = {'engine': 'numpy', 'output': derivative, 'conversion_factor': conversion_factor}
+            if derivative == 'position':
+                parameter_dictionary['position_width'] = position_width
+            if derivative in ['aspect', 'exposure', 'heat_load', 'radiation']:
+                parameter_dictionary['azimuth'] = 'geodesic'
+            dependency_list = ['flow'] if derivative == 'wetness' else []
+            if check_current(derivative, [output_raster], parameter_dictionary, dependency_list) == 0:
+                output_dictionary[derivative] = (output_raster, conversion_factor)
+            else:
+                print(f'\t{os.path.split(output_raster)[1]} already exists and is up to date.')
+        if len(output_dictionary) == 0:
+            print('\t----------')
+            outprocess = f'Finished calculating topographic properties.'
+            return outprocess
+
+        # Define flow accumulation task if it is required and does not already exist or is out of date
+        task_dictionary = dict()
+        if 'wetness' in output_dictionary and flow_current == 0:
+            task_outputs['flow'] = ['flow']
+            task_dictionary['flow'] = ('Calculating flow direction', calculate_flow,
+                                       (area_raster, elevation_float, flow_accumulation, flow_engine,
+                                        conditioning, breach_depth, breach_length), [])
+
+        # Calculate properties that do not require flow accumulation at the same time as flow if there are workers
+        if worker_count > 1 and 'flow' in task_dictionary and len(output_dictionary) > 1:
+            terrain_dictionary = {derivative: output_dictionary[derivative]
+                                  for derivative in output_dictionary if derivative != 'wetness'}
+            task_outputs['terrain'] = list(terrain_dictionary)
+            task_outputs['wetness'] = ['wetness']
+            task_dictionary['terrain'] = (f'Calculating {len(terrain_dictionary)} topographic properties in a single pass',
+                                          calculate_terrain_rasters,
+                                          (area_raster, elevation_float, flow_accumulation, position_width,
+                                           terrain_dictionary, block_size), [])
+            task_dictionary['wetness'] = ('Calculating topographic wetness',
+                                          calculate_terrain_rasters,
+                                          (area_raster, elevation_float, flow_accumulation, position_width,
+                                           {'wetness': output_dictionary['wetness']}, block_size), ['flow'])
+        else:
+            task_outputs['terrain'] = list(output_dictionary)
+            task_dictionary['terrain'] = (f'Calculating {len(output_dictionary)} topographic properties in a single pass',
+                                          calculate_terrain_rasters,
+                                          (area_raster, elevation_float, flow_accumulation, position_width,
+                                           output_dictionary, block_size), ['flow'])
+
+        # Execute tasks as soon as their inputs exist and record finished outputs
+        execute_task_graph(task_dictionary, worker_count, record_task)
+
+        outprocess = f'Finished calculating topographic properties.'
+        return outprocess
+
+    # Import arcpy for the arcpy engine
+    import arcpy
+
     #### PERFORM UNITS CHECK
 
     # Describe the type of spatial reference
@@ -88,215 +257,83 @@ def calculate_topographic_properties(**kwargs):
         print(f'\tVertical units ({z_unit}) and horizontal units ({reference_unit}) match.')
     print('\t----------')
 
-    #### CALCULATE FOUNDATIONAL TOPOGRAPHY DATASETS
+    #### CALCULATE TOPOGRAPHY DATASETS IN DEPENDENCY ORDER
 
-    # Calculate integer elevation if it does not already exist
-    if arcpy.Exists(elevation_integer) == 0:
-        print(f'\tCalculating integer elevation...')
-        iteration_start = time.time()
-        calculate_integer_elevation(area_raster, elevation_float, elevation_integer)
-        # End timing
-        iteration_end = time.time()
-        iteration_elapsed = int(iteration_end - iteration_start)
-        iteration_success_time = datetime.datetime.now()
-        # Report success
-        print(
-            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-        print('\t----------')
-    else:
-        print(f'\tInteger elevation already exists.')
-        print('\t----------')
-
-    # Calculate slope in degrees if it does not already exist
-    if os.path.exists(slope_integer) == 0:
-        # Calculate slope
-        print(f'\tCalculating slope...')
-        iteration_start = time.time()
-        calculate_slope(area_raster, elevation_float, z_unit, slope_float, slope_integer)
-        # End timing
-        iteration_end = time.time()
-        iteration_elapsed = int(iteration_end - iteration_start)
-        iteration_success_time = datetime.datetime.now()
-        # Report success
-        print(
-            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-        print('\t----------')
-    else:
-        print(f'\tRaw slope already exists.')
-        print('\t----------')
-
-    # Calculate aspect if it does not already exist
-    if os.path.exists(aspect_integer) == 0:
-        # Calculate aspect
-        print(f'\tCalculating aspect...')
-        iteration_start = time.time()
-        calculate_aspect(area_raster, elevation_float, z_unit, aspect_float, aspect_integer)
-        # End timing
-        iteration_end = time.time()
-        iteration_elapsed = int(iteration_end - iteration_start)
-        iteration_success_time = datetime.datetime.now()
-        # Report success
-        print(
-            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-        print('\t----------')
-    else:
-        print(f'\tAspect already exists.')
-        print('\t----------')
+    # Hash the area and elevation rasters
+    print('\tCalculating input hashes...')
+    input_hashes.update(area=calculate_content_hash([area_raster]),
+                        elevation=calculate_content_hash([elevation_float]))
 
-    # Calculate flow accumulation if it does not already exist
-    if arcpy.Exists(flow_accumulation) == 0:
-        # Calculate flow direction
-        print(f'\tCalculating flow direction...')
-        iteration_start = time.time()
-        calculate_flow(area_raster, elevation_float, flow_accumulation)
-        # End timing
-        iteration_end = time.time()
-        iteration_elapsed = int(iteration_end - iteration_start)
-        iteration_success_time = datetime.datetime.now()
-        # Report success
-        print(
-            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-        print('\t----------')
-    else:
-        print(f'\tFlow direction already exists.')
-        print('\t----------')
+    # Define each topographic property with its outputs, function, arguments, parameters, and the properties that create its inputs
+    task_list = [['elevation', [elevation_integer], 'Calculating integer elevation',
+                  calculate_integer_elevation, (area_raster, elevation_float, elevation_integer), {}, []],
+                 ['slope', [slope_float, slope_integer], 'Calculating slope',
+                  calculate_slope, (area_raster, elevation_float, z_unit, slope_float, slope_integer,
+                                    intermediate_factor['slope']),
+                  {'z_unit': z_unit, 'intermediate_factor': intermediate_factor['slope']}, []],
+                 ['aspect', [aspect_float, aspect_integer], 'Calculating aspect',
+                  calculate_aspect, (area_raster, elevation_float, z_unit, aspect_float, aspect_integer,
+                                     intermediate_factor['aspect']),
+                  {'z_unit': z_unit, 'intermediate_factor': intermediate_factor['aspect']}, []],
+                 ['flow', [flow_accumulation], 'Calculating flow direction',
+                  calculate_flow, (area_raster, elevation_float, flow_accumulation), {}, []],
+                 ['exposure', [exposure_output], 'Calculating solar exposure',
+                  calculate_exposure, (area_raster, aspect_float, slope_float, 100, exposure_output,
+                                       slope_factor, aspect_factor),
+                  {'conversion_factor': 100}, ['slope', 'aspect']],
+                 ['heat_load', [heatload_output], 'Calculating heat load index',
+                  calculate_heat_load, (area_raster, elevation_float, slope_float, aspect_float, 10000,
+                                        heatload_output, slope_factor, aspect_factor),
+                  {'conversion_factor': 10000}, ['slope', 'aspect']],
+                 ['position', [position_output], 'Calculating topographic position',
+                  calculate_position, (area_raster, elevation_float, position_width, position_output),
+                  {'position_width': position_width}, []],
+                 ['radiation', [radiation_output], 'Calculating topographic radiation',
+                  calculate_radiation, (area_raster, aspect_float, 1000, radiation_output, aspect_factor),
+                  {'conversion_factor': 1000}, ['aspect']],
+                 ['roughness', [roughness_output], 'Calculating roughness',
+                  calculate_roughness, (area_raster, elevation_float, 10, roughness_output),
+                  {'conversion_factor': 10}, []],
+                 ['surface_area', [surfacearea_output], 'Calculating surface area ratio',
+                  calculate_surface_area, (area_raster, slope_float, 10, surfacearea_output, slope_factor),
+                  {'conversion_factor': 10}, ['slope']],
+                 ['surface_relief', [surfacerelief_output], 'Calculating surface relief ratio',
+                  calculate_surface_relief, (area_raster, elevation_float, 10000, surfacerelief_output),
+                  {'conversion_factor': 10000}, []],
+                 ['wetness', [wetness_output], 'Calculating topographic wetness',
+                  calculate_wetness, (area_raster, elevation_float, flow_accumulation, slope_float, 100,
+                                      wetness_output, slope_factor), {'conversion_factor': 100}, ['flow', 'slope']]]
+    task_list += [[f'{curvature_type}_curvature', [curvature_output], f'Calculating {curvature_type} curvature',
+                   calculate_curvature, (area_raster, elevation_float, z_unit, curvature_type, 10000, curvature_output),
+                   {'z_unit': z_unit, 'conversion_factor': 10000}, []]
+                  for curvature_type, curvature_output in curvature_list]
 
-    #### CALCULATE DERIVED TOPOGRAPHY DATASETS
+    # Divide the cores among concurrent tasks and give each task its own scratch folder if there are workers
+    processing_factor = '50%'
+    scratch_folder = None
+    if worker_count > 1:
+        processing_factor = f'{max(100 // worker_count, 1)}%'
+        scratch_folder = os.path.join(float_folder, 'scratch')
 
-    # Calculate solar exposure index if it does not already exist
-    if arcpy.Exists(exposure_output) == 0:
-        print(f'\tCalculating solar exposure...')
-        iteration_start = time.time()
-        calculate_exposure(area_raster, aspect_float, slope_float, 100, exposure_output)
-        # End timing
-        iteration_end = time.time()
-        iteration_elapsed = int(iteration_end - iteration_start)
-        iteration_success_time = datetime.datetime.now()
-        # Report success
-        print(
-            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-        print('\t----------')
-    else:
-        print(f'\tSite exposure already exists.')
-        print('\t----------')
-
-    # Calculate heat load index if it does not already exist
-    if arcpy.Exists(heatload_output) == 0:
-        print('\tCalculating heat load index...')
-        iteration_start = time.time()
-        calculate_heat_load(area_raster, elevation_float, slope_float, aspect_float, 10000, heatload_output)
-        # End timing
-        iteration_end = time.time()
-        iteration_elapsed = int(iteration_end - iteration_start)
-        iteration_success_time = datetime.datetime.now()
-        # Report success
-        print(
-            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-        print('\t----------')
-    else:
-        print(f'\tHeat load index already exists.')
-        print('\t----------')
-
-    # Calculate topographic position if it does not already exist
-    if arcpy.Exists(position_output) == 0:
-        print(f'\tCalculating topographic position...')
-        iteration_start = time.time()
-        calculate_position(area_raster, elevation_float, position_width, position_output)
-        # End timing
-        iteration_end = time.time()
-        iteration_elapsed = int(iteration_end - iteration_start)
-        iteration_success_time = datetime.datetime.now()
-        # Report success
-        print(
-            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-        print('\t----------')
-    else:
-        print(f'\tTopographic position already exists.')
-        print('\t----------')
-
-    # Calculate topographic radiation if it does not already exist
-    if arcpy.Exists(radiation_output) == 0:
-        print(f'\tCalculating topographic radiation...')
-        iteration_start = time.time()
-        calculate_radiation(area_raster, aspect_float, 1000, radiation_output)
-        # End timing
-        iteration_end = time.time()
-        iteration_elapsed = int(iteration_end - iteration_start)
-        iteration_success_time = datetime.datetime.now()
-        # Report success
-        print(
-            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-        print('\t----------')
-    else:
-        print(f'\tTopographic radiation already exists.')
-        print('\t----------')
-
-    # Calculate roughness if it does not already exist
-    if arcpy.Exists(roughness_output) == 0:
-        print(f'\tCalculating roughness...')
-        iteration_start = time.time()
-        calculate_roughness(area_raster, elevation_float, 10, roughness_output)
-        # End timing
-        iteration_end = time.time()
-        iteration_elapsed = int(iteration_end - iteration_start)
-        iteration_success_time = datetime.datetime.now()
-        # Report success
-        print(
-            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-        print('\t----------')
-    else:
-        print(f'\tRoughness already exists.')
-        print('\t----------')
-
-    # Calculate surface area ratio if it does not already exist
-    if os.path.exists(surfacearea_output) == 0:
-        print(f'\tCalculating surface area ratio...')
-        iteration_start = time.time()
-        calculate_surface_area(area_raster, slope_float, 10, surfacearea_output)
-        # End timing
-        iteration_end = time.time()
-        iteration_elapsed = int(iteration_end - iteration_start)
-        iteration_success_time = datetime.datetime.now()
-        # Report success
-        print(
-            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-        print('\t----------')
-    else:
-        print(f'\tSurface area ratio already exists.')
-        print('\t----------')
-
-    # Calculate surface relief ratio if it does not already exist
-    if arcpy.Exists(surfacerelief_output) == 0:
-        print(f'\tCalculating surface relief ratio...')
-        iteration_start = time.time()
-        calculate_surface_relief(area_raster, elevation_float, 10000, surfacerelief_output)
-        # End timing
-        iteration_end = time.time()
-        iteration_elapsed = int(iteration_end - iteration_start)
-        iteration_success_time = datetime.datetime.now()
-        # Report success
-        print(
-            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-        print('\t----------')
-    else:
-        print(f'\tSurface relief ratio already exists.')
-        print('\t----------')
+    # Define tasks for outputs that do not already exist or that are out of date
+    task_dictionary = dict()
+    for task, output_list, message, task_function, task_arguments, parameter_dictionary, dependencies in task_list:
+        parameter_dictionary.update(engine='arcpy', output=task)
+        task_outputs[task] = [task]
+        if check_current(task, output_list, parameter_dictionary, dependencies) == 0:
+            scratch_workspace = None
+            if scratch_folder is not None:
+                scratch_workspace = os.path.join(scratch_folder, task)
+                os.makedirs(scratch_workspace, exist_ok=True)
+            task_function = partial(task_function, processing_factor=processing_factor,
+                                    scratch_workspace=scratch_workspace)
+            task_dictionary[task] = (message, task_function, task_arguments, dependencies)
+        else:
+            print(f'\t{os.path.split(output_list[-1])[1]} already exists and is up to date.')
+    print('\t----------')
 
-    # Calculate topographic wetness if it does not already exist
-    if arcpy.Exists(wetness_output) == 0:
-        print(f'\tCalculating topographic wetness...')
-        iteration_start = time.time()
-        calculate_wetness(area_raster, elevation_float, flow_accumulation, slope_float, 100, wetness_output)
-        # End timing
-        iteration_end = time.time()
-        iteration_elapsed = int(iteration_end - iteration_start)
-        iteration_success_time = datetime.datetime.now()
-        # Report success
-        print(f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-        print('\t----------')
-    else:
-        print(f'\tTopographic wetness already exists.')
-        print('\t----------')
+    # Execute tasks as soon as their inputs exist and record finished outputs
+    execute_task_graph(task_dictionary, worker_count, record_task)
 
     outprocess = f'Finished calculating topographic properties.'
     return outprocess
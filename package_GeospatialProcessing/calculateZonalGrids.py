@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Calculate zonal grids
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy and rasterio. Scripts that call this function with more than one worker must start processing under an if __name__ == '__main__' block.
+# Description: "Calculate zonal grids" is a function that calculates zonal statistics of input rasters for a set of zone rasters, such as the gridded segment rasters, as tasks of one zone raster and a batch of input rasters on a process pool, sizing each task to a memory budget per worker and recording each finished task in a checkpoint so that an interrupted run resumes with the unfinished tasks.
+# ---------------------------------------------------------------------------
+
+# Define a function to calculate zonal statistics for many zone rasters on a process pool
+def calculate_zonal_grids(**kwargs):
+    """
+    Description: calculates zonal statistics of all input rasters for each zone raster in parallel batches with a checkpoint of finished outputs
+    Inputs: 'statistic' -- a string value or list of 'MEAN' and 'STD'
+            'zone_field' -- a string value of the field to use from the zone raster to define zones
+            'work_geodatabase' -- a geodatabase to store temporary results
+            'zone_array' -- an array of zone rasters, such as one gridded segment raster for each grid
+            'input_array' -- an array of input rasters to summarize for every zone raster
+            'output_array' -- an array with one output folder for each zone raster, or for the table output format one output csv table for each zone raster
+            'point_array' -- an optional array with one csv table of segment points for each zone raster for the table output format
+            'output_format' -- an optional string value of either 'raster' (default) to write a summary raster for each statistic of each input raster or 'table' to write a csv table of segments by inputs for each zone raster
+            'index_folder' -- an optional folder of cached zone indexes (defaults to an index folder beside the checkpoint file)
+            'worker_count' -- an optional integer number of worker processes (defaults to 1)
+            'memory_budget' -- an optional number of gigabytes of memory that each worker may use (defaults to 4)
+            'batch_size' -- an optional maximum integer number of input rasters per task (defaults to the size that creates about four tasks per worker)
+            'block_size' -- an optional integer number of rows and columns per processing block, which is reduced for zone rasters that do not fit the memory budget
+            'checkpoint_file' -- an optional JSON file to record finished outputs (defaults to Zonal_Checkpoint.json in the folder that contains the first output)
+    Returned Value: Returns a raster for each statistic of each input raster in the output folder of each zone raster, named for the input raster with a suffix of the statistic for statistics other than the mean, or a csv table for each zone raster
+    Preconditions: zone rasters and input rasters must be accessible to all workers; outputs are recorded in the checkpoint only after the task that creates them has finished, so outputs of interrupted tasks are recalculated; input rasters are identified in the checkpoint by file size and modification time and zone rasters by content hash; table columns are written to part tables beside the checkpoint and merged into the output table when all columns of a zone raster are finished
+    """
+
+    # Import packages
+    import functools
+    import json
+    import math
+    import numpy as np
+    import os
+    import rasterio
+    from package_GeospatialProcessing.calculateContentHash import calculate_content_hash
+    from package_GeospatialProcessing.calculateZonalStatistics import calculate_zonal_statistics
+    from package_GeospatialProcessing.executeTaskGraph import execute_task_graph
+    from package_GeospatialProcessing.mergeZonalTables import merge_zonal_tables
+    from package_GeospatialProcessing.summarizeZoneIndex import summarize_zone_index
+    from package_GeospatialProcessing.updateBuildManifest import update_build_manifest
+
+    # Parse key word argument inputs
+    statistic = kwargs['statistic']
+    zone_field = kwargs['zone_field']
+    work_geodatabase = kwargs['work_geodatabase']
+    zone_rasters = kwargs['zone_array']
+    input_rasters = kwargs['input_array']
+    output_list = kwargs['output_array']
+    point_tables = kwargs.get('point_array', [None] * len(zone_rasters))
+    output_format = kwargs.get('output_format', 'raster')
+    worker_count = kwargs.get('worker_count', 1)
+    memory_budget = kwargs.get('memory_budget', 4)
+    batch_size = kwargs.get('batch_size', None)
+    block_size = kwargs.get('block_size', 1024)
+    checkpoint_file = kwargs.get('checkpoint_file', os.path.join(os.path.split(output_list[0])[0],
+                                                                 'Zonal_Checkpoint.json'))
+    checkpoint_folder = os.path.split(checkpoint_file)[0]
+    index_folder = kwargs.get('index_folder', os.path.join(checkpoint_folder, 'index'))
+    part_folder = os.path.join(checkpoint_folder, 'parts')
+
+    # Define statistics
+    statistic_list = [statistic] if isinstance(statistic, str) else list(statistic)
+    statistic_list = [statistic_name.upper() for statistic_name in statistic_list]
+    if len(output_list) != len(zone_rasters) or len(point_tables) != len(zone_rasters):
+        raise ValueError('Output array and point array must contain one entry for each zone raster.')
+    zone_names = [os.path.splitext(os.path.split(zone_raster)[1])[0] for zone_raster in zone_rasters]
+    if len(set(zone_names)) != len(zone_names):
+        raise ValueError('Zone rasters must have unique file names because tasks and part tables are named for them.')
+
+    # Define memory use in bytes for the interpreter and GDAL cache of a worker and each table column of each zone
+    budget_bytes = memory_budget * 1024 ** 3
+    cache_megabytes = 64
+    worker_bytes = (256 + cache_megabytes) * 1024 ** 2
+    float_bytes = np.dtype(np.float64).itemsize
+    integer_bytes = np.dtype(np.int64).itemsize
+    label_bytes = np.dtype(np.int32).itemsize
+    mask_bytes = np.dtype(np.bool_).itemsize
+    column_bytes = float_bytes * len(statistic_list)
+
+    # Define memory use of each cell of a zone raster while it is indexed from the zone values, their mask, and the valid mask, the valid values, their int64 sort order, their sorted copy, the flags and int64 cumulative flags of unique values, and the int64 inverse labels
+    def calculate_index_bytes(value_bytes):
+        return 3 * value_bytes + 3 * mask_bytes + 3 * integer_bytes + label_bytes
+
+    # Define memory use of each cell of a zone raster in a task from the labels, the labels repeated from the index, and the cell indexes of the index
+    def calculate_label_bytes(cell_count):
+        return 2 * label_bytes + (label_bytes if cell_count < 2 ** 31 else integer_bytes)
+
+    # Define memory use of each block cell from the zone, value, and valid masks, the values read and selected from an input raster of at most eight bytes, their float64 copy, the selected labels, and the int64 sort order, sorted copy, flags, two int64 arrays of cumulative flags, and int64 inverse of the labels
+    block_cell_bytes = 4 * mask_bytes + 3 * float_bytes + 2 * label_bytes + 4 * integer_bytes
+
+    # Define memory use of each zone from the zone values and segment positions and the point phase, with six accumulators and four arrays of coordinates, which exceeds the moment phase, with three accumulators, the mean and standard deviation, and three arrays to round and look up a statistic
+    zone_bytes = 2 * integer_bytes + 10 * float_bytes
+
+    # Define function to limit the GDAL cache of the worker processes of a pool, which otherwise defaults to a share of system memory in every worker, and restore the environment of the caller afterwards
+    def execute_limited(task_dictionary, pool_workers, completion_function=None):
+        previous_cache = os.environ.get('GDAL_CACHEMAX')
+        os.environ['GDAL_CACHEMAX'] = str(cache_megabytes)
+        try:
+            return execute_task_graph(task_dictionary, pool_workers, completion_function)
+        finally:
+            if previous_cache is None:
+                del os.environ['GDAL_CACHEMAX']
+            else:
+                os.environ['GDAL_CACHEMAX'] = previous_cache
+
+    #### INDEX ZONE RASTERS
+
+    # Build or load zone indexes on as many workers as fit the combined memory budget of all workers
+    index_bytes = worker_bytes
+    for zone_raster in zone_rasters:
+        with rasterio.open(zone_raster) as zone_dataset:
+            value_bytes = np.dtype(zone_dataset.dtypes[0]).itemsize
+            index_bytes = max(index_bytes, worker_bytes + calculate_index_bytes(value_bytes)
+                              * zone_dataset.height * zone_dataset.width)
+    index_workers = max(1, min(worker_count, int(worker_count * budget_bytes // index_bytes)))
+    print(f'\tIndexing {len(zone_rasters)} zone rasters on {index_workers} workers...')
+    index_tasks = {zone_raster: (f'Indexing zones of {os.path.split(zone_raster)[1]}', summarize_zone_index,
+                                 (zone_raster, index_folder), [])
+                   for zone_raster in zone_rasters}
+    zone_summaries = execute_limited(index_tasks, index_workers)
+
+    #### PLAN TASKS FROM OUTPUTS THAT ARE NOT IN THE CHECKPOINT
+
+    # Read the checkpoint of finished outputs
+    checkpoint_dictionary = dict()
+    if os.path.exists(checkpoint_file):
+        with open(checkpoint_file, 'r') as checkpoint_stream:
+            checkpoint_dictionary = json.load(checkpoint_stream)
+
+    # Define function to calculate the signature of an output from its zone raster, input raster, and statistic
+    def calculate_signature(zone_hash, input_raster, statistic_name, point_table):
+        file_list = [input_raster] if point_table is None else [input_raster, point_table]
+        return calculate_content_hash([], {'zone': zone_hash,
+                                           'inputs': [[os.path.split(file_path)[1],
+                                                       os.path.getsize(file_path),
+                                                       os.stat(file_path).st_mtime_ns]
+                                                      for file_path in file_list],
+                                           'statistic': statistic_name})
+
+    # Define function to check whether a checkpoint entry matches its signature and its file exists
+    def check_current(output_key, signature, output_file):
+        return (os.path.exists(output_file)
+                and checkpoint_dictionary.get(output_key, dict()).get('signature') == signature)
+
+    # Define pending input rasters and their checkpoint entries for each zone raster
+    plan_list = []
+    for zone_raster, output_path, point_table in zip(zone_rasters, output_list, point_tables):
+        zone_hash, zone_count, cell_count = zone_summaries[zone_raster]
+        zone_name = os.path.splitext(os.path.split(zone_raster)[1])[0]
+        pending_dictionary = dict()
+        column_list = []
+        table_entry = dict()
+        for input_raster in input_rasters:
+            raster_name = os.path.split(input_raster)[1]
+            raster_stem = os.path.splitext(raster_name)[0]
+            entry_dictionary = dict()
+            current_list = []
+            for statistic_name in statistic_list:
+                if output_format == 'table':
+                    signature = calculate_signature(zone_hash, input_raster, statistic_name, point_table)
+                    column = raster_stem if statistic_name == 'MEAN' else f'{raster_stem}_{statistic_name}'
+                    column_key = f'{os.path.relpath(output_path, checkpoint_folder)}:{column}'
+                    column_entry = checkpoint_dictionary.get(column_key, dict())
+                    part_table = None
+                    if 'part' in column_entry:
+                        part_table = os.path.join(checkpoint_folder, column_entry['part'])
+                    column_list.append(column)
+                    current_list.append(part_table is not None and check_current(column_key, signature, part_table))
+                    entry_dictionary[column_key] = {'signature': signature}
+                    table_entry[column] = (signature, part_table)
+                else:
+                    output_raster = os.path.join(output_path, raster_name if statistic_name == 'MEAN'
+                                                 else f'{raster_stem}_{statistic_name}.tif')
+                    signature = calculate_signature(zone_hash, input_raster, statistic_name, None)
+                    output_key = os.path.relpath(output_raster, checkpoint_folder)
+                    current_list.append(check_current(output_key, signature, output_raster))
+                    entry_dictionary[output_key] = {'signature': signature, 'output': output_raster}
+            if all(current_list) == 0:
+                pending_dictionary[input_raster] = entry_dictionary
+
+        # Skip tables that are finished with the current columns
+        table_signature = None
+        if output_format == 'table':
+            table_key = os.path.relpath(output_path, checkpoint_folder)
+            table_signature = calculate_content_hash([], {'columns': [[column, table_entry[column][0]]
+                                                                      for column in column_list]})
+            if check_current(table_key, table_signature, output_path):
+                print(f'\tZonal table {os.path.split(output_path)[1]} already exists and is up to date.')
+                continue
+        elif len(pending_dictionary) == 0:
+            print(f'\tZonal summaries for {zone_name} already exist and are up to date.')
+            continue
+        plan_list.append([zone_raster, zone_name, zone_count, cell_count, output_path, point_table,
+                          pending_dictionary, column_list, table_entry, table_signature])
+    if len(plan_list) == 0:
+        print('\t----------')
+        outprocess = f'\tZonal summaries for {len(zone_rasters)} zone rasters already exist and are up to date.'
+        return outprocess
+
+    # Define the number of input rasters per task to create about four tasks per worker
+    pending_count = sum(len(plan[6]) for plan in plan_list)
+    if batch_size is None:
+        batch_size = max(1, math.ceil(pending_count / (4 * worker_count)))
+
+    # Define function to calculate the memory of a task that does not depend on the number of input rasters
+    def calculate_fixed_bytes(cell_count, zone_count, grid_block):
+        return (worker_bytes + calculate_label_bytes(cell_count) * cell_count + block_cell_bytes * grid_block ** 2
+                + zone_bytes * zone_count)
+
+    # Define tasks for batches of pending input rasters that fit the memory budget of a worker
+    task_list = []
+    merge_list = []
+    task_entries = dict()
+    for (zone_raster, zone_name, zone_count, cell_count, output_path, point_table,
+         pending_dictionary, column_list, table_entry, table_signature) in plan_list:
+        # Reduce the block size until the fixed memory of the zone raster fits the memory budget
+        grid_block = block_size
+        fixed_bytes = calculate_fixed_bytes(cell_count, zone_count, grid_block)
+        while fixed_bytes > budget_bytes and grid_block > 256:
+            grid_block = grid_block // 2
+            fixed_bytes = calculate_fixed_bytes(cell_count, zone_count, grid_block)
+
+        # Limit the number of table columns held in memory by the remaining budget
+        grid_batch = batch_size
+        if output_format == 'table':
+            grid_batch = min(grid_batch,
+                             int((budget_bytes - fixed_bytes) // (column_bytes * max(zone_count, 1))))
+        if fixed_bytes > budget_bytes or grid_batch < 1:
+            raise ValueError(f'Zonal summaries for {zone_name} require more than the memory budget of '
+                             f'{memory_budget} GB per worker.')
+
+        # Define a task for each batch of pending input rasters
+        pending_inputs = list(pending_dictionary)
+        batch_tasks = []
+        for batch_start in range(0, len(pending_inputs), grid_batch):
+            batch_inputs = pending_inputs[batch_start:batch_start + grid_batch]
+            task = f'{zone_name}:{batch_start // grid_batch + 1}'
+            kwargs_task = {'statistic': statistic_list,
+                           'zone_field': zone_field,
+                           'work_geodatabase': work_geodatabase,
+                           'engine': 'numpy',
+                           'block_size': grid_block,
+                           'index_folder': index_folder,
+                           'zone_hash': zone_summaries[zone_raster][0],
+                           'input_array': [zone_raster] + batch_inputs}
+            task_entries[task] = dict()
+            for input_raster in batch_inputs:
+                task_entries[task].update(pending_dictionary[input_raster])
+            if output_format == 'table':
+                batch_hash = calculate_content_hash([], {'outputs': sorted(task_entries[task])})
+                part_table = os.path.join(part_folder, f'{zone_name}_{batch_hash[0:16]}.csv')
+                for column_key in task_entries[task]:
+                    task_entries[task][column_key]['part'] = os.path.relpath(part_table, checkpoint_folder)
+                    table_entry[column_key.rsplit(':', 1)[1]] = (task_entries[task][column_key]['signature'],
+                                                                 part_table)
+                kwargs_task.update(output_format='table', point_table=point_table, output_array=[part_table])
+            else:
+                kwargs_task['output_array'] = [task_entries[task][output_key]['output']
+                                               for output_key in task_entries[task]]
+            batch_tasks.append(task)
+            task_list.append([cell_count * len(batch_inputs), task,
+                              (f'Calculating zonal {", ".join(statistic_list).lower()} of '
+                               f'{len(batch_inputs)} rasters for {zone_name}',
+                               functools.partial(calculate_zonal_statistics, **kwargs_task), (), [])])
+
+        # Define a task to merge the part tables of the zone raster when all of its columns are finished
+        if output_format == 'table':
+            part_tables = list(dict.fromkeys(table_entry[column][1] for column in column_list))
+            task = f'{zone_name}:table'
+            task_entries[task] = {os.path.relpath(output_path, checkpoint_folder): {'signature': table_signature}}
+            merge_list.append([0, task, (f'Merging zonal table for {zone_name}', merge_zonal_tables,
+                                         (part_tables, column_list, output_path), batch_tasks)])
+        else:
+            os.makedirs(output_path, exist_ok=True)
+    if output_format == 'table':
+        os.makedirs(part_folder, exist_ok=True)
+
+    # Start the largest tasks first so that the last tasks to finish are short
+    task_list.sort(key=lambda task_item: -task_item[0])
+    task_dictionary = {task: task_definition for task_work, task, task_definition in task_list + merge_list}
+    print(f'\tCalculating {len(task_list)} tasks of up to {batch_size} rasters on {worker_count} workers '
+          f'with a memory budget of {memory_budget} GB per worker...')
+    print('\t----------')
+
+    #### CALCULATE TASKS AND RECORD EACH FINISHED TASK IN THE CHECKPOINT
+
+    # Define function to record the outputs of a finished task in the checkpoint
+    def record_task(task):
+        update_build_manifest(checkpoint_file, task_entries[task])
+
+    # Execute tasks on the process pool
+    execute_limited(task_dictionary, worker_count, record_task)
+
+    # Return success message
+    outprocess = f'\tSuccessfully created zonal {", ".join(statistic_list).lower()} for {len(zone_rasters)} zone rasters.'
+    return outprocess
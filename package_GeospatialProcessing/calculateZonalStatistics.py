@@ -2,28 +2,31 @@
 # ---------------------------------------------------------------------------
 # Calculate zonal statistics
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
-# Description: "Calculate zonal statistics" is a function that calculates zonal statistics of an input raster to a zone raster.
+# Last Updated: 2026-10-17
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation, or in a Python 3.7+ distribution with numpy and rasterio if the numpy engine is selected.
+# Description: "Calculate zonal statistics" is a function that calculates zonal statistics of one or more input rasters to a zone raster.
 # ---------------------------------------------------------------------------
 
 # Define a function to calculate zonal statistics
 def calculate_zonal_statistics(**kwargs):
     """
     Description: calculates integer zonal statistics of an input raster to a zone raster
-    Inputs: 'statistic' -- a string value of the statistic to calculate
+    Inputs: 'statistic' -- a string value of the statistic to calculate, or for the numpy engine a string value or list of 'MEAN' and 'STD'
             'zone_field' -- a string value of the field to use from the zone raster to define zones
             'work_geodatabase' -- a geodatabase to store temporary results
-            'input_array' -- an array containing the area raster, the input raster, and the zone raster
-            'output_array' -- an array containing the output summary raster
-    Returned Value: Returns a raster dataset on disk
-    Preconditions: requires an input raster and zone raster from image segmentation that can be created through other scripts in this repository
+            'input_array' -- an array containing the zone raster (must be first) and the input raster, or for the numpy engine one or more input rasters
+            'output_array' -- an array containing the output summary raster, or for the numpy engine one output raster for each statistic of each input raster in order of the input rasters
+            'engine' -- an optional string value of either 'arcpy' (default) to calculate the statistic with ZonalStatistics or 'numpy' to read the zones once and calculate all statistics of each input raster in a single pass
+            'block_size' -- an optional integer number of rows and columns per processing block for the numpy engine
+            'output_format' -- an optional string value for the numpy engine of either 'raster' (default) to write a summary raster for each output or 'table' to write a csv table to the only output with one row per segment_id, the POINT_X and POINT_Y coordinates, and a column named for each input raster and statistic
+            'index_folder' -- an optional folder of cached zone indexes for the numpy engine that are built once for each zone raster and rebuilt only if the zone raster changes
+            'zone_hash' -- an optional content hash of the zone raster from summarize_zone_index that identifies the cached zone index without reading the zone raster
+            'point_table' -- an optional csv table with segment_id, POINT_X, and POINT_Y fields that defines the rows and coordinates of the output table (defaults to one row for each zone at the zone cell nearest to the zone centroid)
+    Returned Value: Returns a raster dataset on disk for each output or a csv table on disk
+    Preconditions: requires an input raster and zone raster from image segmentation that can be created through other scripts in this repository; the numpy engine uses the raster values as zones and calculates the population standard deviation like ZonalStatistics; table columns are named for the input raster with a suffix of the statistic for statistics other than the mean, and missing values are written as NA
     """
 
     # Import packages
-    import arcpy
-    from arcpy.sa import Raster
-    from arcpy.sa import ZonalStatistics
     import datetime
     import time
 
@@ -34,6 +37,152 @@ def calculate_zonal_statistics(**kwargs):
     zone_raster = kwargs['input_array'][0]
     input_raster = kwargs['input_array'][1]
     output_raster = kwargs['output_array'][0]
+    engine = kwargs.get('engine', 'arcpy')
+    block_size = kwargs.get('block_size', 1024)
+    output_format = kwargs.get('output_format', 'raster')
+    point_table = kwargs.get('point_table', None)
+    index_folder = kwargs.get('index_folder', None)
+    zone_hash = kwargs.get('zone_hash', None)
+
+    #### CALCULATE ZONAL STATISTICS OF ALL INPUT RASTERS FROM ONE SET OF ZONE LABELS
+
+    if engine == 'numpy':
+        # Import packages
+        import csv
+        import numpy as np
+        import os
+        import rasterio
+        from rasterio.windows import Window
+        from package_Geomorphometry import generate_block_windows
+        from package_GeospatialProcessing.accumulateZonalMoments import accumulate_zonal_moments
+        from package_GeospatialProcessing.calculateZonePoints import calculate_zone_points
+        from package_GeospatialProcessing.readZoneLabels import read_zone_labels
+
+        # Define statistics and outputs for each input raster
+        statistic_list = [statistic] if isinstance(statistic, str) else list(statistic)
+        statistic_list = [statistic_name.upper() for statistic_name in statistic_list]
+        for statistic_name in statistic_list:
+            if statistic_name not in ['MEAN', 'STD']:
+                raise ValueError(f'Statistic {statistic_name} is not supported by the numpy engine.')
+        input_rasters = kwargs['input_array'][1:]
+        if output_format == 'raster' and len(kwargs['output_array']) != len(input_rasters) * len(statistic_list):
+            raise ValueError('Output array must contain one output raster for each statistic of each input raster.')
+        output_iterator = iter(kwargs['output_array'])
+
+        # Read zone labels once for all input rasters
+        print('\t\tReading zone labels...')
+        zone_values, label_array = read_zone_labels(zone_raster, index_folder, zone_hash)
+        zone_count = zone_values.shape[0]
+        print(f'\t\tZone raster contains {zone_count} zones.')
+        print('\t\t----------')
+
+        # Calculate statistics for each input raster
+        zone_dataset = rasterio.open(zone_raster)
+        column_names = []
+        column_values = []
+        input_count = 1
+        for input_raster in input_rasters:
+            print(f'\t\tCalculating zonal {", ".join(statistic_list).lower()} of raster {input_count} '
+                  f'of {len(input_rasters)}...')
+            iteration_start = time.time()
+            input_count += 1
+
+            # Accumulate count, mean, and sum of squared deviations for each zone in one pass
+            count_array, mean_array, deviation_array = accumulate_zonal_moments(zone_dataset, label_array, zone_count,
+                                                                                input_raster, block_size)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                mean_array = np.where(count_array > 0, mean_array, np.nan)
+                standard_deviation = np.sqrt(deviation_array / count_array)
+            statistic_dictionary = {'MEAN': mean_array, 'STD': standard_deviation}
+
+            # Determine output value type and no data value from input raster
+            with rasterio.open(input_raster) as input_dataset:
+                value_type = input_dataset.dtypes[0]
+                no_data_value = input_dataset.nodata
+            if no_data_value is None:
+                value_type = 'float32'
+                no_data_value = -2147483648
+            output_profile = zone_dataset.profile.copy()
+            output_profile.update(driver='GTiff', dtype=value_type, nodata=no_data_value, count=1,
+                                  tiled=True, blockxsize=256, blockysize=256, BIGTIFF='IF_SAFER')
+
+            # Round statistics of integer rasters and store or write each statistic
+            for statistic_name in statistic_list:
+                zone_statistic = statistic_dictionary[statistic_name]
+                if np.issubdtype(np.dtype(value_type), np.integer):
+                    value_range = np.iinfo(np.dtype(value_type))
+                    zone_statistic = np.clip(np.trunc(zone_statistic + 0.5), value_range.min, value_range.max)
+                if output_format == 'table':
+                    raster_name = os.path.splitext(os.path.split(input_raster)[1])[0]
+                    column_names.append(raster_name if statistic_name == 'MEAN' else f'{raster_name}_{statistic_name}')
+                    column_values.append((zone_statistic, np.issubdtype(np.dtype(value_type), np.integer)))
+                    continue
+                output_raster = next(output_iterator)
+                value_lookup = np.append(np.where(np.isnan(zone_statistic), no_data_value, zone_statistic),
+                                         no_data_value).astype(value_type)
+                with rasterio.open(output_raster, 'w', **output_profile) as output_dataset:
+                    for row_offset, column_offset, block_height, block_width in generate_block_windows(
+                            zone_dataset.height, zone_dataset.width, block_size):
+                        label_block = label_array[row_offset:row_offset + block_height,
+                                                  column_offset:column_offset + block_width]
+                        output_dataset.write(value_lookup[label_block], 1,
+                                             window=Window(column_offset, row_offset, block_width, block_height))
+
+            # Report success
+            iteration_end = time.time()
+            iteration_elapsed = int(iteration_end - iteration_start)
+            iteration_success_time = datetime.datetime.now()
+            print(
+                f'\t\t{os.path.split(input_raster)[1]} completed at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+            print('\t\t----------')
+
+        # Write one row per segment and one column per statistic of each input raster
+        if output_format == 'table':
+            output_table = kwargs['output_array'][0]
+            print(f'\t\tWriting {len(column_names)} zonal statistics to table...')
+            if point_table is None:
+                point_x, point_y = calculate_zone_points(label_array, zone_count, zone_dataset.transform, block_size)
+                segment_ids = zone_values
+                segment_index = np.arange(zone_count)
+            else:
+                with open(point_table, 'r', newline='') as point_stream:
+                    point_rows = list(csv.DictReader(point_stream))
+                segment_ids = np.array([int(float(row['segment_id'])) for row in point_rows], dtype=np.int64)
+                point_x = np.array([float(row['POINT_X']) for row in point_rows])
+                point_y = np.array([float(row['POINT_Y']) for row in point_rows])
+                segment_index = np.searchsorted(zone_values, segment_ids)
+                found_mask = segment_index < zone_count
+                found_mask[found_mask] = zone_values[segment_index[found_mask]] == segment_ids[found_mask]
+                segment_index[~found_mask] = -1
+            temporary_table = output_table + '.temporary'
+            with open(temporary_table, 'w', newline='') as table_stream:
+                table_writer = csv.writer(table_stream)
+                table_writer.writerow(['segment_id', 'POINT_X', 'POINT_Y'] + column_names)
+                for row_number in range(segment_ids.shape[0]):
+                    zone_index = segment_index[row_number]
+                    row_values = []
+                    for zone_statistic, integer_value in column_values:
+                        if zone_index < 0 or np.isnan(zone_statistic[zone_index]):
+                            row_values.append('NA')
+                        elif integer_value:
+                            row_values.append(int(zone_statistic[zone_index]))
+                        else:
+                            row_values.append(repr(float(zone_statistic[zone_index])))
+                    table_writer.writerow([int(segment_ids[row_number]),
+                                           repr(float(point_x[row_number])),
+                                           repr(float(point_y[row_number]))] + row_values)
+            os.replace(temporary_table, output_table)
+            print('\t\t----------')
+        zone_dataset.close()
+
+        # Return success message
+        outprocess = f'\tSuccessfully created zonal {", ".join(statistic_list).lower()} for {len(input_rasters)} rasters.'
+        return outprocess
+
+    # Import arcpy for the arcpy engine
+    import arcpy
+    from arcpy.sa import Raster
+    from arcpy.sa import ZonalStatistics
 
     # Set overwrite option
     arcpy.env.overwriteOutput = True
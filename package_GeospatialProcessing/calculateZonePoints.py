@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Calculate zone points
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy.
+# Description: "Calculate zone points" is a function that calculates a representative point inside each zone of a labeled zone raster as the center of the zone cell nearest to the zone centroid.
+# ---------------------------------------------------------------------------
+
+# Define a function to calculate a representative point for each zone
+def calculate_zone_points(label_array, zone_count, transform, block_size=1024):
+    """
+    Description: calculates the coordinates of the cell of each zone that is nearest to the centroid of the zone
+    Inputs: 'label_array' -- an integer array of zone labels from read_zone_labels
+            'zone_count' -- the number of zones, which is also the label of cells without a zone
+            'transform' -- the affine transform of the zone raster
+            'block_size' -- an integer number of rows and columns per processing block
+    Returned Value: Returns a tuple of two float64 arrays of length zone_count for the x and y coordinates of the point of each zone
+    Preconditions: points always fall inside their zone, unlike centroids of concave zones, so that the points can be buffered and converted back to the zone raster; ties are resolved to the first cell in row-major order
+    """
+
+    # Import packages
+    import numpy as np
+    from package_Geomorphometry import generate_block_windows
+
+    # Calculate the centroid of each zone in pixel coordinates from sums over the zones of each block
+    count_array = np.zeros(zone_count, dtype=np.float64)
+    row_array = np.zeros(zone_count, dtype=np.float64)
+    column_array = np.zeros(zone_count, dtype=np.float64)
+    block_list = list(generate_block_windows(label_array.shape[0], label_array.shape[1], block_size))
+    for row_offset, column_offset, block_height, block_width in block_list:
+        label_block = label_array[row_offset:row_offset + block_height, column_offset:column_offset + block_width]
+        zone_rows, zone_columns = np.nonzero(label_block < zone_count)
+        if zone_rows.shape[0] == 0:
+            continue
+        block_zones, block_labels = np.unique(label_block[zone_rows, zone_columns], return_inverse=True)
+        block_labels = block_labels.reshape(-1)
+        count_array[block_zones] += np.bincount(block_labels)
+        row_array[block_zones] += np.bincount(block_labels, weights=zone_rows + row_offset + 0.5)
+        column_array[block_zones] += np.bincount(block_labels, weights=zone_columns + column_offset + 0.5)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        row_array = row_array / count_array
+        column_array = column_array / count_array
+
+    # Find the cell of each zone nearest to the centroid
+    best_distance = np.full(zone_count, np.inf)
+    best_row = np.zeros(zone_count, dtype=np.float64)
+    best_column = np.zeros(zone_count, dtype=np.float64)
+    for row_offset, column_offset, block_height, block_width in block_list:
+        label_block = label_array[row_offset:row_offset + block_height, column_offset:column_offset + block_width]
+        zone_rows, zone_columns = np.nonzero(label_block < zone_count)
+        if zone_rows.shape[0] == 0:
+            continue
+        zone_labels = label_block[zone_rows, zone_columns]
+        cell_rows = zone_rows + row_offset + 0.5
+        cell_columns = zone_columns + column_offset + 0.5
+        distance = (cell_rows - row_array[zone_labels]) ** 2 + (cell_columns - column_array[zone_labels]) ** 2
+        cell_order = np.lexsort((distance, zone_labels))
+        block_labels, first_index = np.unique(zone_labels[cell_order], return_index=True)
+        block_cells = cell_order[first_index]
+        closer_mask = distance[block_cells] < best_distance[block_labels]
+        block_labels = block_labels[closer_mask]
+        block_cells = block_cells[closer_mask]
+        best_distance[block_labels] = distance[block_cells]
+        best_row[block_labels] = cell_rows[block_cells]
+        best_column[block_labels] = cell_columns[block_cells]
+
+    # Convert pixel coordinates to map coordinates
+    point_x, point_y = transform * (best_column, best_row)
+    missing_mask = count_array == 0
+    point_x = np.where(missing_mask, np.nan, point_x)
+    point_y = np.where(missing_mask, np.nan, point_y)
+
+    return point_x, point_y
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Execute task graph
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution. Tasks that use arcpy must be executed in an ArcGIS Pro Python 3.7 installation.
+# Description: "Execute task graph" is a function that executes a set of processing functions with dependencies on a process pool, starting each task as soon as the tasks that create its inputs have finished.
+# ---------------------------------------------------------------------------
+
+# Define a function to execute tasks in dependency order on a process pool
+def execute_task_graph(task_dictionary, worker_count=1, completion_function=None):
+    """
+    Description: executes tasks in dependency order, in sequence with one worker or concurrently on a process pool with more than one worker
+    Inputs: 'task_dictionary' -- a dictionary with task names as keys and tuples of a progress message, a function defined at module level, a tuple of positional arguments, and a list of the task names that must finish first as values
+            'worker_count' -- an integer number of worker processes, where 1 executes tasks in the current process
+            'completion_function' -- an optional function called with the task name in the current process after each task finishes, such as to record finished outputs
+    Returned Value: Returns a dictionary with task names as keys and the returned values of the task functions as values
+    Preconditions: dependencies on task names that are not in the dictionary are treated as finished so that tasks with existing outputs can be left out; ready tasks with the longest chain of dependent tasks are started first
+    """
+
+    # Import packages
+    import datetime
+    import time
+    from concurrent.futures import FIRST_COMPLETED
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures import wait
+
+    # Remove dependencies on tasks that are not in the graph
+    dependency_dictionary = {task: set(dependency for dependency in task_dictionary[task][3]
+                                       if dependency in task_dictionary)
+                             for task in task_dictionary}
+
+    # Calculate the length of the longest chain of dependent tasks after each task to prioritize the critical path
+    dependent_dictionary = {task: [] for task in task_dictionary}
+    for task, dependencies in dependency_dictionary.items():
+        for dependency in dependencies:
+            dependent_dictionary[dependency].append(task)
+    chain_dictionary = dict()
+    def chain_length(task, visited=()):
+        if task in visited:
+            raise ValueError(f'Task graph contains a cycle through {task}.')
+        if task not in chain_dictionary:
+            chain_dictionary[task] = 1 + max([chain_length(dependent, visited + (task,))
+                                              for dependent in dependent_dictionary[task]], default=0)
+        return chain_dictionary[task]
+    for task in task_dictionary:
+        chain_length(task)
+
+    # Define function to list tasks whose dependencies have finished
+    result_dictionary = dict()
+    def list_ready(submitted_tasks):
+        ready_tasks = [task for task in task_dictionary
+                       if task not in submitted_tasks and dependency_dictionary[task].issubset(result_dictionary)]
+        return sorted(ready_tasks, key=lambda task: -chain_dictionary[task])
+
+    # Define function to report success
+    def report_success(task, iteration_start):
+        if completion_function is not None:
+            completion_function(task)
+        message = task_dictionary[task][0]
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        print(
+            f'\t{message} completed at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+
+    # Execute tasks in the current process if there is one worker
+    submitted_tasks = set()
+    if worker_count <= 1:
+        ready_tasks = list_ready(submitted_tasks)
+        while ready_tasks:
+            task = ready_tasks[0]
+            message, task_function, task_arguments = task_dictionary[task][0:3]
+            print(f'\t{message}...')
+            iteration_start = time.time()
+            submitted_tasks.add(task)
+            result_dictionary[task] = task_function(*task_arguments)
+            report_success(task, iteration_start)
+            ready_tasks = list_ready(submitted_tasks)
+        return result_dictionary
+
+    # Execute tasks on a process pool as soon as their dependencies finish
+    with ProcessPoolExecutor(max_workers=worker_count) as executor:
+        running_dictionary = dict()
+        while len(result_dictionary) < len(task_dictionary):
+            # Submit ready tasks
+            for task in list_ready(submitted_tasks):
+                message, task_function, task_arguments = task_dictionary[task][0:3]
+                print(f'\t{message}...')
+                submitted_tasks.add(task)
+                running_dictionary[executor.submit(task_function, *task_arguments)] = (task, time.time())
+
+            # Wait for a running task to finish and stop all tasks if it failed
+            finished_futures, pending_futures = wait(running_dictionary, return_when=FIRST_COMPLETED)
+            for future in finished_futures:
+                task, iteration_start = running_dictionary.pop(future)
+                try:
+                    result_dictionary[task] = future.result()
+                except Exception:
+                    for pending_future in pending_futures:
+                        pending_future.cancel()
+                    raise
+                report_success(task, iteration_start)
+
+    return result_dictionary
@@ -2,8 +2,8 @@
 # ---------------------------------------------------------------------------
 # Generate flowlines
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-17
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
+# Last Updated: 2026-10-17
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation. The numpy engine also requires numpy and rasterio, and fiona to write traced lines, but not the Spatial Analyst extension.
 # Description: "Generate flowlines" is a function that calculates flowlines from a float elevation raster.
 # ---------------------------------------------------------------------------
 
@@ -15,8 +15,13 @@ def generate_flowlines(**kwargs):
             'fill_value' -- a value in the vertical units of the elevation raster to set as the fill limit
             'work_geodatabase' -- a geodatabase to store temporary results
             'input_array' -- an array containing the area feature class (must be first), the float elevation raster (must be second), and an optional mask raster (if present, must be last)
-            'output_array' -- an array containing the the river feature class and the stream feature class
-    Returned Value: Returns a set filled elevation raster and a set of flowline feature classes on disk
+            'output_array' -- an array containing the the river feature class and the stream feature class, which the numpy engine traces along flow direction and writes without arcpy if both end in '.gpkg' or '.geojson'
+            'engine' -- an optional string value of either 'arcpy' (default) to use Spatial Analyst or 'numpy' to fill, route, accumulate, and order flow in memory
+            'conditioning' -- an optional string value for the numpy engine of either 'fill' (default) to fill depressions or 'breach' to breach depressions with least-cost paths before filling the depressions that remain
+            'breach_depth' -- an optional value in the vertical units for the maximum cut of a breach path (defaults to 3)
+            'breach_length' -- an optional length in the horizontal units for the maximum length of a breach path (defaults to 100)
+            'cache_folder' -- an optional folder in which the numpy engine caches filled elevation, flow direction, and flow accumulation by a hash of the elevation, calculation area, fill value, and conditioning parameters (defaults to a flow_cache folder beside the elevation raster)
+    Returned Value: Returns a set filled elevation raster and a set of flowline feature classes on disk, plus a D8 flow direction raster beside the elevation raster if the numpy engine is selected
     Preconditions: requires an input elevation raster that can be created through other scripts in this repository
     """
 
@@ -31,7 +36,10 @@ def generate_flowlines(**kwargs):
     from arcpy.sa import StreamOrder
     import datetime
     import os
+    import shutil
     import time
+    from package_Geomorphometry import calculate_stream_rasters
+    from package_GeospatialProcessing.calculateContentHash import calculate_content_hash
 
     # Parse key word argument inputs
     threshold = kwargs['threshold']
@@ -39,13 +47,25 @@ def generate_flowlines(**kwargs):
     work_geodatabase = kwargs['work_geodatabase']
     area_feature = kwargs['input_array'][0]
     elevation_raster = kwargs['input_array'][1]
-    river_feature = kwargs['output_array'][1]
-    stream_feature = kwargs['output_array'][2]
+    river_feature = kwargs['output_array'][0]
+    stream_feature = kwargs['output_array'][1]
+    engine = kwargs.get('engine', 'arcpy')
+    conditioning = kwargs.get('conditioning', 'fill')
+    breach_depth = kwargs.get('breach_depth', 3)
+    breach_length = kwargs.get('breach_length', 100)
+    cache_folder = kwargs.get('cache_folder', None)
 
     # Define intermediate dataset
     topography_folder = os.path.split(elevation_raster)[0]
     area_buffer = os.path.join(work_geodatabase, 'StudyArea_Buffer_5km')
     buffer_raster = os.path.join(topography_folder, 'Buffer_Raster.tif')
+    river_raster = os.path.join(topography_folder, 'River_Raster.tif')
+    stream_raster = os.path.join(topography_folder, 'Stream_Raster.tif')
+    direction_raster = os.path.join(topography_folder, 'Flow_Direction_D8.tif')
+    if cache_folder is None:
+        cache_folder = os.path.join(topography_folder, 'flow_cache')
+    trace_lines = engine == 'numpy' and all(os.path.splitext(feature)[1].lower() in ('.gpkg', '.geojson')
+                                            for feature in [river_feature, stream_feature])
 
     # Set overwrite option
     arcpy.env.overwriteOutput = True
@@ -87,93 +107,105 @@ def generate_flowlines(**kwargs):
     print(f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
     print('\t----------')
 
-    # Extract elevation to calculation area
-    print('\tExtracting elevation raster...')
-    iteration_start = time.time()
-    elevation_extract = ExtractByMask(Raster(elevation_raster), buffer_raster)
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
-
-    # Fill elevation
-    print('\tFilling elevation raster...')
-    iteration_start = time.time()
-    fill_raster = Fill(elevation_extract, fill_value)
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
+    # Calculate river and stream rasters in memory if the numpy engine is selected
+    if engine == 'numpy':
+        print('\tCalculating river and stream rasters...')
+        iteration_start = time.time()
+        mask_raster = kwargs['input_array'][2] if len(kwargs['input_array']) == 3 else None
+        # Define cached flow rasters by the content of the elevation and calculation area and the conditioning parameters
+        parameter_dictionary = {'fill_value': fill_value}
+        if conditioning == 'breach':
+            parameter_dictionary.update(conditioning=conditioning, breach_depth=breach_depth,
+                                        breach_length=breach_length)
+        cache_key = calculate_content_hash([elevation_raster, buffer_raster], parameter_dictionary)
+        cache_dictionary = {'fill': os.path.join(cache_folder, cache_key, 'Fill.tif'),
+                            'direction': os.path.join(cache_folder, cache_key, 'Flow_Direction.tif'),
+                            'accumulation': os.path.join(cache_folder, cache_key, 'Flow_Accumulation.tif')}
+        line_dictionary = {'river': river_feature, 'stream': stream_feature} if trace_lines else None
+        calculate_stream_rasters(buffer_raster, elevation_raster, fill_value, threshold,
+                                 river_raster, stream_raster, mask_raster, cache_dictionary, line_dictionary,
+                                 conditioning, breach_depth, breach_length)
+        # Export D8 flow direction for height above nearest drainage
+        shutil.copyfile(cache_dictionary['direction'], direction_raster)
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+    else:
+        # Extract elevation to calculation area
+        print('\tExtracting elevation raster...')
+        iteration_start = time.time()
+        elevation_extract = ExtractByMask(Raster(elevation_raster), buffer_raster)
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
 
-    # Calculate flow direction
-    print('\tCalculating flow direction...')
-    iteration_start = time.time()
-    direction_raster = FlowDirection(fill_raster, 'NORMAL', '', 'D8')
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
+        # Fill elevation
+        print('\tFilling elevation raster...')
+        iteration_start = time.time()
+        fill_raster = Fill(elevation_extract, fill_value)
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
 
-    # Calculate flow accumulation
-    print('\tCalculating flow accumulation...')
-    iteration_start = time.time()
-    accumulation_raster = FlowAccumulation(direction_raster, '', 'FLOAT', 'D8')
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
+        # Calculate flow direction
+        print('\tCalculating flow direction...')
+        iteration_start = time.time()
+        direction_grid = FlowDirection(fill_raster, 'NORMAL', '', 'D8')
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
 
-    # Apply threshold to the flow accumulation
-    print('\tDefining stream network from flow accumulation...')
-    iteration_start = time.time()
-    stream_definition = f'VALUE >= {threshold}'
-    stream_raster = Con(accumulation_raster, 1, '', stream_definition)
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
+        # Calculate flow accumulation
+        print('\tCalculating flow accumulation...')
+        iteration_start = time.time()
+        accumulation_raster = FlowAccumulation(direction_grid, '', 'FLOAT', 'D8')
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
 
-    # Calculate stream order
-    print('\tDefining stream order...')
-    iteration_start = time.time()
-    stream_order = StreamOrder(stream_raster, direction_raster, 'STRAHLER')
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
+        # Apply threshold to the flow accumulation
+        print('\tDefining stream network from flow accumulation...')
+        iteration_start = time.time()
+        stream_definition = f'VALUE >= {threshold}'
+        stream_raster = Con(accumulation_raster, 1, '', stream_definition)
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
 
-    # If a mask raster is supplied, then extract the stream order
-    if len(kwargs['input_array']) == 3:
-        print('\tExtracting stream order to mask...')
+        # Calculate stream order
+        print('\tDefining stream order...')
         iteration_start = time.time()
-        # Define mask raster
-        mask_raster = kwargs['input_array'][2]
-        # Extract flow accumulation to mask raster
-        final_raster = ExtractByMask(stream_order, mask_raster)
+        stream_order = StreamOrder(stream_raster, direction_grid, 'STRAHLER')
         # End timing
         iteration_end = time.time()
         iteration_elapsed = int(iteration_end - iteration_start)
@@ -182,32 +214,56 @@ def generate_flowlines(**kwargs):
         print(
             f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
         print('\t----------')
-    # If no mask is specified, then use full raster
-    else:
-        final_raster = stream_order
+
+        # If a mask raster is supplied, then extract the stream order
+        if len(kwargs['input_array']) == 3:
+            print('\tExtracting stream order to mask...')
+            iteration_start = time.time()
+            # Define mask raster
+            mask_raster = kwargs['input_array'][2]
+            # Extract flow accumulation to mask raster
+            final_raster = ExtractByMask(stream_order, mask_raster)
+            # End timing
+            iteration_end = time.time()
+            iteration_elapsed = int(iteration_end - iteration_start)
+            iteration_success_time = datetime.datetime.now()
+            # Report success
+            print(
+                f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+            print('\t----------')
+        # If no mask is specified, then use full raster
+        else:
+            final_raster = stream_order
+
+        # Split stream order into rivers and streams
+        stream_raster = Con(final_raster, 1, '', 'VALUE <= 3')
+        river_raster = Con(final_raster, 1, '', 'VALUE > 3')
 
     # Convert stream order to flowline feature classes
     print('\tConverting raster stream order to flowline feature classes...')
     iteration_start = time.time()
-    # Convert streams
-    stream_raster = Con(final_raster, 1, '', 'VALUE <= 3')
-    arcpy.conversion.RasterToPolyline(stream_raster,
-                                      stream_feature,
-                                      'NODATA',
-                                      0,
-                                      'SIMPLIFY')
-    # Convert rivers
-    river_raster = Con(final_raster, 1, '', 'VALUE > 3')
-    arcpy.conversion.RasterToPolyline(river_raster,
-                                      river_feature,
-                                      'NODATA',
-                                      0,
-                                      'SIMPLIFY')
+    if trace_lines == 0:
+        # Convert streams
+        arcpy.conversion.RasterToPolyline(stream_raster,
+                                          stream_feature,
+                                          'NODATA',
+                                          0,
+                                          'SIMPLIFY')
+        # Convert rivers
+        arcpy.conversion.RasterToPolyline(river_raster,
+                                          river_feature,
+                                          'NODATA',
+                                          0,
+                                          'SIMPLIFY')
     # Delete intermediate datasets
     if arcpy.Exists(buffer_raster) == 1:
         arcpy.management.Delete(buffer_raster)
     if arcpy.Exists(area_buffer) == 1:
         arcpy.management.Delete(area_buffer)
+    if engine == 'numpy':
+        for intermediate_raster in [river_raster, stream_raster]:
+            if arcpy.Exists(intermediate_raster) == 1:
+                arcpy.management.Delete(intermediate_raster)
     # End timing
     iteration_end = time.time()
     iteration_elapsed = int(iteration_end - iteration_start)
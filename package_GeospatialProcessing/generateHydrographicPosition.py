@@ -2,8 +2,8 @@
 # ---------------------------------------------------------------------------
 # Generate hydrographic position
 # Author: Timm Nawrocki
-# Last Updated: 2022-03-14
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
+# Last Updated: 2026-10-17
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation. The numpy engine also requires numpy and rasterio and only uses arcpy to convert flowline feature classes to rasters.
 # Description: "Generate hydrographic position" is a function that calculates the vertical difference between flowline elevation and landscape elevation from a float elevation raster and a set of flowlines, which can be derived from a DEM, the NHD, or manual delineation (or some combination thereof).
 # ---------------------------------------------------------------------------
 
@@ -11,10 +11,13 @@
 def generate_hydrographic_position(**kwargs):
     """
     Description: calculates hydrographic position from a float elevation raster and a set of flowlines
-    Inputs: 'distance' -- a string of numerical distance and unit representing search distance from flowline
+    Inputs: 'distance' -- a string of numerical distance and unit representing search distance from flowline, or a list of distances in the order of the flowlines for the numpy engine, where None sets no limit
             'work_geodatabase' -- a geodatabase to store temporary results
-            'input_array' -- an array containing the area raster, the float elevation raster, and the flowlines (in that order)
-            'output_array' -- an array containing the hydrographic position raster
+            'input_array' -- an array containing the area raster, the float elevation raster, and the flowlines (in that order), where the numpy engine accepts multiple flowline feature classes or rasters
+            'output_array' -- an array containing the hydrographic position raster, or one raster per flowline input for the numpy engine
+            'engine' -- an optional string value of either 'arcpy' (default) to mask results with a vector buffer or 'numpy' to calculate all flowline inputs in one pass with the search distance taken from a distance transform
+            'method' -- an optional string value for the numpy engine of either 'nearest' (default) to use the elevation of the nearest flowline cell or 'hand' to use the height above the flowline cell reached along D8 flow paths
+            'direction_raster' -- a D8 flow direction raster, such as the one exported by the numpy engine of generate_flowlines, required if the method is 'hand'
     Returned Value: Returns a raster on disk
     Preconditions: requires input elevation and flowlines that can be created through other scripts in this repository
     """
@@ -30,6 +33,8 @@ def generate_hydrographic_position(**kwargs):
     import datetime
     import os
     import time
+    from package_Geomorphometry import calculate_hand_rasters
+    from package_Geomorphometry import calculate_hydrographic_rasters
 
     # Parse key word argument inputs
     distance = kwargs['distance']
@@ -38,6 +43,8 @@ def generate_hydrographic_position(**kwargs):
     elevation_raster = kwargs['input_array'][1]
     flowline_feature = kwargs['input_array'][2]
     hydrography_raster = kwargs['output_array'][0]
+    engine = kwargs.get('engine', 'arcpy')
+    method = kwargs.get('method', 'nearest')
 
     # Define intermediate dataset
     hydrography_folder = os.path.split(hydrography_raster)[0]
@@ -62,6 +69,52 @@ def generate_hydrographic_position(**kwargs):
     cell_size = arcpy.management.GetRasterProperties(elevation_raster, 'CELLSIZEX', '').getOutput(0)
     arcpy.env.cellSize = int(cell_size)
 
+    # Calculate hydrographic position for all flowlines in one pass if the numpy engine is selected
+    if engine == 'numpy':
+        print('\tCalculating hydrographic position from flowline rasters...')
+        iteration_start = time.time()
+        distance_list = distance if isinstance(distance, (list, tuple)) else [distance]
+        flowline_list = []
+        intermediate_list = []
+        for count, (flowline_input, search_distance, output_raster) in enumerate(zip(kwargs['input_array'][2:],
+                                                                                     distance_list,
+                                                                                     kwargs['output_array'])):
+            # Convert flowline feature classes to raster
+            if flowline_input.endswith('.tif') == 0:
+                print(f'\t\tConverting {os.path.split(flowline_input)[1]} to raster...')
+                flowline_raster = os.path.join(hydrography_folder, f'Flowlines_{count + 1}.tif')
+                arcpy.conversion.PolylineToRaster(flowline_input,
+                                                  'grid_code',
+                                                  flowline_raster,
+                                                  'MAXIMUM_LENGTH',
+                                                  '',
+                                                  cell_size,
+                                                  'BUILD')
+                intermediate_list.append(flowline_raster)
+            else:
+                flowline_raster = flowline_input
+            if search_distance is not None:
+                search_distance = float(str(search_distance).split()[0])
+            flowline_list.append((flowline_raster, search_distance, output_raster))
+        if method == 'hand':
+            calculate_hand_rasters(area_raster, elevation_raster, kwargs['direction_raster'], flowline_list)
+        else:
+            calculate_hydrographic_rasters(area_raster, elevation_raster, flowline_list)
+        # Delete intermediate datasets
+        for intermediate_raster in intermediate_list:
+            if arcpy.Exists(intermediate_raster) == 1:
+                arcpy.management.Delete(intermediate_raster)
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+        outprocess = 'Successfully calculated hydrographic position.'
+        return outprocess
+
     # Extract elevation to calculation area
     print('\tExtracting elevation raster...')
     iteration_start = time.time()
@@ -2,8 +2,8 @@
 # ---------------------------------------------------------------------------
 # Merge floodplains
 # Author: Timm Nawrocki
-# Last Updated: 2022-03-14
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
+# Last Updated: 2026-10-17
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation. The sweep mode requires numpy and rasterio and does not use arcpy.
 # Description: "Merge floodplains" is a function that calculates floodplains from a one or more flowline position rasters.
 # ---------------------------------------------------------------------------
 
@@ -11,28 +11,25 @@
 def merge_floodplains(**kwargs):
     """
     Description: generates floodplains from a float elevation raster and a set of flowlines
-    Inputs: 'thresholds' -- one threshold per flowline feature class included in the floodplain calculate, where each threshold is the upper bound of the floodplain
+    Inputs: 'thresholds' -- one threshold per flowline feature class included in the floodplain calculate, where each threshold is the upper bound of the floodplain, or one list of thresholds per flowline feature class for the sweep mode
             'area_limit' -- an integer value representing the maximum size of excluded polygon to convert to floodplain
-            'work_geodatabase' -- a geodatabase to store temporary results
+            'work_geodatabase' -- a geodatabase to store temporary results (not required for the sweep mode)
             'input_array' -- an array containing the area raster (must be first), the flowline feature classes (one per threshold), and the flowline position rasters (one per threshold)
-            'output_array' -- an array containing the floodplain position raster and smoothed feature class
-    Returned Value: Returns a raster on disk
+            'output_array' -- an array containing the floodplain position raster and smoothed feature class, or the bit-packed floodplain raster and a csv table of floodplain area for the sweep mode
+            'mode' -- an optional string value of either 'merge' (default) to create the final floodplain raster and feature class or 'sweep' to create preliminary floodplain masks for every combination of thresholds in one pass over the position rasters
+    Returned Value: Returns a raster on disk, and a csv table on disk for the sweep mode
     Preconditions: requires input flowlines and position rasters that can be created through other scripts in this repository
     """
 
     # Import packages
-    import arcpy
-    from arcpy.sa import CellStatistics
-    from arcpy.sa import Con
-    from arcpy.sa import Raster
     import datetime
     import os
     import time
 
     # Parse key word argument inputs
     thresholds = kwargs['thresholds']
-    area_limit = kwargs['area_limit']
-    work_geodatabase = kwargs['work_geodatabase']
+    area_limit = kwargs.get('area_limit')
+    work_geodatabase = kwargs.get('work_geodatabase')
     input_datasets = kwargs['input_array']
     area_raster = input_datasets.pop(0)
     floodplain_raster = kwargs['output_array'][0]
@@ -43,6 +40,37 @@ def merge_floodplains(**kwargs):
     upper_position = (number * 2) + 1
     flowlines = input_datasets[0:number]
     positions = input_datasets[number:upper_position]
+    mode = kwargs.get('mode', 'merge')
+
+    # Calculate floodplain masks for all threshold combinations in one pass if the sweep mode is selected
+    if mode == 'sweep':
+        import csv
+        from package_Geomorphometry import calculate_floodplain_sweep
+        print(f'\tCalculating floodplain masks for threshold combinations...')
+        iteration_start = time.time()
+        area_list = calculate_floodplain_sweep(area_raster, positions, thresholds, floodplain_raster)
+        # Export floodplain area for each combination
+        with open(floodplain_feature, 'w', newline='') as area_file:
+            area_writer = csv.writer(area_file)
+            area_writer.writerow(['bit'] + [f'threshold_{count + 1}' for count in range(number)] + ['area'])
+            for count, (combination, floodplain_area) in enumerate(area_list):
+                area_writer.writerow([count] + list(combination) + [floodplain_area])
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+        outprocess = 'Successfully calculated floodplain threshold sweep.'
+        return outprocess
+
+    # Import arcpy packages
+    import arcpy
+    from arcpy.sa import CellStatistics
+    from arcpy.sa import Con
+    from arcpy.sa import Raster
 
     # Define intermediate dataset
     hydrography_folder = os.path.split(floodplain_raster)[0]
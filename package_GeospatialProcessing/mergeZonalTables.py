@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Merge zonal tables
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution.
+# Description: "Merge zonal tables" is a function that merges the columns of zonal summary tables calculated for batches of input rasters of the same segments into a single table of segments by inputs.
+# ---------------------------------------------------------------------------
+
+# Define a function to merge the columns of zonal tables
+def merge_zonal_tables(part_tables, column_list, output_table):
+    """
+    Description: merges selected columns of zonal tables with the same segment rows into one table
+    Inputs: 'part_tables' -- a list of csv tables from calculate_zonal_statistics with the same segment_id, POINT_X, and POINT_Y rows in the same order
+            'column_list' -- a list of column names in output order, where each column is taken from the first part table that contains it
+            'output_table' -- a csv table to write with the segment_id, POINT_X, and POINT_Y fields followed by the listed columns
+    Returned Value: Returns a csv table on disk
+    Preconditions: part tables are read one row at a time, so memory does not depend on the number of segments; the output is written through a temporary file and replaced in a single operation
+    """
+
+    # Import packages
+    import csv
+    import os
+    from itertools import zip_longest
+
+    # Open part tables and find the source of each column
+    part_streams = [open(part_table, 'r', newline='') for part_table in part_tables]
+    try:
+        part_readers = [csv.reader(part_stream) for part_stream in part_streams]
+        part_headers = [next(part_reader) for part_reader in part_readers]
+        column_sources = []
+        for column in column_list:
+            for part_number, part_header in enumerate(part_headers):
+                if column in part_header:
+                    column_sources.append((part_number, part_header.index(column)))
+                    break
+            else:
+                raise ValueError(f'Column {column} is not in any part table.')
+
+        # Write the segment fields and the selected columns of each row
+        temporary_table = output_table + '.temporary'
+        with open(temporary_table, 'w', newline='') as table_stream:
+            table_writer = csv.writer(table_stream)
+            table_writer.writerow(['segment_id', 'POINT_X', 'POINT_Y'] + list(column_list))
+            for part_rows in zip_longest(*part_readers):
+                if (any(part_row is None for part_row in part_rows)
+                        or any(part_row[0] != part_rows[0][0] for part_row in part_rows)):
+                    raise ValueError(f'Part tables of {output_table} do not contain the same segments.')
+                table_writer.writerow(part_rows[0][0:3]
+                                      + [part_rows[part_number][column_index]
+                                         for part_number, column_index in column_sources])
+    finally:
+        for part_stream in part_streams:
+            part_stream.close()
+    os.replace(temporary_table, output_table)
+
+    # Return success message
+    outprocess = f'\tSuccessfully merged {len(column_list)} columns from {len(part_tables)} tables.'
+    return outprocess
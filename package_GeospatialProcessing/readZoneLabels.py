@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Read zone labels
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy and rasterio.
+# Description: "Read zone labels" is a function that reads a zone raster, such as a gridded segment raster, once and converts the zone values to consecutive labels so that statistics of any number of rasters can be accumulated per zone with np.bincount.
+# ---------------------------------------------------------------------------
+
+# Define a function to read a zone raster as consecutive labels
+def read_zone_labels(zone_raster, index_folder=None, zone_hash=None):
+    """
+    Description: reads the values of a zone raster and labels each cell with the index of its zone value
+    Inputs: 'zone_raster' -- a single band integer raster of zones, such as segments with the segment id as the value
+            'index_folder' -- an optional folder of cached zone indexes from build_zone_index, which replaces sorting the zone values with expanding the cached index
+            'zone_hash' -- an optional content hash of the zone raster from summarize_zone_index, which avoids reading the zone raster to check the cached index
+    Returned Value: Returns a tuple of a sorted array of the zone values and an int32 array of labels with the shape of the zone raster, where cells with no data have the label equal to the number of zones
+    Preconditions: the whole zone raster is read into memory once, so the label array requires four bytes per cell
+    """
+
+    # Import packages
+    import numpy as np
+    import rasterio
+    from package_GeospatialProcessing.buildZoneIndex import build_zone_index
+
+    # Expand labels from the cached zone index
+    if index_folder is not None:
+        zone_values, offsets, cell_indices = build_zone_index(zone_raster, index_folder, zone_hash)
+        with rasterio.open(zone_raster) as zone_dataset:
+            zone_shape = zone_dataset.shape
+        zone_count = zone_values.shape[0]
+        label_array = np.full(zone_shape[0] * zone_shape[1], zone_count, dtype=np.int32)
+        label_array[cell_indices] = np.repeat(np.arange(zone_count, dtype=np.int32), np.diff(offsets))
+        return np.asarray(zone_values), label_array.reshape(zone_shape)
+
+    # Read zone raster
+    with rasterio.open(zone_raster) as zone_dataset:
+        zone_array = zone_dataset.read(1, masked=True)
+    valid_array = ~np.ma.getmaskarray(zone_array)
+
+    # Convert zone values to consecutive labels
+    zone_values, zone_labels = np.unique(zone_array.data[valid_array], return_inverse=True)
+    if zone_values.shape[0] >= 2 ** 31 - 1:
+        raise ValueError(f'{zone_raster} contains more zones than can be labeled with int32 values.')
+    label_array = np.full(zone_array.shape, zone_values.shape[0], dtype=np.int32)
+    label_array[valid_array] = zone_labels
+
+    return zone_values, label_array
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Summarize zone index
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution with numpy and rasterio.
+# Description: "Summarize zone index" is a function that builds or loads the cached zone index of a zone raster and returns only the content hash and size of the zone raster so that indexes can be built in worker processes and used to plan later tasks.
+# ---------------------------------------------------------------------------
+
+# Define a function to build or load a zone index and summarize its size
+def summarize_zone_index(zone_raster, index_folder):
+    """
+    Description: builds or loads the zone index of a zone raster and summarizes the zone raster
+    Inputs: 'zone_raster' -- a single band integer raster of zones, such as segments with the segment id as the value
+            'index_folder' -- a folder of cached zone indexes from build_zone_index
+    Returned Value: Returns a tuple of the content hash of the zone raster, the number of zones, and the number of cells in the zone raster
+    Preconditions: the index arrays are not returned, so the summary can be sent from a worker process without copying the index
+    """
+
+    # Import packages
+    import hashlib
+    import json
+    import os
+    import rasterio
+    from package_GeospatialProcessing.buildZoneIndex import build_zone_index
+
+    # Build or load the zone index
+    zone_values = build_zone_index(zone_raster, index_folder)[0]
+
+    # Read the content hash of the zone raster from the index manifest
+    path_hash = hashlib.sha256(os.path.abspath(zone_raster).encode('utf-8')).hexdigest()
+    zone_folder = os.path.join(index_folder,
+                               f'{os.path.splitext(os.path.split(zone_raster)[1])[0]}_{path_hash[0:12]}')
+    with open(os.path.join(zone_folder, 'Zone_Index.json'), 'r') as manifest_stream:
+        zone_hash = json.load(manifest_stream)['zone_index']['signature']
+
+    # Count the cells of the zone raster
+    with rasterio.open(zone_raster) as zone_dataset:
+        cell_count = zone_dataset.height * zone_dataset.width
+
+    return zone_hash, int(zone_values.shape[0]), cell_count
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Update build manifest
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.7+ distribution.
+# Description: "Update build manifest" is a function that records the signature, input hashes, and parameters of finished outputs in a JSON manifest so that a later run can recompute only outputs whose inputs or parameters have changed.
+# ---------------------------------------------------------------------------
+
+# Define a function to update entries in a build manifest
+def update_build_manifest(manifest_file, entry_dictionary):
+    """
+    Description: adds or replaces output entries in a JSON build manifest through a temporary file
+    Inputs: 'manifest_file' -- a JSON file path for the manifest, which is created if it does not exist
+            'entry_dictionary' -- a dictionary with output names as keys and dictionaries of JSON-serializable values, including a 'signature', as values
+    Returned Value: Returns the updated manifest dictionary and writes the manifest to disk
+    Preconditions: the manifest is replaced in a single operation so that an interrupted run never leaves a partial manifest; entries must only be added after their outputs are completely written
+    """
+
+    # Import packages
+    import json
+    import os
+
+    # Read existing manifest
+    manifest_dictionary = dict()
+    if os.path.exists(manifest_file):
+        with open(manifest_file, 'r') as manifest_stream:
+            manifest_dictionary = json.load(manifest_stream)
+
+    # Update entries and replace manifest
+    manifest_dictionary.update(entry_dictionary)
+    temporary_file = f'{manifest_file}.{os.getpid()}.temporary'
+    with open(temporary_file, 'w') as manifest_stream:
+        json.dump(manifest_dictionary, manifest_stream, indent=2, sort_keys=True, default=str)
+    os.replace(temporary_file, manifest_file)
+
+    return manifest_dictionary